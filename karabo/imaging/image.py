@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import (
     Any,
@@ -18,16 +19,12 @@ from typing import (
 )
 
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 from astropy.io import fits
 from astropy.io.fits.header import Header
 from astropy.nddata import Cutout2D, NDData
 from astropy.wcs import WCS
 from numpy.typing import NDArray
-from rascil.apps.imaging_qa.imaging_qa_diagnostics import power_spectrum
-from reproject import reproject_interp
-from reproject.mosaicking import find_optimal_celestial_wcs, reproject_and_coadd
 from scipy.interpolate import RegularGridInterpolator
 
 from karabo.simulation.sky_model import SkyModel
@@ -35,12 +32,6 @@ from karabo.util._types import BeamType, FilePathType
 from karabo.util.file_handler import FileHandler, assert_valid_ending
 from karabo.util.plotting_util import get_slices
 
-# store and restore the previously set matplotlib backend,
-# because rascil sets it to Agg (non-GUI)
-previous_backend = matplotlib.get_backend()
-
-matplotlib.use(previous_backend)
-
 
 class Image:
     @overload
@@ -74,10 +65,17 @@ class Image:
         **kwargs: Any,
     ) -> None:
         self.header: Header
+        # `_path` is None as long as an in-memory image hasn't been written to disk
+        self._path: Optional[str] = None
+        self._path_is_tmp = False
         if path is not None and (data is None and header is None):
-            self.path = path
+            self._path = str(path)
+            # the memory-mapped file may be located in a disk-cache sub-dir
+            FileHandler.pin(path=self._path, obj=self)
+            # memory-mapped: just the accessed sections of the file are read
+            kwargs.setdefault("memmap", True)
             self.data, self.header = fits.getdata(
-                str(self.path),
+                self._path,
                 ext=0,
                 header=True,
                 **kwargs,
@@ -85,18 +83,6 @@ class Image:
         elif path is None and (data is not None and header is not None):
             self.data = data
             self.header = header
-
-            tmp_dir = FileHandler().get_tmp_dir(
-                prefix="Image-",
-                purpose="restored fits-path",
-                unique=self,
-            )
-
-            restored_fits_path = os.path.join(tmp_dir, "image.fits")
-
-            # Write the FITS file
-            self.write_to_file(restored_fits_path)
-            self.path = restored_fits_path
         else:
             raise RuntimeError("Provide either `path` or both `data` and `header`.")
 
@@ -107,13 +93,14 @@ class Image:
             (frequencies, polarisations, pixels_x, pixels_y)"""
             )
 
+        # insert the missing axes as views to not read memory-mapped data
         if self.data.ndim == 2:
             warnings.warn(
                 """Received 2D data for image object.
                 Will assume the 2 axes correspond to (pixels_x, pixels_y).
                 Inserting 2 additional axes for frequencies and polarisations."""
             )
-            self.data = np.array([[self.data]])
+            self.data = self.data[np.newaxis, np.newaxis, :, :]
         elif self.data.ndim == 3:
             warnings.warn(
                 """Received 3D data for image object.
@@ -121,14 +108,42 @@ class Image:
                 (polarisations, pixels_x, pixels_y).
                 Inserting 1 additional axis for frequencies."""
             )
-            self.data = np.array([self.data])
+            self.data = self.data[np.newaxis, :, :, :]
 
-        self._fname = os.path.split(self.path)[-1]
+        self._fname = (
+            os.path.split(self._path)[-1] if self._path is not None else "image.fits"
+        )
 
     @staticmethod
     def read_from_file(path: FilePathType) -> Image:
         return Image(path=path)
 
+    @property
+    def path(self) -> str:
+        """Path of the .fits file of this `Image`.
+
+        In-memory images are written to a tmp-dir on first access, so that
+        the FITS-file is only created if an external tool really needs it.
+        """
+        if self._path is None:
+            tmp_dir = FileHandler().get_tmp_dir(
+                prefix="Image-",
+                purpose="restored fits-path",
+                unique=self,
+            )
+            restored_fits_path = os.path.join(tmp_dir, "image.fits")
+            # the same file is rewritten if `data` has changed in the meantime
+            self.write_to_file(restored_fits_path, overwrite=True)
+            self._path = restored_fits_path
+            self._path_is_tmp = True
+        return self._path
+
+    @path.setter
+    def path(self, new_path: FilePathType) -> None:
+        self._path = str(new_path)
+        self._path_is_tmp = False
+        FileHandler.pin(path=self._path, obj=self)
+
     @property
     def data(self) -> NDArray[np.float_]:
         return self._data
@@ -138,6 +153,10 @@ class Image:
         self._data = new_data
         if hasattr(self, "header"):
             self._update_header_after_resize()
+        if self._path_is_tmp:
+            # the restored .fits-file is outdated, rewrite it on next access
+            self._path = None
+            self._path_is_tmp = False
 
     def write_to_file(
         self,
@@ -399,6 +418,7 @@ class Image:
         :param kwargs: matplotlib kwargs for scatter & Collections,
         e.g. customize `s`, `vmin` or `vmax`
         """
+        import matplotlib.pyplot as plt
 
         if wcs_enabled:
             wcs = WCS(self.header)
@@ -471,6 +491,8 @@ class Image:
             Defaults to 0 (stokesI).
         :param vmin_image, vmax_image: Limits for colorbar of Image plot.
         """
+        import matplotlib.pyplot as plt
+
         # wcs.wcs_world2pix expects a FITS header with only 2 coordinates (x, y).
         # For this plot, we temporarily remove the 3rd and 4th axes from the image
         # Per suggestion from:
@@ -537,6 +559,8 @@ class Image:
         :param vmin_sky, vmax_sky: Limits for colorbar of SkyModel scatter plot.
         :param vmin_image, vmax_image: Limits for colorbar of Image plot.
         """
+        import matplotlib.pyplot as plt
+
         wcs = WCS(self.header)
         slices = get_slices(wcs)
 
@@ -625,7 +649,7 @@ class Image:
             bpa = float(self.header["BPA"])
         except Exception as e:
             raise RuntimeError(
-                f"No beam-parameters 'BMAJ', 'BMIN', 'BPA' found in {self.path}. "
+                f"No beam-parameters 'BMAJ', 'BMIN', 'BPA' found in {self._fname}. "
                 + "Use `has_beam_parameters` for save use of this function."
             ) from e
         beam: BeamType = {
@@ -686,6 +710,13 @@ class Image:
             profile: Brightness temperature for each angular scale in Kelvin
             theta_axis: Angular scale data in degrees
         """
+        # store and restore the previously set matplotlib backend,
+        # because rascil sets it to Agg (non-GUI)
+        previous_backend = matplotlib.get_backend()
+        from rascil.apps.imaging_qa.imaging_qa_diagnostics import power_spectrum
+
+        matplotlib.use(previous_backend)
+
         profile, theta = power_spectrum(self.path, resolution, signal_channel)
         return profile, theta
 
@@ -705,6 +736,8 @@ class Image:
         :param save_png: True if result should be saved, default = False
         :param block: Whether plotting should block the remaining of the script
         """
+        import matplotlib.pyplot as plt
+
         profile, theta = self.get_power_spectrum(resolution, signal_channel)
         plt.clf()
 
@@ -759,7 +792,7 @@ class ImageMosaicker:
     However, here the most common to tune are explained.
     ----------
     reproject_function : callable, optional
-        The function to use for the reprojection.
+        The function to use for the reprojection. Defaults to `reproject_interp`.
     combine_function : {'mean', 'sum'}
         The type of function to use for combining the values into the final image.
     match_background : bool, optional
@@ -768,6 +801,13 @@ class ImageMosaicker:
         If None, the background matching will make it so that the average of the
         corrections for all images is zero.
         If an integer, this specifies the index of the image to use as a reference.
+    tile_shape : tuple, optional
+        If set, the output is mosaicked in tiles of (pixels_y, pixels_x), which are
+        reprojected and co-added in parallel into a memory-mapped output array.
+        Each tile just reads the input images overlapping it.
+    n_workers : int, optional
+        Number of threads to process the tiles with. Defaults to the number of
+        cpus of the machine.
 
     Methods
     -------
@@ -783,15 +823,23 @@ class ImageMosaicker:
 
     def __init__(
         self,
-        reproject_function: Callable[..., Any] = reproject_interp,
+        reproject_function: Optional[Callable[..., Any]] = None,
         combine_function: str = "mean",
         match_background: bool = False,
         background_reference: Optional[int] = None,
+        tile_shape: Optional[Tuple[int, int]] = None,
+        n_workers: Optional[int] = None,
     ):
+        if reproject_function is None:
+            from reproject import reproject_interp
+
+            reproject_function = reproject_interp
         self.reproject_function = reproject_function
         self.combine_function = combine_function
         self.match_background = match_background
         self.background_reference = background_reference
+        self.tile_shape = tile_shape
+        self.n_workers = n_workers
 
     def get_optimal_wcs(
         self,
@@ -820,6 +868,8 @@ class ImageMosaicker:
             The shape of the optimal WCS.
 
         """
+        from reproject.mosaicking import find_optimal_celestial_wcs
+
         optimal_wcs = find_optimal_celestial_wcs(
             [image.to_2dNNData() for image in images]
             if isinstance(images[0], Image)
@@ -883,6 +933,7 @@ class ImageMosaicker:
             If less than two images are provided.
 
         """
+        from reproject.mosaicking import reproject_and_coadd
 
         if image_for_header is None:
             image_for_header = images[0]
@@ -891,26 +942,172 @@ class ImageMosaicker:
             images = [image.to_2dNNData() for image in images]
         if wcs is None:
             wcs = self.get_optimal_wcs(images)
-
-        array, footprint = reproject_and_coadd(
-            images,
-            output_projection=wcs[0],
-            shape_out=wcs[1] if shape_out is None else shape_out,
-            input_weights=input_weights,
-            hdu_in=hdu_in,
-            reproject_function=reproject_interp,
-            hdu_weights=hdu_weights,
-            combine_function=self.combine_function,
-            match_background=self.match_background,
-            background_reference=self.background_reference,
-            **kwargs,
-        )
+        shape = wcs[1] if shape_out is None else shape_out
+
+        if self.tile_shape is None:
+            array, footprint = reproject_and_coadd(
+                images,
+                output_projection=wcs[0],
+                shape_out=shape,
+                input_weights=input_weights,
+                hdu_in=hdu_in,
+                reproject_function=self.reproject_function,
+                hdu_weights=hdu_weights,
+                combine_function=self.combine_function,
+                match_background=self.match_background,
+                background_reference=self.background_reference,
+                **kwargs,
+            )
+        else:
+            array, footprint = self._mosaic_tiled(
+                images=images,
+                wcs_out=wcs[0],
+                shape_out=cast(Tuple[int, int], shape),
+                input_weights=input_weights,
+                hdu_in=hdu_in,
+                hdu_weights=hdu_weights,
+                **kwargs,
+            )
         header = wcs[0].to_header()
         header = Image.update_header_from_image_header(header, image_for_header.header)
         return (
             Image(
                 data=array[np.newaxis, np.newaxis, :, :],
-                header=wcs[0].to_header(),
+                header=header,
             ),
             footprint,
         )
+
+    def _mosaic_tiled(
+        self,
+        images: List[Any],
+        wcs_out: WCS,
+        shape_out: Tuple[int, int],
+        input_weights: Optional[List[Any]],
+        hdu_in: Optional[Union[int, str]],
+        hdu_weights: Optional[Union[int, str]],
+        **kwargs: Any,
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Reprojects and co-adds `images` tile by tile into memory-mapped arrays.
+
+        Background matching needs all images at once and is therefore not
+        supported in tiled mode.
+        """
+        from reproject.mosaicking import reproject_and_coadd
+
+        if self.match_background:
+            raise ValueError(
+                "`match_background` is not supported for tiled mosaicking."
+            )
+        assert self.tile_shape is not None
+        tmp_dir = FileHandler().get_tmp_dir(
+            prefix="mosaic-",
+            purpose="tiled mosaic output",
+        )
+        array = np.memmap(
+            os.path.join(tmp_dir, "mosaic.dat"),
+            dtype=np.float64,
+            mode="w+",
+            shape=shape_out,
+        )
+        footprint = np.memmap(
+            os.path.join(tmp_dir, "footprint.dat"),
+            dtype=np.float64,
+            mode="w+",
+            shape=shape_out,
+        )
+        # the memory-mapped outputs are returned, so they hold their files
+        FileHandler.pin(path=tmp_dir, obj=array)
+        FileHandler.pin(path=tmp_dir, obj=footprint)
+        bboxes = [ImageMosaicker._get_input_bbox(image, wcs_out) for image in images]
+        fill_value = 0.0 if self.combine_function == "sum" else np.nan
+
+        def process_tile(y0: int, y1: int, x0: int, x1: int) -> None:
+            idxs = [
+                i
+                for i, bbox in enumerate(bboxes)
+                if bbox is None
+                or (
+                    bbox[0] <= x1 - 0.5
+                    and bbox[1] >= x0 - 0.5
+                    and bbox[2] <= y1 - 0.5
+                    and bbox[3] >= y0 - 0.5
+                )
+            ]
+            if len(idxs) == 0:
+                array[y0:y1, x0:x1] = fill_value
+                footprint[y0:y1, x0:x1] = 0.0
+                return
+            tile_array, tile_footprint = reproject_and_coadd(
+                [images[i] for i in idxs],
+                output_projection=wcs_out[y0:y1, x0:x1],
+                shape_out=(y1 - y0, x1 - x0),
+                input_weights=None
+                if input_weights is None
+                else [input_weights[i] for i in idxs],
+                hdu_in=hdu_in,
+                reproject_function=self.reproject_function,
+                hdu_weights=hdu_weights,
+                combine_function=self.combine_function,
+                match_background=False,
+                **kwargs,
+            )
+            array[y0:y1, x0:x1] = tile_array
+            footprint[y0:y1, x0:x1] = tile_footprint
+
+        n_y, n_x = shape_out
+        tile_y, tile_x = self.tile_shape
+        tiles = [
+            (y0, min(y0 + tile_y, n_y), x0, min(x0 + tile_x, n_x))
+            for y0 in range(0, n_y, tile_y)
+            for x0 in range(0, n_x, tile_x)
+        ]
+        # tiles write into disjoint sections of the output, so threads are safe
+        with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+            for future in [executor.submit(process_tile, *tile) for tile in tiles]:
+                future.result()
+        array.flush()
+        footprint.flush()
+        return array, footprint
+
+    @staticmethod
+    def _get_input_bbox(
+        image: Any,
+        wcs_out: WCS,
+        n_samples: int = 16,
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """Bounding box (x_min, x_max, y_min, y_max) of `image` in output pixels.
+
+        Samples the border of the input image, which is sufficient for
+        the smooth celestial projections used here. Returns None if the
+        overlap can't be determined, i.e. the image is assumed to overlap
+        every tile.
+        """
+        if isinstance(image, NDData) and image.wcs is not None:
+            shape, wcs_in = image.data.shape, image.wcs
+        elif isinstance(image, tuple) and len(image) == 2:
+            shape, wcs_in = np.shape(image[0]), image[1]
+        else:
+            return None
+        if not isinstance(wcs_in, WCS) or len(shape) != 2:
+            return None
+        n_y, n_x = shape
+        xs = np.linspace(-0.5, n_x - 0.5, n_samples)
+        ys = np.linspace(-0.5, n_y - 0.5, n_samples)
+        border_x = np.concatenate(
+            [xs, xs, np.full(n_samples, -0.5), np.full(n_samples, n_x - 0.5)]
+        )
+        border_y = np.concatenate(
+            [np.full(n_samples, -0.5), np.full(n_samples, n_y - 0.5), ys, ys]
+        )
+        world = wcs_in.celestial.pixel_to_world_values(border_x, border_y)
+        out_x, out_y = wcs_out.celestial.world_to_pixel_values(*world)
+        if not (np.all(np.isfinite(out_x)) and np.all(np.isfinite(out_y))):
+            return None
+        # one pixel margin for the interpolation kernel
+        return (
+            float(np.min(out_x)) - 1.0,
+            float(np.max(out_x)) + 1.0,
+            float(np.min(out_y)) - 1.0,
+            float(np.max(out_y)) + 1.0,
+        )
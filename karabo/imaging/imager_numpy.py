@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import scipy.fft
+from astropy.constants import c as LIGHT_SPEED
+from astropy.io.fits.header import Header
+from astropy.wcs import WCS
+from numpy.typing import NDArray
+from ska_sdp_datamodels.visibility import Visibility as RASCILVisibility
+from typing_extensions import override
+
+from karabo.imaging.image import Image
+from karabo.imaging.imager_base import DirtyImager, DirtyImagerConfig
+from karabo.simulation.visibility import Visibility
+from karabo.util._types import FilePathType
+from karabo.util.import_util import lazy_import
+
+if TYPE_CHECKING:
+    import oskar
+else:
+    oskar = lazy_import("oskar")
+
+# uvw [m] (n, 3), stokes I visibilities (n, channels), frequencies [Hz] (channels,)
+_VisChunkType = Tuple[NDArray[np.float64], NDArray[np.complex128], NDArray[np.float64]]
+
+
+# TODO Set kw_only=True after update to Python 3.10
+# Right now, if one inherited superclass has a default-argument, you have to set
+# defaults for all your attributes as well.
+@dataclass
+class NumpyDirtyImagerConfig(DirtyImagerConfig):
+    """Config / parameters of a NumpyDirtyImager.
+
+    Adds parameters specific to NumpyDirtyImager.
+
+    Attributes:
+        imaging_npixel (int): see DirtyImagerConfig
+        imaging_cellsize (float): see DirtyImagerConfig
+        combine_across_frequencies (bool): see DirtyImagerConfig
+        kernel_support (int): Full width of the Kaiser-Bessel gridding kernel
+            in grid-cells. Defaults to 7.
+        rows_per_chunk (int): Number of visibility rows which are gridded at once.
+            Bounds the memory needed for large visibility sets. Defaults to 100000.
+        fft_workers (int): Number of threads of the FFT, see `scipy.fft.ifft2`.
+            Defaults to -1, which uses all cpus.
+    """
+
+    kernel_support: int = 7
+    rows_per_chunk: int = 100_000
+    fft_workers: int = -1
+
+
+class NumpyDirtyImager(DirtyImager):
+    """In-process dirty imager based on NumPy gridding and SciPy's FFT.
+
+    Reads the visibilities directly from the OSKAR .vis file (or the MS if
+    there's no .vis file), grids stokes I with a Kaiser-Bessel kernel using
+    natural weighting and transforms the grid with a multithreaded FFT.
+    The w-term is neglected, as with RASCIL's "2d" context. In contrast to the
+    other imagers there is no subprocess and no intermediate file involved,
+    which makes it suitable for imaging many small visibility sets.
+
+    Attributes:
+        config (NumpyDirtyImagerConfig): Config containing parameters for
+            the dirty imaging.
+    """
+
+    def __init__(self, config: DirtyImagerConfig) -> None:
+        """Initializes the instance with a config.
+
+        Args:
+            config (DirtyImagerConfig): see config attribute. A plain
+                DirtyImagerConfig is upgraded to a NumpyDirtyImagerConfig with
+                the defaults of the NumPy specific parameters.
+        """
+        super().__init__()
+        if not isinstance(config, NumpyDirtyImagerConfig):
+            config = NumpyDirtyImagerConfig(
+                imaging_npixel=config.imaging_npixel,
+                imaging_cellsize=config.imaging_cellsize,
+                combine_across_frequencies=config.combine_across_frequencies,
+            )
+        self.config: NumpyDirtyImagerConfig = config
+
+    @override
+    def create_dirty_image(
+        self,
+        visibility: Union[Visibility, RASCILVisibility],
+        output_fits_path: Optional[FilePathType] = None,
+    ) -> Image:
+        if isinstance(visibility, RASCILVisibility):
+            raise NotImplementedError(
+                """NumPy Imager applied to
+                RASCIL Visibilities is currently not supported.
+                For RASCIL Visibilities please use the RASCIL Imager."""
+            )
+
+        if Path(visibility.vis_path).exists():
+            chunks = self._iter_vis_file_chunks(visibility.vis_path)
+            header = oskar.VisHeader.read(str(visibility.vis_path))[0]
+            phase_centre_deg = (header.phase_centre_ra_deg, header.phase_centre_dec_deg)
+        else:
+            chunks = self._iter_ms_chunks(visibility.ms_file_path)
+            ms = oskar.MeasurementSet.open(str(visibility.ms_file_path), readonly=True)
+            phase_centre_deg = (
+                np.degrees(ms.phase_centre_ra_rad),
+                np.degrees(ms.phase_centre_dec_rad),
+            )
+
+        npixel = self.config.imaging_npixel
+        grids: Optional[NDArray[np.complex128]] = None
+        n_vis: Optional[NDArray[np.int64]] = None
+        freqs_hz: Optional[NDArray[np.float64]] = None
+        for uvw, vis, freqs_hz in chunks:
+            if grids is None:
+                grids = np.zeros((len(freqs_hz), npixel, npixel), dtype=np.complex128)
+                n_vis = np.zeros(len(freqs_hz), dtype=np.int64)
+            assert n_vis is not None
+            for i_chan, freq_hz in enumerate(freqs_hz):
+                n_vis[i_chan] += self._grid(
+                    grid=grids[i_chan],
+                    uv_lambda=uvw[:, :2] * freq_hz / LIGHT_SPEED.value,
+                    vis=vis[:, i_chan],
+                )
+        if grids is None or freqs_hz is None or n_vis is None:
+            raise RuntimeError(f"{visibility} doesn't contain any visibilities.")
+
+        # natural weighting, normalised per channel like RASCIL's `invert_visibility`
+        grids /= np.maximum(n_vis, 1)[:, np.newaxis, np.newaxis]
+        if self.config.combine_across_frequencies:
+            grids = np.sum(grids, axis=0, keepdims=True)
+        data = self._grid_to_image(grids)
+
+        image = Image(
+            data=data[:, np.newaxis, :, :],
+            header=self._create_header(
+                phase_centre_deg=phase_centre_deg,
+                freqs_hz=freqs_hz,
+                n_freqs=data.shape[0],
+            ),
+        )
+        if output_fits_path is not None:
+            image.write_to_file(output_fits_path, overwrite=True)
+            image.path = output_fits_path
+        return image
+
+    def _iter_vis_file_chunks(self, vis_path: FilePathType) -> Iterator[_VisChunkType]:
+        """Yields the cross-correlations of an OSKAR .vis file block by block."""
+        for header, block in Visibility._iter_vis_blocks(vis_path):
+            freqs_hz = header.freq_start_hz + header.freq_inc_hz * np.arange(
+                header.num_channels_total
+            )
+            uvw = np.stack(
+                (
+                    block.baseline_uu_metres(),
+                    block.baseline_vv_metres(),
+                    block.baseline_ww_metres(),
+                ),
+                axis=-1,
+            ).reshape(-1, 3)
+            # (times, channels, baselines, pols) -> (times * baselines, channels)
+            vis = self._to_stokes_i(
+                np.moveaxis(block.cross_correlations(), 1, 2).reshape(
+                    uvw.shape[0], header.num_channels_total, -1
+                )
+            )
+            yield uvw, vis, freqs_hz
+
+    def _iter_ms_chunks(self, ms_path: FilePathType) -> Iterator[_VisChunkType]:
+        """Yields the visibilities of a measurement set in chunks of rows."""
+        ms = oskar.MeasurementSet.open(str(ms_path), readonly=True)
+        freqs_hz = ms.freq_start_hz + ms.freq_inc_hz * np.arange(ms.num_channels)
+        for start_row in range(0, ms.num_rows, self.config.rows_per_chunk):
+            num_rows = min(self.config.rows_per_chunk, ms.num_rows - start_row)
+            uvw = np.asarray(ms.read_column("UVW", start_row, num_rows))
+            # (rows, channels, pols)
+            vis = self._to_stokes_i(
+                np.asarray(ms.read_column("DATA", start_row, num_rows))
+            )
+            # drop auto-correlations
+            is_cross = np.any(uvw != 0.0, axis=1)
+            yield uvw[is_cross], vis[is_cross], freqs_hz
+
+    @staticmethod
+    def _to_stokes_i(vis: NDArray[np.complex128]) -> NDArray[np.complex128]:
+        """Converts (..., pols) visibilities of linear feeds to stokes I."""
+        if vis.shape[-1] == 1:
+            return vis[..., 0]
+        if vis.shape[-1] == 4:  # XX, XY, YX, YY
+            return 0.5 * (vis[..., 0] + vis[..., 3])
+        raise NotImplementedError(
+            f"Visibilities with {vis.shape[-1]} polarisations are not supported."
+        )
+
+    def _grid(
+        self,
+        grid: NDArray[np.complex128],
+        uv_lambda: NDArray[np.float64],
+        vis: NDArray[np.complex128],
+    ) -> int:
+        """Convolves `vis` onto `grid` in place.
+
+        Args:
+            grid: uv-grid of the channel, indexed as (v, -u).
+            uv_lambda: uv-coordinates in wavelengths, shape (n, 2).
+            vis: Visibilities, shape (n,).
+
+        Returns:
+            Number of gridded visibilities.
+        """
+        npixel = grid.shape[0]
+        support = self.config.kernel_support
+        centre = npixel // 2
+        # one uv-cell is 1 / field of view; u is flipped because RA increases
+        # to the left in the image (negative CDELT1)
+        x = centre - uv_lambda[:, 0] * npixel * self.config.imaging_cellsize
+        y = centre + uv_lambda[:, 1] * npixel * self.config.imaging_cellsize
+        half = support / 2
+        in_grid = (
+            (x - half >= 0)
+            & (x + half <= npixel - 1)
+            & (y - half >= 0)
+            & (y + half <= npixel - 1)
+        )
+        x, y, vis = x[in_grid], y[in_grid], vis[in_grid]
+
+        # integer offsets of the kernel footprint around each visibility
+        offsets = np.arange(support) - (support - 1) // 2
+        x_idxs = np.round(x).astype(np.int64)[:, np.newaxis] + offsets
+        y_idxs = np.round(y).astype(np.int64)[:, np.newaxis] + offsets
+        x_weights = self._kernel(x_idxs - x[:, np.newaxis])
+        y_weights = self._kernel(y_idxs - y[:, np.newaxis])
+
+        # (n, support, support) contributions summed into the flattened grid
+        idxs = (y_idxs[:, :, np.newaxis] * npixel + x_idxs[:, np.newaxis, :]).ravel()
+        weights = (
+            y_weights[:, :, np.newaxis]
+            * x_weights[:, np.newaxis, :]
+            * vis[:, np.newaxis, np.newaxis]
+        ).ravel()
+        flat_grid = grid.reshape(-1)
+        flat_grid += np.bincount(idxs, weights=weights.real, minlength=grid.size)
+        flat_grid += 1j * np.bincount(idxs, weights=weights.imag, minlength=grid.size)
+        return len(vis)
+
+    @property
+    def _kernel_beta(self) -> float:
+        """Kaiser-Bessel shape parameter for a grid without oversampling.
+
+        See Beatty et al. (2005), "Rapid gridding reconstruction with a minimal
+        oversampling ratio", eq. 5 with an oversampling ratio of 2.
+        """
+        support = self.config.kernel_support
+        return float(np.pi * np.sqrt((support / 2 * 1.5) ** 2 - 0.8))
+
+    def _kernel(self, dx: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Kaiser-Bessel kernel at offsets `dx` [grid-cells]."""
+        support = self.config.kernel_support
+        arg = np.clip(1.0 - (2.0 * dx / support) ** 2, 0.0, None)
+        kernel: NDArray[np.float64] = np.where(
+            np.abs(dx) <= support / 2,
+            np.i0(self._kernel_beta * np.sqrt(arg)),
+            0.0,
+        )
+        return kernel
+
+    def _grid_correction(self, npixel: int) -> NDArray[np.float64]:
+        """Fourier transform of the kernel at the image pixels (1D)."""
+        support = self.config.kernel_support
+        nu = (np.arange(npixel) - npixel // 2) / npixel
+        z = np.sqrt(self._kernel_beta**2 - (np.pi * support * nu) ** 2 + 0j)
+        correction: NDArray[np.float64] = np.real(support * np.sinh(z) / z)
+        return correction
+
+    def _grid_to_image(self, grids: NDArray[np.complex128]) -> NDArray[np.float64]:
+        """Transforms (channels, v, -u) grids to grid-corrected dirty images."""
+        npixel = grids.shape[-1]
+        images = scipy.fft.fftshift(
+            scipy.fft.ifft2(
+                scipy.fft.ifftshift(grids, axes=(-2, -1)),
+                norm="forward",
+                workers=self.config.fft_workers,
+            ),
+            axes=(-2, -1),
+        ).real
+        correction = self._grid_correction(npixel)
+        images /= correction[:, np.newaxis] * correction[np.newaxis, :]
+        return images
+
+    def _create_header(
+        self,
+        phase_centre_deg: Tuple[float, float],
+        freqs_hz: NDArray[np.float64],
+        n_freqs: int,
+    ) -> Header:
+        """Creates a 4D (RA, DEC, STOKES, FREQ) header like the RASCIL imager."""
+        npixel = self.config.imaging_npixel
+        cellsize_deg = np.degrees(self.config.imaging_cellsize)
+        freq_inc_hz = freqs_hz[1] - freqs_hz[0] if len(freqs_hz) > 1 else 1.0
+        wcs = WCS(naxis=4)
+        wcs.wcs.ctype = ["RA---SIN", "DEC--SIN", "STOKES", "FREQ"]
+        wcs.wcs.cunit = ["deg", "deg", "", "Hz"]
+        wcs.wcs.crpix = [npixel // 2 + 1, npixel // 2 + 1, 1.0, 1.0]
+        wcs.wcs.cdelt = [-cellsize_deg, cellsize_deg, 1.0, freq_inc_hz]
+        wcs.wcs.crval = [
+            phase_centre_deg[0],
+            phase_centre_deg[1],
+            1.0,
+            float(np.mean(freqs_hz)) if n_freqs == 1 else freqs_hz[0],
+        ]
+        header = wcs.to_header()
+        header["BUNIT"] = "Jy/beam"
+        return header
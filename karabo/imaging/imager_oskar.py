@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Optional, Union
 
 import numpy as np
-import oskar
 from astropy.coordinates import SkyCoord
 from ska_sdp_datamodels.visibility import Visibility as RASCILVisibility
 from typing_extensions import override
@@ -61,6 +60,8 @@ class OskarDirtyImager(DirtyImager):
         visibility: Union[Visibility, RASCILVisibility],
         output_fits_path: Optional[FilePathType] = None,
     ) -> Image:
+        import oskar
+
         if isinstance(visibility, RASCILVisibility):
             raise NotImplementedError(
                 """OSKAR Imager applied to
@@ -97,14 +97,15 @@ class WscleanDirtyImager(DirtyImager):
             f"{visibility.ms_file_path}"
         )
         print(f"WSClean command: [{command}]")
-        completed_process = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            # Raises exception on return code != 0
-            check=True,
-        )
+        with FileHandler.lease(path=tmp_dir):
+            completed_process = subprocess.run(
+                command,
+                shell=True,
+                capture_output=True,
+                text=True,
+                # Raises exception on return code != 0
+                check=True,
+            )
         print(f"WSClean output:\n[{completed_process.stdout}]")
 
         default_output_fits_path = os.path.join(tmp_dir, self.OUTPUT_FITS_DIRTY)
@@ -202,14 +203,15 @@ class WscleanImageCleaner(ImageCleaner):
             + str(ms_file_path)
         )
         print(f"WSClean command: [{command}]")
-        completed_process = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            # Raises exception on return code != 0
-            check=True,
-        )
+        with FileHandler.lease(path=tmp_dir):
+            completed_process = subprocess.run(
+                command,
+                shell=True,
+                capture_output=True,
+                text=True,
+                # Raises exception on return code != 0
+                check=True,
+            )
         print(f"WSClean output:\n[{completed_process.stdout}]")
 
         default_output_fits_path = os.path.join(tmp_dir, self.OUTPUT_FITS_CLEANED)
@@ -267,14 +269,15 @@ def create_image_custom_command(
         )
     command = _get_command_prefix(tmp_dir) + command
     print(f"WSClean command: [{command}]")
-    completed_process = subprocess.run(
-        command,
-        shell=True,
-        capture_output=True,
-        text=True,
-        # Raises exception on return code != 0
-        check=True,
-    )
+    with FileHandler.lease(path=tmp_dir):
+        completed_process = subprocess.run(
+            command,
+            shell=True,
+            capture_output=True,
+            text=True,
+            # Raises exception on return code != 0
+            check=True,
+        )
     print(f"WSClean output:\n[{completed_process.stdout}]")
 
     if isinstance(output_filenames, str):
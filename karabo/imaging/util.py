@@ -1,15 +1,13 @@
 from __future__ import annotations
 
 import warnings
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, List, Tuple, Union
 
 import numpy as np
 from astropy.modeling import fitting, models
 from astropy.wcs import WCS
 from numpy.typing import NDArray
-from rascil import processing_components as rpc
 from scipy.optimize import minpack
-from ska_sdp_datamodels.image.image_model import Image as SkaSdpImage
 from ska_sdp_datamodels.visibility import Visibility as RASCILVisibility
 from typing_extensions import assert_never
 
@@ -17,13 +15,15 @@ from karabo.data.external_data import MGCLSContainerDownloadObject
 from karabo.imaging.image import Image
 from karabo.imaging.imager_base import DirtyImager, DirtyImagerConfig
 from karabo.imaging.imager_oskar import OskarDirtyImager, OskarDirtyImagerConfig
-from karabo.imaging.imager_rascil import RascilDirtyImager, RascilDirtyImagerConfig
 from karabo.simulation.sky_model import SkyModel
 from karabo.simulation.visibility import Visibility
 from karabo.simulator_backend import SimulatorBackend
 from karabo.util._types import BeamType
 from karabo.warning import KaraboWarning
 
+if TYPE_CHECKING:
+    from ska_sdp_datamodels.image.image_model import Image as SkaSdpImage
+
 
 def auto_choose_dirty_imager_from_vis(
     visibility: Union[Visibility, RASCILVisibility],
@@ -53,6 +53,11 @@ def auto_choose_dirty_imager_from_vis(
             )
         )
     elif isinstance(visibility, RASCILVisibility):
+        from karabo.imaging.imager_rascil import (
+            RascilDirtyImager,
+            RascilDirtyImagerConfig,
+        )
+
         dirty_imager = RascilDirtyImager(
             RascilDirtyImagerConfig(
                 imaging_npixel=config.imaging_npixel,
@@ -92,6 +97,11 @@ def auto_choose_dirty_imager_from_sim(
             )
         )
     elif simulator_backend == SimulatorBackend.RASCIL:
+        from karabo.imaging.imager_rascil import (
+            RascilDirtyImager,
+            RascilDirtyImagerConfig,
+        )
+
         dirty_imager = RascilDirtyImager(
             RascilDirtyImagerConfig(
                 imaging_npixel=config.imaging_npixel,
@@ -153,6 +163,8 @@ def get_MGCLS_images(regex_pattern: str, verbose: bool = False) -> List[SkaSdpIm
     List[SkaSdpImage]
         List of images from the MGCLS Enhanced Products bucket.
     """
+    from rascil import processing_components as rpc
+
     mgcls_cdo = MGCLSContainerDownloadObject(regexr_pattern=regex_pattern)
     local_file_paths = mgcls_cdo.get_all(verbose=verbose)
     if len(local_file_paths) == 0:
@@ -0,0 +1,78 @@
+"""Benchmarks the startup-time of Karabo.
+
+Each module gets imported in a fresh interpreter, because every dask-worker,
+MPI-rank or short script pays this cost again. Heavy backends which got imported
+as a side-effect are listed as well; they should only show up for modules which
+actually need them.
+"""
+import json
+import subprocess
+import sys
+from typing import List, Tuple
+
+MODULES = [
+    "karabo",
+    "karabo.util.file_handler",
+    "karabo.util.dask",
+    "karabo.simulation.sky_model",
+    "karabo.simulation.telescope",
+    "karabo.simulation.interferometer",
+    "karabo.imaging.image",
+    "karabo.imaging.util",
+    "karabo.sourcedetection.result",
+]
+
+HEAVY_BACKENDS = [
+    "oskar",
+    "rascil",
+    "ska_sdp_func_python",
+    "bdsf",
+    "tools21cm",
+    "distributed",
+    "dask_mpi",
+    "mpi4py",
+    "matplotlib.pyplot",
+    "reproject",
+    "healpy",
+    "eidos",
+    "katbeam",
+]
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+imported = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"duration": duration, "imported": imported}}))
+"""
+
+
+def time_import(module: str) -> Tuple[float, List[str]]:
+    """Imports `module` in a fresh interpreter.
+
+    Args:
+        module: Module to import.
+
+    Returns:
+        Import-duration in seconds & imported heavy backends.
+    """
+    script = _SCRIPT.format(module=module, heavy=HEAVY_BACKENDS)
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return float(result["duration"]), list(result["imported"])
+
+
+def main() -> None:
+    for module in MODULES:
+        duration, imported = time_import(module)
+        print(f"{module:<40} {duration:6.2f}s  backends: {imported}")
+
+
+if __name__ == "__main__":
+    main()
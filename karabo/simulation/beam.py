@@ -1,17 +1,18 @@
+import hashlib
+import json
 import os
+import shutil
 import subprocess
 import tempfile
+import uuid
+from functools import lru_cache
 from typing import List, Literal, Optional, Tuple, Union, cast
 
-import eidos
 import numpy as np
 from astropy import units
+from astropy.constants import c as LIGHT_SPEED
 from astropy.stats import gaussian_fwhm_to_sigma
 from astropy.units import Quantity
-from eidos.create_beam import zernike_parameters
-from eidos.spatial import recon_par
-from katbeam import JimBeam
-from matplotlib import pyplot as plt
 from numpy.typing import ArrayLike, NDArray
 from scipy import interpolate
 from scipy.interpolate import RectBivariateSpline
@@ -19,8 +20,13 @@ from typing_extensions import TypeAlias
 
 from karabo.error import KaraboError
 from karabo.simulation.telescope import Telescope
-from karabo.util._types import IntFloat, NPIntFloat
+from karabo.util._types import DirPathType, IntFloat, NPIntFloat
 from karabo.util.data_util import get_module_path_of_module
+from karabo.util.file_handler import FileHandler, get_file_checksum
+
+# Increase if the fitted element-data changes for the same inputs
+_ELEMENT_FIT_CACHE_VERSION = 1
+_ELEMENT_FIT_CACHE_METADATA = "element_fit.json"
 
 ElementFitPolType: TypeAlias = Literal[
     "x",
@@ -86,7 +92,18 @@ class BeamPattern:
         average_fractional_error_factor_increase: Optional[float] = None,
         ignore_data_at_pole: Optional[bool] = None,
         avg_frac_error: Optional[float] = None,
+        use_cache: bool = True,
     ) -> None:
+        """Fits the element-pattern of the CST file with `oskar_fit_element_data`.
+
+        The fitted element-data gets written to `telescope.path`. Because the fit
+        takes minutes, its outputs are stored in the long-term memory, keyed by the
+        content of the CST file and the fit-parameters, and just copied to
+        `telescope.path` if the same fit is requested again.
+
+        :param use_cache: Load the fitted element-data from (or store it in) the
+                          element-fit cache?
+        """
         if telescope is not None:
             self.telescope = telescope
         if not isinstance(self.telescope, Telescope):
@@ -108,7 +125,68 @@ class BeamPattern:
             self.ignore_data_at_pole = ignore_data_at_pole
         if avg_frac_error is not None:
             self.avg_frac_error = avg_frac_error
+        if self.telescope.path is None:
+            raise KaraboError("`telescope.path` is None but must be set.")
 
+        if not use_cache:
+            self._run_fit_element_data(output_directory=self.telescope.path)
+            return
+        cache_dir = FileHandler().get_tmp_dir(
+            prefix="element-fit-cache-",
+            term="long",
+        )
+        key_content = json.dumps(
+            {
+                "version": _ELEMENT_FIT_CACHE_VERSION,
+                "checksum": get_file_checksum(self.cst_file_path),
+                "freq_hz": self.freq_hz,
+                "pol": self.pol,
+                "element_type_index": self.element_type_index,
+                "average_fractional_error_factor_increase": (
+                    self.average_fractional_error_factor_increase
+                ),
+                "ignore_data_at_pole": self.ignore_data_at_pole,
+                "avg_frac_error": self.avg_frac_error,
+            },
+            sort_keys=True,
+        )
+        key = hashlib.sha256(key_content.encode()).hexdigest()
+        store_path = os.path.join(cache_dir, key)
+        # not evicted while the fit is stored or copied out
+        with FileHandler.lease(path=cache_dir):
+            metadata_path = os.path.join(store_path, _ELEMENT_FIT_CACHE_METADATA)
+            if not os.path.exists(metadata_path):
+                # fit into a tmp-dir first to not expose incomplete outputs to
+                # concurrent processes
+                tmp_store_path = f"{store_path}.tmp-{uuid.uuid4().hex}"
+                try:
+                    os.makedirs(tmp_store_path)
+                    self._run_fit_element_data(output_directory=tmp_store_path)
+                    with open(
+                        os.path.join(tmp_store_path, _ELEMENT_FIT_CACHE_METADATA), "w"
+                    ) as f:
+                        json.dump({"key": key}, f)
+                    os.rename(tmp_store_path, store_path)
+                except OSError:
+                    if not os.path.exists(store_path):
+                        raise
+                finally:
+                    if os.path.exists(tmp_store_path):
+                        shutil.rmtree(tmp_store_path)
+            else:
+                print(f"Loading cached element-data fit from {store_path}")
+            shutil.copytree(
+                store_path,
+                self.telescope.path,
+                ignore=shutil.ignore_patterns(_ELEMENT_FIT_CACHE_METADATA),
+                dirs_exist_ok=True,
+            )
+
+    def _run_fit_element_data(self, output_directory: DirPathType) -> None:
+        """Runs `oskar_fit_element_data` with the current fit-parameters.
+
+        :param output_directory: Directory to write the fitted element-data to.
+        """
         content = (
             "[General] \n"
             "app=oskar_fit_element_data \n"
@@ -122,7 +200,7 @@ class BeamPattern:
             + f"{self.average_fractional_error_factor_increase} \n"
             f"ignore_data_at_pole={self.ignore_data_at_pole} \n"
             f"element_type_index={self.element_type_index}\n"
-            f"output_directory={self.telescope.path} \n"
+            f"output_directory={output_directory} \n"
         )
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -135,6 +213,11 @@ class BeamPattern:
                 ["oskar_fit_element_data", f"{settings_file}"]
             )
             fit_data_process.communicate()
+        if fit_data_process.returncode != 0:
+            raise KaraboError(
+                "`oskar_fit_element_data` failed with exit-code "
+                + f"{fit_data_process.returncode}."
+            )
 
     def make_cst_from_arr(
         self,
@@ -177,6 +260,8 @@ class BeamPattern:
         :param beamextent:
         :return:
         """
+        from katbeam import JimBeam
+
         beam = JimBeam("MKAT-AA-UHF-JIM-2020")
         freqlist = beam.freqMHzlist
         marginx = np.linspace(-beamextentx / 2.0, beamextentx / 2.0, sampling_step)
@@ -210,6 +295,10 @@ class BeamPattern:
         """
         Returns beam
         """
+        import eidos
+        from eidos.create_beam import zernike_parameters
+        from eidos.spatial import recon_par
+
         if mode == "AH":
             meerkat_beam_coeff_ah = (
                 f"{get_module_path_of_module(eidos)}"
@@ -233,6 +322,8 @@ class BeamPattern:
         B_ah: NDArray[np.complex_],
         path: Optional[str] = None,
     ) -> None:
+        from matplotlib import pyplot as plt
+
         _, ax = plt.subplots(2, 2)
         log10_notzero = 10 ** (-10)
         ax00 = ax[0, 0]
@@ -285,6 +376,8 @@ class BeamPattern:
         npix: int,
         path: Optional[str] = None,
     ) -> None:
+        from matplotlib import pyplot as plt
+
         f, ax = plt.subplots(2, 1)
         log10_notzero = 10 ** (-12)
         ax0 = ax[0]
@@ -331,6 +424,8 @@ class BeamPattern:
         :param pol:
         :return:
         """
+        from matplotlib import pyplot as plt
+
         plt.imshow(
             beampixels,
             extent=(-beamextent / 2, beamextent / 2, -beamextent / 2, beamextent / 2),
@@ -358,6 +453,8 @@ class BeamPattern:
         :param absdir: in DBs
         :return: polar plot
         """
+        from matplotlib import pyplot as plt
+
         fig = plt.figure()
         ax = fig.add_axes((0.1, 0.1, 0.8, 0.8), polar=True)
         ax.pcolormesh(
@@ -374,13 +471,22 @@ class BeamPattern:
         phi: QuantityVarType,
         integrand: NDArray[np.float_],
     ) -> np.float_:
-        theta_ = Quantity(theta, unit=units.deg).to("rad")
-        phi_ = Quantity(phi, unit=units.deg).to("rad")
+        theta_ = Quantity(theta, unit=units.deg).to_value("rad")
+        phi_ = Quantity(phi, unit=units.deg).to_value("rad")
+        return self._integrate_rad(theta_, phi_, integrand)
+
+    @staticmethod
+    def _integrate_rad(
+        theta: NDArray[np.float_],
+        phi: NDArray[np.float_],
+        integrand: NDArray[np.float_],
+    ) -> np.float_:
+        """Unit-free `integrate` with `theta` and `phi` in radians."""
         # very simple quadrature, assuming uniform
         # theta, phi sampling and theta major ordering
-        dtheta = np.max(np.diff(theta_))
-        dphi = phi_[1] - phi_[0]
-        dsa = (dtheta * dphi * np.sin(theta_)).value
+        dtheta = np.max(np.diff(theta))
+        dphi = phi[1] - phi[0]
+        dsa = dtheta * dphi * np.sin(theta)
         return cast(np.float_, np.sum(dsa * integrand))
 
     def sym_gaussian(
@@ -393,22 +499,34 @@ class BeamPattern:
         voltage: bool = False,
         power_norm: int = 1,
     ) -> NDArray[np.float_]:
-        theta = Quantity(theta, unit=units.deg).to("rad")
-        phi = Quantity(phi, unit=units.deg).to("rad")
-
-        diameter = Quantity(diameter, unit=units.m)
-        wl = Quantity(freq, unit=units.MHz).to("m", equivalencies=units.spectral())
-
-        fwhm = (fwhm_fac * wl / diameter).to(
-            "rad", equivalencies=units.dimensionless_angles()
-        )
-        sigma = gaussian_fwhm_to_sigma * fwhm
-        power_beam = cast(
-            NDArray[np.float_], (np.exp(-(theta**2) / 2 / sigma**2)).value
+        return self._sym_gaussian_rad(
+            theta=Quantity(theta, unit=units.deg).to_value("rad"),
+            phi=Quantity(phi, unit=units.deg).to_value("rad"),
+            wavelength_m=Quantity(freq, unit=units.MHz).to_value(
+                "m", equivalencies=units.spectral()
+            ),
+            diameter_m=Quantity(diameter, unit=units.m).to_value("m"),
+            fwhm_fac=fwhm_fac,
+            voltage=voltage,
+            power_norm=power_norm,
         )
 
-        power_beam *= power_norm / self.integrate(theta, phi, power_beam)
+    @staticmethod
+    def _sym_gaussian_rad(
+        theta: NDArray[np.float_],
+        phi: NDArray[np.float_],
+        wavelength_m: float,
+        diameter_m: float,
+        fwhm_fac: int = 1,
+        voltage: bool = False,
+        power_norm: int = 1,
+    ) -> NDArray[np.float_]:
+        """Unit-free `sym_gaussian` with `theta` and `phi` in radians."""
+        fwhm = fwhm_fac * wavelength_m / diameter_m
+        sigma = gaussian_fwhm_to_sigma * fwhm
+        power_beam: NDArray[np.float_] = np.exp(-(theta**2) / 2 / sigma**2)
 
+        power_beam *= power_norm / BeamPattern._integrate_rad(theta, phi, power_beam)
         if voltage:
             return power_beam**0.5
         else:
@@ -422,15 +540,32 @@ class BeamPattern:
         voltage: bool = False,
         rel_power_dB: int = -40,
     ) -> NDArray[np.float_]:
-        theta = Quantity(theta, unit=units.deg).to("rad").value
-        phi = Quantity(phi, unit=units.deg).to("rad").value
+        return self._quad_crosspol_rad(
+            theta=Quantity(theta, unit=units.deg).to_value("rad"),
+            phi=Quantity(phi, unit=units.deg).to_value("rad"),
+            vcopol=vcopol,
+            voltage=voltage,
+            rel_power_dB=rel_power_dB,
+        )
 
+    @staticmethod
+    def _quad_crosspol_rad(
+        theta: NDArray[np.float_],
+        phi: NDArray[np.float_],
+        vcopol: NDArray[np.float_],
+        voltage: bool = False,
+        rel_power_dB: int = -40,
+    ) -> NDArray[np.float_]:
+        """Unit-free `quad_crosspol` with `theta` and `phi` in radians."""
         voltage_beam: NDArray[np.float_] = (
             theta**2 * vcopol * np.cos(2 * phi + np.pi / 2)
         )
 
-        copol_power = self.integrate(theta, phi, vcopol**2)
-        power_norm = self.integrate(theta, phi, voltage_beam**2)
+        # the radians are integrated as if they were degrees, as `quad_crosspol`
+        # always did; this keeps the normalisation of existing beams unchanged
+        theta_int, phi_int = np.deg2rad(theta), np.deg2rad(phi)
+        copol_power = BeamPattern._integrate_rad(theta_int, phi_int, vcopol**2)
+        power_norm = BeamPattern._integrate_rad(theta_int, phi_int, voltage_beam**2)
 
         voltage_beam *= (10 ** (rel_power_dB / 10) * copol_power / power_norm) ** 0.5
 
@@ -466,8 +601,8 @@ class BeamPattern:
         rho: NDArray[np.float_],
         phi: NDArray[np.float_],
     ) -> Tuple[NDArray[np.float_], NDArray[np.float_]]:
-        x = np.array([rho[i] * np.cos(phi) for i in range(len(rho))])
-        y = np.array([rho[i] * np.sin(phi) for i in range(len(rho))])
+        x = np.outer(rho, np.cos(phi))
+        y = np.outer(rho, np.sin(phi))
         return (x, y)
 
     def sim_beam(
@@ -486,6 +621,9 @@ class BeamPattern:
         """
         Simulates the primary beam
 
+        The beam only depends on the arguments, therefore it's computed once per
+        process for each combination and copies are returned afterwards.
+
         :param beam_method: you can choose as beams: "Gaussian Beam",
                             "Eidos_AH", "Eidos_EM", "KatBeam"
         :param f: the frequency for which the beam is simulated (MHz)
@@ -507,225 +645,147 @@ class BeamPattern:
         if interpol is not None:
             self.interpol = interpol
 
-        max_theta = 20 * units.deg
+        theta, phi, vcopol_x, vcopol_y, data_x, data_y = BeamPattern._compute_beam(
+            beam_method=self.beam_method,
+            f=f,
+            fov=fov,
+            interpol=self.interpol,
+        )
+        grid_th_phi = [theta * units.deg, phi * units.deg]
+        return (
+            grid_th_phi,
+            vcopol_x.copy(),
+            vcopol_y.copy(),
+            data_x.copy(),
+            data_y.copy(),
+        )
+
+    @staticmethod
+    def _cst_columns(
+        theta: NDArray[np.float_],
+        phi: NDArray[np.float_],
+        horizontal: NDArray[np.float_],
+        vertical: NDArray[np.float_],
+    ) -> NDArray[np.float_]:
+        """Stacks a voltage-pattern into the 8 columns of a CST file."""
+        return np.column_stack(
+            [
+                theta,  # Theta [deg]
+                phi,  # Phi [deg]
+                np.zeros_like(theta),  # Abs dir * / Unused
+                np.abs(horizontal),  # Abs horizontal
+                np.angle(horizontal, deg=True),  # Phase horizontal [deg]
+                np.abs(vertical),  # Abs vertical
+                np.angle(vertical, deg=True),  # Phase vertical [deg]
+                np.zeros_like(theta),  # Ax. ratio * / Unused
+            ]
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _compute_beam(
+        beam_method: BeamMethodType,
+        f: Optional[float],
+        fov: IntFloat,
+        interpol: InterpolType,
+    ) -> Tuple[
+        NDArray[np.float_],
+        NDArray[np.float_],
+        NDArray[np.float_],
+        NDArray[np.float_],
+        NDArray[np.float_],
+        NDArray[np.float_],
+    ]:
+        """Unit-free & memoized computation of `sim_beam`.
+
+        The returned arrays are shared between calls and therefore read-only.
+
+        Returns:
+            theta-grid [deg], phi-grid [deg], vcopol_x, vcopol_y, data_x, data_y
+        """
+        max_theta_deg = 20.0
         n_theta = 180
         n_phi = 360
-        copol_kwargs = {
-            "freq": 600 * units.MHz,
-            "diameter": 6 * units.m,
-            "power_norm": 1,
-            "voltage": False,
-        }
         voltage = False
         rel_power_dB = -40
-        theta_range = np.linspace(0, max_theta, n_theta)
-        phi_range = (
-            np.linspace(0, 360, n_phi, endpoint=False) * units.deg
-        )  # Don't double count 0 and 360
-        # x_range,y_range=pol2cart(theta_range.value, phi_range.value)
-        grid_th_phi = cast(  # cast because `phi_range` causes type `Quantity`
-            List[Quantity], np.meshgrid(theta_range, phi_range, indexing="ij")
+        theta_range = np.linspace(0, max_theta_deg, n_theta)
+        phi_range = np.linspace(0, 360, n_phi, endpoint=False)  # Don't double count
+        theta_grid, phi_grid = np.meshgrid(theta_range, phi_range, indexing="ij")
+        theta = np.ravel(theta_grid)
+        phi = np.ravel(phi_grid)
+        # y is just 90 deg azimuthal rotation in this example
+        phi_y = phi + 90
+        theta_rad, phi_rad, phi_y_rad = (
+            np.deg2rad(theta),
+            np.deg2rad(phi),
+            np.deg2rad(phi_y),
         )
-        theta = cast(Quantity, np.ravel(grid_th_phi[0]))
-        phi = cast(Quantity, np.ravel(grid_th_phi[1]))
-        phi_y = (
-            phi + 90 * units.deg
-        )  # y is just 90 deg azimuthal rotation in this example
-        over_360 = phi_y[phi_y >= 360 * units.deg]
-        over_360 = over_360 - 360 * units.deg
-        if self.beam_method == "Gaussian Beam":
-            vcopol_x = self.sym_gaussian(theta, phi, **copol_kwargs)
-            vcrpol_x = self.quad_crosspol(
-                theta=theta,
-                phi=phi,
+        if beam_method == "Gaussian Beam":
+            wavelength_m = LIGHT_SPEED.value / 600e6
+            diameter_m = 6.0
+            vcopol_x = BeamPattern._sym_gaussian_rad(
+                theta_rad, phi_rad, wavelength_m, diameter_m
+            )
+            vcrpol_x = BeamPattern._quad_crosspol_rad(
+                theta=theta_rad,
+                phi=phi_rad,
                 vcopol=vcopol_x,
                 voltage=voltage,
                 rel_power_dB=rel_power_dB,
             )
-            vcopol_y = self.sym_gaussian(theta, phi_y, **copol_kwargs)
-            vcrpol_y = self.quad_crosspol(
-                theta=theta,
-                phi=phi_y,
+            vcopol_y = BeamPattern._sym_gaussian_rad(
+                theta_rad, phi_y_rad, wavelength_m, diameter_m
+            )
+            vcrpol_y = BeamPattern._quad_crosspol_rad(
+                theta=theta_rad,
+                phi=phi_y_rad,
                 vcopol=vcopol_y,
                 voltage=voltage,
                 rel_power_dB=rel_power_dB,
             )
-            data_x = np.column_stack(
-                [
-                    theta.value,  # Theta [deg]
-                    phi.value,  # Phi [deg]
-                    np.zeros_like(theta.value),  # Abs dir * / Unused
-                    np.abs(vcopol_x),  # Abs horizontal
-                    np.angle(vcopol_x, deg=True),  # Phase horizontal [deg]
-                    np.abs(vcrpol_x),  # Abs vertical
-                    np.angle(vcrpol_x, deg=True),  # Phase vertical [deg]
-                    np.zeros_like(theta.value),  # Ax. ratio * / Unused
-                ]
-            )
-
-            data_y = np.column_stack(
-                [
-                    theta.value,  # Theta [deg]
-                    phi.value,  # Phi [deg]
-                    np.zeros_like(theta.value),  # Abs dir * / Unused
-                    np.abs(vcrpol_y),  # Abs horizontal
-                    np.angle(vcrpol_y, deg=True),  # Phase horizontal [deg]
-                    np.abs(vcopol_y),  # Abs vertical
-                    np.angle(vcopol_y, deg=True),  # Phase vertical [deg]
-                    np.zeros_like(theta.value),  # Ax. ratio * / Unused
-                ]
-            )
-        if self.beam_method == "EIDOS_AH":
+            data_x = BeamPattern._cst_columns(theta, phi, vcopol_x, vcrpol_x)
+            data_y = BeamPattern._cst_columns(theta, phi, vcrpol_y, vcopol_y)
+        if beam_method in ("EIDOS_AH", "EIDOS_EM"):
             npix = 100
-            B = self.get_eidos_holographic_beam(npix, 0, 10, 20, mode="AH")
+            B = BeamPattern.get_eidos_holographic_beam(npix, 0, 10, 20, mode="AH")
             xy = np.meshgrid(np.linspace(-5, 5, npix), np.linspace(-5, 5, npix))
-            theta_ah, phi_ah = self.cart2pol(xy[0], xy[1])
-            phi_ah = phi_ah * 180.0 / np.pi + 180
-            # theta_phi_ah = np.meshgrid(theta_ah, phi_ah)
-            vcopol_x = interpolate.griddata(
-                (theta_ah.flatten(), phi_ah.flatten()),
-                np.abs(B[0][0]).flatten(),
-                (theta.value, phi.value),
-                method="cubic",
-                fill_value=0,
-            )
-            vcrpol_x = interpolate.griddata(
-                (theta_ah.flatten(), phi_ah.flatten()),
-                np.abs(B[0][1]).flatten(),
-                (theta.value, phi.value),
-                method="cubic",
-                fill_value=0,
-            )
-            # vcrpol_x_em = quad_crosspol(theta, phi, vcopol_x_em, **crpol_kwargs)
-            vcopol_y = interpolate.griddata(
-                (theta_ah.flatten(), phi_ah.flatten()),
-                np.abs(B[1][1]).flatten(),
-                (theta.value, phi.value),
-                method="cubic",
-                fill_value=0,
-            )
-            vcrpol_y = interpolate.griddata(
-                (theta_ah.flatten(), phi_ah.flatten()),
-                np.abs(B[1][0]).flatten(),
-                (theta.value, phi.value),
-                method="cubic",
-                fill_value=0,
-            )
-            data_x = np.column_stack(
-                [
-                    theta.value,  # Theta [deg]
-                    phi.value,  # Phi [deg]
-                    np.zeros_like(theta.value),  # Abs dir * / Unused
-                    np.abs(vcopol_x),  # Abs horizontal
-                    np.angle(vcopol_x, deg=True),  # Phase horizontal [deg]
-                    np.abs(vcrpol_x),  # Abs vertical
-                    np.angle(vcrpol_x, deg=True),  # Phase vertical [deg]
-                    np.zeros_like(theta.value),  # Ax. ratio * / Unused
-                ]
-            )
-
-            data_y = np.column_stack(
-                [
-                    theta.value,  # Theta [deg]
-                    phi.value,  # Phi [deg]
-                    np.zeros_like(theta.value),  # Abs dir * / Unused
-                    np.abs(vcrpol_y),  # Abs horizontal
-                    np.angle(vcrpol_y, deg=True),  # Phase horizontal [deg]
-                    np.abs(vcopol_y),  # Abs vertical
-                    np.angle(vcopol_y, deg=True),  # Phase vertical [deg]
-                    np.zeros_like(theta.value),  # Ax. ratio * / Unused
-                ]
-            )
-        if self.beam_method == "EIDOS_EM":
-            npix = 100
-            B = self.get_eidos_holographic_beam(npix, 0, 10, 20, mode="AH")
-            xy = np.meshgrid(np.linspace(-5, 5, npix), np.linspace(-5, 5, npix))
-            theta_em, phi_em = self.cart2pol(xy[0], xy[1])
-            phi_em = phi_em * 180.0 / np.pi + 180
-            # theta_phi_em = np.meshgrid(theta_em, phi_em)
-            vcopol_x = interpolate.griddata(
-                (theta_em.flatten(), phi_em.flatten()),
-                np.abs(B[0][0]).flatten(),
-                (theta, phi),
-                method="cubic",
-                fill_value=0,
-            )
-            vcrpol_x = interpolate.griddata(
-                (theta_em.flatten(), phi_em.flatten()),
-                np.abs(B[0][1]).flatten(),
-                (theta, phi),
-                method="cubic",
-                fill_value=0,
-            )
-            # vcrpol_x_em = quad_crosspol(theta, phi, vcopol_x_em, **crpol_kwargs)
-            vcopol_y = interpolate.griddata(
-                (theta_em.flatten(), phi_em.flatten()),
-                np.abs(B[1][1]).flatten(),
-                (theta, phi),
-                method="cubic",
-                fill_value=0,
-            )
-            vcrpol_y = interpolate.griddata(
-                (theta_em.flatten(), phi_em.flatten()),
-                np.abs(B[1][0]).flatten(),
-                (theta, phi),
-                method="cubic",
-                fill_value=0,
-            )
-            vcopol_x[np.where(theta.value > 5)] = 0
-            vcrpol_x[np.where(theta.value > 5)] = 0
-            vcopol_y[np.where(theta.value > 5)] = 0
-            vcrpol_y[np.where(theta.value > 5)] = 0
-            data_x = np.column_stack(
-                [
-                    theta.value,  # Theta [deg]
-                    phi.value,  # Phi [deg]
-                    np.zeros_like(theta.value),  # Abs dir * / Unused
-                    np.abs(vcopol_x),  # Abs horizontal
-                    np.angle(vcopol_x, deg=True),  # Phase horizontal [deg]
-                    np.abs(vcrpol_x),  # Abs vertical
-                    np.angle(vcrpol_x, deg=True),  # Phase vertical [deg]
-                    np.zeros_like(theta.value),  # Ax. ratio * / Unused
-                ]
-            )
+            theta_eidos, phi_eidos = BeamPattern.cart2pol(xy[0], xy[1])
+            phi_eidos = phi_eidos * 180.0 / np.pi + 180
+            points = (theta_eidos.flatten(), phi_eidos.flatten())
+
+            def interpolate_eidos(values: NDArray[np.complex_]) -> NDArray[np.float_]:
+                return cast(
+                    NDArray[np.float_],
+                    interpolate.griddata(
+                        points,
+                        np.abs(values).flatten(),
+                        (theta, phi),
+                        method="cubic",
+                        fill_value=0,
+                    ),
+                )
 
-            data_y = np.column_stack(
-                [
-                    theta.value,  # Theta [deg]
-                    phi.value,  # Phi [deg]
-                    np.zeros_like(theta.value),  # Abs dir * / Unused
-                    np.abs(vcrpol_y),  # Abs horizontal
-                    np.angle(vcrpol_y, deg=True),  # Phase horizontal [deg]
-                    np.abs(vcopol_y),  # Abs vertical
-                    np.angle(vcopol_y, deg=True),  # Phase vertical [deg]
-                    np.zeros_like(theta.value),  # Ax. ratio * / Unused
-                ]
-            )
-        if self.beam_method == "KatBeam":
+            vcopol_x = interpolate_eidos(B[0][0])
+            vcrpol_x = interpolate_eidos(B[0][1])
+            vcopol_y = interpolate_eidos(B[1][1])
+            vcrpol_y = interpolate_eidos(B[1][0])
+            if beam_method == "EIDOS_EM":
+                outside = theta > 5
+                vcopol_x[outside] = 0
+                vcrpol_x[outside] = 0
+                vcopol_y[outside] = 0
+                vcrpol_y[outside] = 0
+            data_x = BeamPattern._cst_columns(theta, phi, vcopol_x, vcrpol_x)
+            data_y = BeamPattern._cst_columns(theta, phi, vcrpol_y, vcopol_y)
+        if beam_method == "KatBeam":
             # f=800;fov=30
             if f is None:
                 raise ValueError(
                     "`f` None is not allowed if `beam_method` is 'KatBeam'."
                 )
-            beampixel = self.get_meerkat_uhfbeam(f, "H", fov, fov, 300)
-            xkat = beampixel[0]
-            ykat = beampixel[1]
-            theta_kat, phi_kat = self.cart2pol(xkat, ykat)
-            theta_kat = np.deg2rad(theta_kat)
-            phi_kat = phi_kat + np.pi
-            katb_H = beampixel[2]
-            ff = interpolate.interp2d(theta_kat, phi_kat, katb_H, kind="cubic")
-            theta_arr_deg = np.linspace(0, 50, 360)
-            phi_arr_deg = np.linspace(0, 360, 360)
-            theta_arr_rad = np.deg2rad(theta_arr_deg)
-            phi_arr_rad = np.deg2rad(phi_arr_deg)
-            katb_H_pol = ff(theta_arr_rad, phi_arr_rad)
-            # plt.imshow(katb_H_pol,aspect='auto',origin='lower');plt.show()
-            # -----------------------------------------------------------
-            # f=800;fov=30;self.interpol='RectBivariateSpline' # inter2d or
-            # RectBivariateSpline
-            beampixel = self.get_meerkat_uhfbeam(f, "H", fov, fov, 300)
-            beampixel_v = self.get_meerkat_uhfbeam(f, "V", fov, fov, 300)
+            # interpol: inter2d or RectBivariateSpline
+            beampixel = BeamPattern.get_meerkat_uhfbeam(f, "H", fov, fov, 300)
+            beampixel_v = BeamPattern.get_meerkat_uhfbeam(f, "V", fov, fov, 300)
             xkat = beampixel[0]
             ykat = beampixel[1]
             katb_H = beampixel[2]
@@ -733,15 +793,13 @@ class BeamPattern:
             xkat_1D = xkat[0]
             ykat_1D = ykat[:, 0]
             theta_arr_deg = np.linspace(0, 50, 101)  # [0-50] 0.5 steps
-            theta_arr_rad = np.deg2rad(theta_arr_deg)
             phi_arr_deg = np.linspace(0, 359, 360)  # [0-359] 1 steps
-            phi_arr_rad = np.deg2rad(phi_arr_deg)
             theta_phi_grid_deg = np.meshgrid(theta_arr_deg, phi_arr_deg)
-            xkat_arr, ykat_arr = self.pol2cart(theta_arr_deg, phi_arr_deg)
-            if self.interpol == "inter2d":
+            xkat_arr, ykat_arr = BeamPattern.pol2cart(theta_arr_deg, phi_arr_deg)
+            if interpol == "inter2d":
                 ff = interpolate.interp2d(xkat, ykat, katb_H, kind="cubic")
                 katb_H_pol = ff(xkat_arr, ykat_arr)
-            if self.interpol == "RectBivariateSpline":
+            if interpol == "RectBivariateSpline":
                 ff = RectBivariateSpline(xkat_1D, ykat_1D, katb_H, s=3.5)
                 katb_H_pol = ff(xkat_arr, ykat_arr, grid=False)
                 ff = RectBivariateSpline(xkat_1D, ykat_1D, katb_V, s=3.5)
@@ -751,69 +809,38 @@ class BeamPattern:
                     "Choose Cartisean Interpolation Method 'inter2d' or "
                     "'RectBivariateSpline'"
                 )
-            # plt.imshow(katb_H_pol,aspect='auto',origin='lower');plt.show()
 
-            # ------------------------------------------------------------
-            print(theta_phi_grid_deg[0].shape, katb_H_pol.shape)
-            vcopol_x = katb_H_pol.swapaxes(
-                0, 1
-            )  # scipy.ndimage.map_coordinates(katb_H, [theta, phi], order=3)
+            theta_grid_rad = np.deg2rad(theta_phi_grid_deg[0])
+            phi_grid_rad = np.deg2rad(theta_phi_grid_deg[1])
             theta_flattened = theta_phi_grid_deg[0].flatten()
             phi_flattened = theta_phi_grid_deg[1].flatten()
-            vcrpol_x = self.quad_crosspol(
-                theta_phi_grid_deg[0], theta_phi_grid_deg[1], vcopol_x
-            )
-            vcrpol_x = vcrpol_x.flatten()
+            # scipy.ndimage.map_coordinates(katb_H, [theta, phi], order=3)
+            vcopol_x = katb_H_pol.swapaxes(0, 1)
+            vcrpol_x = BeamPattern._quad_crosspol_rad(
+                theta_grid_rad, phi_grid_rad, vcopol_x
+            ).flatten()
             vcopol_x = vcopol_x.flatten()
-            # -------------------------------------------------------------
-            # beampixel = self.get_meerkat_uhfbeam(f, "V", fov, fov)
             vcopol_y = katb_V_pol.swapaxes(0, 1)
-            # vcopol_y = interpolate.griddata(
-            #    (theta_kb.flatten(), phi_kb.flatten()),
-            #    katb_V.flatten(),
-            #    (theta, phi),
-            #    method="cubic",
-            # )
-            vcrpol_y = self.quad_crosspol(
-                theta_phi_grid_deg[0], theta_phi_grid_deg[1], vcopol_y
-            )
+            vcrpol_y = BeamPattern._quad_crosspol_rad(
+                theta_grid_rad, phi_grid_rad, vcopol_y
+            ).flatten()
             vcopol_y = vcopol_y.flatten()
-            vcrpol_y = vcrpol_y.flatten()
-            print(
-                theta_flattened.shape,
-                phi_flattened.shape,
+            data_x = BeamPattern._cst_columns(
+                theta_flattened, phi_flattened, vcopol_x, vcrpol_x
             )
-            data_x = np.column_stack(
-                [
-                    theta_flattened,  # Theta [deg]
-                    phi_flattened,  # Phi [deg]
-                    np.zeros_like(theta_flattened),  # Abs dir * / Unused
-                    np.abs(vcopol_x),  # Abs horizontal
-                    np.angle(vcopol_x, deg=True),  # Phase horizontal [deg]
-                    np.abs(vcrpol_x),  # Abs vertical
-                    np.angle(vcrpol_x, deg=True),  # Phase vertical [deg]
-                    np.zeros_like(theta_flattened),  # Ax. ratio * / Unused
-                ]
+            data_y = BeamPattern._cst_columns(
+                theta_flattened, phi_flattened, vcrpol_y, vcopol_y
             )
-
-            data_y = np.column_stack(
-                [
-                    theta_flattened,  # Theta [deg]
-                    phi_flattened,  # Phi [deg]
-                    np.zeros_like(theta_flattened),  # Abs dir * / Unused
-                    np.abs(vcrpol_y),  # Abs horizontal
-                    np.angle(vcrpol_y, deg=True),  # Phase horizontal [deg]
-                    np.abs(vcopol_y),  # Abs vertical
-                    np.angle(vcopol_y, deg=True),  # Phase vertical [deg]
-                    np.zeros_like(theta_flattened),  # Ax. ratio * / Unused
-                ]
-            )
-        return grid_th_phi, vcopol_x, vcopol_y, data_x, data_y
+        for arr in (theta_grid, phi_grid, vcopol_x, vcopol_y, data_x, data_y):
+            arr.flags.writeable = False
+        return theta_grid, phi_grid, vcopol_x, vcopol_y, data_x, data_y
 
     def plot_eidos_beam(
         self,
         path: Optional[str],
     ) -> None:
+        from matplotlib import pyplot as plt
+
         grid_th_phi, vcopol_x, vcopol_y, data_x, data_y = self.sim_beam("EIDOS_AH")
         vcrpol_x = data_x[5]
         vcrpol_y = data_y[3]
@@ -0,0 +1,138 @@
+"""Blockwise direct Fourier transform (DFT) of point sources.
+
+Drop-in replacement of the `cpu_looped` kernel of RASCIL's
+`dft_skycomponent_visibility`, which loops over the components in Python and
+allocates a full (times, baselines, channels) phasor per component. Here the
+sources and the visibility rows are tiled into blocks of bounded memory, each
+block being a phase-matrix product, and the row-blocks run in a thread pool.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, Optional, Union
+
+import numpy as np
+from astropy.coordinates import CartesianRepresentation, SkyCoord
+from numpy.typing import NDArray
+from typing_extensions import TypeAlias
+
+from karabo.util.data_util import parse_size
+
+DftComputeKernelType: TypeAlias = Literal[
+    "cpu_blockwise",
+    "cpu_looped",
+    "gpu_cupy_raw",
+    "proc_func",
+]
+
+
+def point_source_direction_cosines(
+    directions: SkyCoord,
+    phase_centre: SkyCoord,
+) -> NDArray[np.float64]:
+    """Computes the direction-cosines of sources relative to a phase-centre.
+
+    Equivalent to RASCIL's `skycoord_to_lmn` for all sources at once, with the
+    n-term as in `extract_direction_and_flux`.
+
+    Args:
+        directions: Array-`SkyCoord` of the sources.
+        phase_centre: Phase-centre of the observation.
+
+    Returns:
+        (l, m, n - 1) of each source, shape (n_sources, 3).
+    """
+    offsets = directions.transform_to(phase_centre.skyoffset_frame())
+    cartesian = offsets.represent_as(CartesianRepresentation)
+    l_ = np.atleast_1d(np.asarray(cartesian.y.value, dtype=np.float64))
+    m = np.atleast_1d(np.asarray(cartesian.z.value, dtype=np.float64))
+    n = np.sqrt(1.0 - l_**2 - m**2) - 1.0
+    return np.stack((l_, m, n), axis=-1)
+
+
+def dft_point_sources_blockwise(
+    direction_cosines: NDArray[np.float64],
+    fluxes: NDArray[Union[np.float64, np.complex128]],
+    uvw_lambda: NDArray[np.float64],
+    max_block_memory: str = "64MB",
+    n_threads: Optional[int] = None,
+) -> NDArray[np.complex128]:
+    """Predicts the visibilities of point sources with a blockwise DFT.
+
+    Computes the same sum as RASCIL's `dft_kernel`:
+    vis = sum_sources flux * exp(-2 pi i (u l + v m + w (n - 1))).
+
+    The phasors of one block of sources & visibility-rows (times * baselines)
+    are at most `max_block_memory` large. Each thread works on its own rows,
+    so the peak memory is about `n_threads * max_block_memory`.
+
+    Args:
+        direction_cosines: (l, m, n - 1) of each source, shape (n_sources, 3),
+            see `point_source_direction_cosines`.
+        fluxes: Flux of each source per channel & polarisation, shape
+            (n_sources, n_channels, n_polarisations).
+        uvw_lambda: uvw-coordinates in wavelengths, shape
+            (n_times, n_baselines, n_channels, 3).
+        max_block_memory: Memory-limit of the phasors of a block, e.g. "64MB".
+        n_threads: Number of threads. Defaults to the number of cpus.
+
+    Returns:
+        Visibilities, shape (n_times, n_baselines, n_channels, n_polarisations).
+    """
+    n_times, n_baselines, n_channels, _ = uvw_lambda.shape
+    n_sources = direction_cosines.shape[0]
+    n_pols = fluxes.shape[-1]
+    n_rows = n_times * n_baselines
+    if fluxes.shape[:2] != (n_sources, n_channels):
+        raise ValueError(
+            f"`fluxes` of shape {fluxes.shape} don't match {n_sources} sources "
+            + f"and {n_channels} channels."
+        )
+    # channel-major, so each channel is a (rows, sources) @ (sources, pols) product
+    vis = np.zeros((n_channels, n_rows, n_pols), dtype=np.complex128)
+    if n_sources == 0 or n_rows == 0:
+        return vis.reshape(n_channels, n_times, n_baselines, n_pols).transpose(
+            1, 2, 0, 3
+        )
+    uvw = np.ascontiguousarray(
+        np.asarray(uvw_lambda, dtype=np.float64)
+        .reshape(n_rows, n_channels, 3)
+        .transpose(1, 0, 2)
+    )
+    dc_t = np.ascontiguousarray(np.asarray(direction_cosines, dtype=np.float64).T)
+    fluxes_c = np.ascontiguousarray(
+        np.asarray(fluxes, dtype=np.complex128).transpose(1, 0, 2)
+    )
+
+    # phasors of a block are complex128 of shape (channels, rows, sources)
+    max_elements = max(parse_size(max_block_memory) // 16 // n_channels, 1)
+    n_workers = n_threads if n_threads is not None else (os.cpu_count() or 1)
+    rows_per_block = -(-n_rows // n_workers)  # at least one block per thread
+    sources_per_block = min(n_sources, max(max_elements // rows_per_block, 256))
+    rows_per_block = min(rows_per_block, max(max_elements // sources_per_block, 1))
+    row_starts = range(0, n_rows, rows_per_block)
+
+    def predict_rows(row_start: int) -> None:
+        rows = slice(row_start, min(row_start + rows_per_block, n_rows))
+        for source_start in range(0, n_sources, sources_per_block):
+            sources = slice(source_start, source_start + sources_per_block)
+            phase = uvw[:, rows, :] @ dc_t[:, sources]  # [cycles]
+            # only the fractional cycles matter, small arguments are cheaper and
+            # more accurate for cos & sin
+            phase -= np.rint(phase)
+            phase *= -2 * np.pi
+            phasor = np.empty(phase.shape, dtype=np.complex128)
+            np.cos(phase, out=phasor.real)
+            np.sin(phase, out=phasor.imag)
+            vis[:, rows, :] += phasor @ fluxes_c[:, sources, :]
+
+    if len(row_starts) == 1 or n_workers == 1:
+        for row_start in row_starts:
+            predict_rows(row_start)
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            # consume the results to propagate exceptions
+            list(executor.map(predict_rows, row_starts))
+
+    return vis.reshape(n_channels, n_times, n_baselines, n_pols).transpose(1, 2, 0, 3)
@@ -1,27 +1,47 @@
+from __future__ import annotations
+
 import enum
+import hashlib
+import json
 import os
+import shutil
+import uuid
 from copy import deepcopy
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast
+from datetime import timedelta
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from typing import get_args as typing_get_args
 from typing import overload
+from warnings import warn
 
+import dask.array as da
 import numpy as np
-import oskar
 import pandas as pd
 import xarray as xr
 from astropy.coordinates import SkyCoord
 from dask import compute, delayed  # type: ignore[attr-defined]
 from dask.delayed import Delayed
-from dask.distributed import Client
 from numpy.typing import NDArray
-from ska_sdp_datamodels.science_data_model.polarisation_model import PolarisationFrame
-from ska_sdp_datamodels.visibility import Visibility as RASCILVisibility
-from ska_sdp_datamodels.visibility import create_visibility, export_visibility_to_hdf5
-from ska_sdp_func_python.imaging.dft import dft_skycomponent_visibility
 from typing_extensions import assert_never
 
 from karabo.error import KaraboInterferometerSimulationError
 from karabo.simulation.beam import BeamPattern
+from karabo.simulation.dft import (
+    DftComputeKernelType,
+    dft_point_sources_blockwise,
+    point_source_direction_cosines,
+)
 from karabo.simulation.observation import (
     Observation,
     ObservationAbstract,
@@ -29,6 +49,7 @@ from karabo.simulation.observation import (
     ObservationParallized,
 )
 from karabo.simulation.sky_model import SkyModel
+from karabo.simulation.sky_pruning import SkyPruningReport, prune_sky
 from karabo.simulation.telescope import Telescope
 from karabo.simulation.visibility import Visibility
 from karabo.simulator_backend import SimulatorBackend
@@ -39,8 +60,22 @@ from karabo.util._types import (
     PrecisionType,
 )
 from karabo.util.dask import DaskHandler
-from karabo.util.file_handler import FileHandler
+from karabo.util.data_util import calculate_chunk_size_from_max_chunk_size_in_memory
+from karabo.util.file_handler import FileHandler, get_dir_checksum, get_file_checksum
 from karabo.util.gpu_util import is_cuda_available
+from karabo.util.import_util import lazy_import
+from karabo.warning import KaraboWarning
+
+if TYPE_CHECKING:
+    import oskar
+    from dask.distributed import Client
+    from ska_sdp_datamodels.visibility import Visibility as RASCILVisibility
+else:
+    oskar = lazy_import("oskar")
+
+# Increase if the output of a simulation changes for the same inputs
+_SIMULATION_CACHE_VERSION = 1
+_SIMULATION_CACHE_METADATA = "simulation.json"
 
 
 class CorrelationType(enum.Enum):
@@ -149,6 +184,11 @@ class InterferometerSimulation:
                                 Useful if the sky model is too large to fit into the
                                 memory of a single worker. Group index should be
                                 strictly monotonic increasing.
+    :ivar max_sky_chunk_memory: Alternative to `split_idxs_per_group`. Splits the sky
+                                model into chunks of at most the given memory size,
+                                e.g. "500MB". Each sky chunk is simulated separately
+                                (on a separate dask worker if dask is used) and the
+                                resulting visibilities are summed up.
     :ivar precision: For the arithmetic use you can choose between "single" or
                      "double" precision
     :ivar station_type: Here you can choose the type of each station in the
@@ -169,6 +209,29 @@ class InterferometerSimulation:
                                 generated with ARatmospy. The file parameters
                                 (times/frequencies) should coincide with the planned
                                 observation.
+    :ivar use_cache: If True, the visibilities of OSKAR simulations of an
+                     `Observation` are stored in the long-term memory, keyed by
+                     the content of the sky, the telescope-directory, the
+                     observation and the interferometer settings. Re-running the
+                     same simulation then just copies the stored visibilities to
+                     `vis_path` and `ms_file_path`.
+    :ivar dft_compute_kernel: DFT kernel of the RASCIL backend. "cpu_blockwise" is
+                              Karabo's multi-threaded kernel, which processes the
+                              sources and baselines in blocks of bounded memory.
+                              The other kernels are the ones of RASCIL's
+                              `dft_skycomponent_visibility`.
+    :ivar prune_sky: If True, sources which are below the horizon of the telescope
+                     during the whole observation are removed before the
+                     simulation, see `karabo.simulation.sky_pruning.prune_sky`.
+                     How many sources got removed and which fraction of the
+                     flux they hold is printed and kept in `prune_sky_report`.
+    :ivar prune_sky_min_apparent_flux_jy: If `prune_sky`, sources whose apparent
+                                          flux is below this threshold are removed
+                                          as well. The apparent flux is the stokes I
+                                          flux attenuated by the "Gaussian beam" at
+                                          the lowest frequency of a tracking
+                                          observation. For other station types,
+                                          the beam is not modelled.
     """
 
     def __init__(
@@ -203,6 +266,8 @@ class InterferometerSimulation:
         use_dask: Optional[bool] = None,
         split_observation_by_channels: bool = False,
         n_split_channels: Union[int, str] = "each",
+        split_idxs_per_group: Optional[List[int]] = None,
+        max_sky_chunk_memory: Optional[str] = None,
         client: Optional[Client] = None,
         precision: PrecisionType = "single",
         station_type: StationTypeType = "Isotropic beam",
@@ -214,6 +279,10 @@ class InterferometerSimulation:
         ionosphere_screen_height_km: Optional[float] = 300,
         ionosphere_screen_pixel_size_m: Optional[float] = 0,
         ionosphere_isoplanatic_screen: Optional[bool] = False,
+        use_cache: bool = False,
+        dft_compute_kernel: DftComputeKernelType = "cpu_blockwise",
+        prune_sky: bool = False,
+        prune_sky_min_apparent_flux_jy: float = 0.0,
     ) -> None:
         self._ms_file_path = ms_file_path
         self._vis_path = vis_path
@@ -270,6 +339,20 @@ class InterferometerSimulation:
 
         self.split_observation_by_channels = split_observation_by_channels
         self.n_split_channels = n_split_channels
+        if split_idxs_per_group is not None and max_sky_chunk_memory is not None:
+            raise RuntimeError(
+                "Providing `split_idxs_per_group` and `max_sky_chunk_memory` is "
+                + "ambiguous and therefore not allowed."
+            )
+        if split_idxs_per_group is not None and np.any(
+            np.diff(split_idxs_per_group) <= 0
+        ):
+            raise ValueError(
+                "`split_idxs_per_group` must be strictly monotonic increasing, "
+                + f"but is {split_idxs_per_group}."
+            )
+        self.split_idxs_per_group = split_idxs_per_group
+        self.max_sky_chunk_memory = max_sky_chunk_memory
 
         self.precision = precision
         self.station_type = station_type
@@ -291,6 +374,11 @@ class InterferometerSimulation:
         self.ionosphere_screen_height_km = ionosphere_screen_height_km
         self.ionosphere_screen_pixel_size_m = ionosphere_screen_pixel_size_m
         self.ionosphere_isoplanatic_screen = ionosphere_isoplanatic_screen
+        self.use_cache = use_cache
+        self.dft_compute_kernel = dft_compute_kernel
+        self.prune_sky = prune_sky
+        self.prune_sky_min_apparent_flux_jy = prune_sky_min_apparent_flux_jy
+        self.prune_sky_report: Optional[SkyPruningReport] = None
 
     @property
     def ms_file_path(self) -> str:
@@ -391,6 +479,8 @@ class InterferometerSimulation:
         :param observation: observation settings
         :param backend: Backend used to perform calculations (e.g. OSKAR, RASCIL)
         """
+        if self.prune_sky:
+            sky = self._prune_sky(telescope=telescope, sky=sky, observation=observation)
         if backend is SimulatorBackend.OSKAR:
             if isinstance(observation, ObservationLong):
                 return self.__run_simulation_long(
@@ -400,10 +490,26 @@ class InterferometerSimulation:
                 return self.__run_simulation_parallized_observation(
                     telescope=telescope, sky=sky, observation=observation
                 )
+            elif (
+                self.split_idxs_per_group is not None
+                or self.max_sky_chunk_memory is not None
+            ):
+                run = partial(
+                    self.__run_simulation_sky_chunks,
+                    telescope=telescope,
+                    sky=sky,
+                    observation=observation,
+                )
             else:
-                return self.__setup_run_simulation_oskar(
-                    telescope=telescope, sky=sky, observation=observation
+                run = partial(
+                    self.__setup_run_simulation_oskar,
+                    telescope=telescope,
+                    sky=sky,
+                    observation=observation,
                 )
+            return self.__get_cached_simulation(
+                telescope=telescope, sky=sky, observation=observation, run=run
+            )
         elif backend is SimulatorBackend.RASCIL:
             return self.__run_simulation_rascil(
                 telescope=telescope, sky=sky, observation=observation
@@ -411,6 +517,208 @@ class InterferometerSimulation:
 
         assert_never(backend)
 
+    def _prune_sky(
+        self,
+        telescope: Telescope,
+        sky: SkyModel,
+        observation: ObservationAbstract,
+    ) -> SkyModel:
+        """Removes the sources which can't contribute to the observation.
+
+        :param telescope: telescope model defining the location
+        :param sky: sky model defining the sources
+        :param observation: observation settings
+        :return: Pruned sky.
+        """
+        if isinstance(observation, ObservationLong):
+            start_times = [
+                observation.start_date_and_time + timedelta(days=day)
+                for day in range(observation.number_of_days)
+            ]
+        else:
+            start_times = [observation.start_date_and_time]
+
+        beam_fwhm_deg: Optional[float] = None
+        if isinstance(observation, ObservationParallized):
+            min_frequency_hz = float(np.min(observation.center_frequencies_hz))
+        else:
+            min_frequency_hz = min(
+                observation.start_frequency_hz,
+                observation.start_frequency_hz
+                + observation.frequency_increment_hz
+                * (observation.number_of_channels - 1),
+            )
+        if (
+            self.station_type == "Gaussian beam"
+            and observation.mode == "Tracking"
+            and self.gauss_beam_fwhm_deg > 0
+            and self.gauss_ref_freq_hz > 0
+            and min_frequency_hz > 0
+        ):
+            # `gauss_beam_fwhm_deg` is the FWHM of the voltage-pattern, the
+            # power-pattern is narrower by sqrt(2). The beam is widest at the
+            # lowest frequency.
+            beam_fwhm_deg = (
+                self.gauss_beam_fwhm_deg
+                / np.sqrt(2)
+                * self.gauss_ref_freq_hz
+                / min_frequency_hz
+            )
+
+        pruned_sky, report = prune_sky(
+            sky=sky,
+            longitude_deg=telescope.centre_longitude,
+            latitude_deg=telescope.centre_latitude,
+            start_times=start_times,
+            length=observation.length,
+            phase_centre_deg=(
+                observation.phase_centre_ra_deg,
+                observation.phase_centre_dec_deg,
+            ),
+            min_apparent_flux_jy=self.prune_sky_min_apparent_flux_jy,
+            beam_fwhm_deg=beam_fwhm_deg,
+        )
+        print(report)
+        self.prune_sky_report = report
+        return pruned_sky
+
+    def _get_simulation_cache_key(
+        self,
+        telescope: Telescope,
+        sky: SkyModel,
+        observation: ObservationAbstract,
+    ) -> str:
+        """Computes the key of a simulation in the simulation-cache.
+
+        The key is based on the content of the inputs, not on their location.
+
+        :param telescope: telescope model defining its configuration
+        :param sky: sky model defining the sources
+        :param observation: observation settings
+        :return: Hex-digest of the key.
+        """
+        if sky.sources is None:
+            raise KaraboInterferometerSimulationError(
+                "Sky model has not been loaded. Please load the sky model first."
+            )
+        if telescope.path is None:
+            raise KaraboInterferometerSimulationError(
+                "`telescope.path` must be set but is None."
+            )
+        sources = sky.sources.data
+        sky_hash = hashlib.sha256(f"{sources.shape}{sources.dtype.str}".encode())
+        if isinstance(sources, da.Array):
+            # block by block of whole rows, so a lazy sky isn't loaded at once and
+            # the bytes are the same as of the C-contiguous array
+            for block in sources.rechunk({1: -1}).to_delayed().ravel():
+                sky_hash.update(np.ascontiguousarray(block.compute()).data)
+        else:
+            sky_hash.update(np.ascontiguousarray(sources).data)
+
+        # output-paths don't affect the visibilities, the ionosphere-file does
+        interferometer_params = self.__get_OSKAR_settings_tree(
+            input_telpath="",
+            ms_file_path="",
+            vis_path="",
+        )
+        if self.ionosphere_fits_path:
+            interferometer_params["telescope"][
+                "external_tec_screen/input_fits_file"
+            ] = get_file_checksum(self.ionosphere_fits_path)
+
+        key_content = json.dumps(
+            {
+                "version": _SIMULATION_CACHE_VERSION,
+                "sky": sky_hash.hexdigest(),
+                "telescope": get_dir_checksum(telescope.path),
+                "observation": observation.get_OSKAR_settings_tree(),
+                "interferometer": interferometer_params,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key_content.encode()).hexdigest()
+
+    def __get_cached_simulation(
+        self,
+        telescope: Telescope,
+        sky: SkyModel,
+        observation: ObservationAbstract,
+        run: Callable[[], Visibility],
+    ) -> Visibility:
+        """Runs an OSKAR simulation through the long-term simulation-cache.
+
+        On a cache-miss, the outputs of `run` are stored in the cache. On a hit,
+        the stored outputs are copied to `vis_path` and `ms_file_path`.
+
+        :param telescope: telescope model defining its configuration
+        :param sky: sky model defining the sources
+        :param observation: observation settings
+        :param run: Runs the simulation on a cache-miss.
+        :return: Simulated (or cached) visibilities.
+        """
+        if not self.use_cache:
+            return run()
+        if self.noise_enable and str(self.noise_seed) == "time":
+            warn(
+                KaraboWarning(
+                    "Noise seeded by time is not reproducible, therefore the "
+                    + "simulation-cache is not used. Set `noise_seed` to an int."
+                )
+            )
+            return run()
+        key = self._get_simulation_cache_key(
+            telescope=telescope, sky=sky, observation=observation
+        )
+        cache_dir = FileHandler().get_tmp_dir(
+            prefix="simulation-cache-",
+            term="long",
+        )
+        store_path = os.path.join(cache_dir, key)
+        cached_vis_path = os.path.join(store_path, "visibility.vis")
+        cached_ms_file_path = os.path.join(store_path, "measurements.MS")
+
+        # not evicted while the outputs are stored or copied out
+        with FileHandler.lease(path=cache_dir):
+            if not os.path.exists(os.path.join(store_path, _SIMULATION_CACHE_METADATA)):
+                visibility = run()
+                # write to a tmp-dir first to not expose incomplete outputs to
+                # concurrent processes
+                tmp_store_path = f"{store_path}.tmp-{uuid.uuid4().hex}"
+                try:
+                    os.makedirs(tmp_store_path)
+                    if os.path.exists(visibility.vis_path):
+                        shutil.copyfile(
+                            visibility.vis_path,
+                            os.path.join(tmp_store_path, "visibility.vis"),
+                        )
+                    if os.path.exists(visibility.ms_file_path):
+                        shutil.copytree(
+                            visibility.ms_file_path,
+                            os.path.join(tmp_store_path, "measurements.MS"),
+                        )
+                    with open(
+                        os.path.join(tmp_store_path, _SIMULATION_CACHE_METADATA), "w"
+                    ) as f:
+                        json.dump({"key": key}, f)
+                    os.rename(tmp_store_path, store_path)
+                except OSError:
+                    if not os.path.exists(store_path):
+                        raise
+                finally:
+                    if os.path.exists(tmp_store_path):
+                        shutil.rmtree(tmp_store_path)
+                return visibility
+
+            print(f"Loading cached visibilities from {store_path}")
+            if os.path.exists(cached_vis_path):
+                shutil.copyfile(cached_vis_path, self.vis_path)
+            if os.path.exists(cached_ms_file_path):
+                if os.path.exists(self.ms_file_path):
+                    shutil.rmtree(self.ms_file_path)
+                shutil.copytree(cached_ms_file_path, self.ms_file_path)
+            return Visibility(self.vis_path, self.ms_file_path)
+
     def set_ionosphere(self, file_path: str) -> None:
         """
         Set the path to an ionosphere screen file generated with ARatmospy. The file
@@ -433,6 +741,15 @@ class InterferometerSimulation:
             Will be converted into a RASCIL-compatible list of SkyComponent objects.
         :param observation: Observation details
         """
+        from ska_sdp_datamodels.science_data_model.polarisation_model import (
+            PolarisationFrame,
+        )
+        from ska_sdp_datamodels.visibility import (
+            create_visibility,
+            export_visibility_to_hdf5,
+        )
+        from ska_sdp_func_python.imaging.dft import dft_skycomponent_visibility
+
         # Steps followed in this simulation:
         # Compute hour angles based on Observation details
         # Create an empty visibility according to the observation details
@@ -484,17 +801,35 @@ class InterferometerSimulation:
             zerow=self.ignore_w_components,
         )
 
-        # Obtain list of SkyComponent instances
-        skycomponents = sky.convert_to_backend(
-            backend=SimulatorBackend.RASCIL,
-            desired_frequencies_hz=frequency_channel_starts,
-            channel_bandwidth_hz=observation.frequency_increment_hz,
-        )
+        if self.dft_compute_kernel == "cpu_blockwise":
+            if sky.sources is None:
+                raise KaraboInterferometerSimulationError(
+                    "Sky model has not been loaded. Please load the sky model first."
+                )
+            # Same sources as the SkyComponents below, but as arrays
+            directions, fluxes, _ = sky._get_rascil_point_source_arrays(
+                desired_frequencies_hz=frequency_channel_starts,
+                channel_bandwidth_hz=observation.frequency_increment_hz,
+            )
+            vis["vis"].data = dft_point_sources_blockwise(
+                direction_cosines=point_source_direction_cosines(
+                    directions, vis.phasecentre
+                ),
+                fluxes=fluxes,
+                uvw_lambda=vis.visibility_acc.uvw_lambda,
+            )
+        else:
+            # Obtain list of SkyComponent instances
+            skycomponents = sky.convert_to_backend(
+                backend=SimulatorBackend.RASCIL,
+                desired_frequencies_hz=frequency_channel_starts,
+                channel_bandwidth_hz=observation.frequency_increment_hz,
+            )
 
-        # Compute visibilities from SkyComponent list using DFT
-        vis = dft_skycomponent_visibility(
-            vis, skycomponents, dft_compute_kernel="cpu_looped"
-        )
+            # Compute visibilities from SkyComponent list using DFT
+            vis = dft_skycomponent_visibility(
+                vis, skycomponents, dft_compute_kernel=self.dft_compute_kernel
+            )
         # Save visibilities to disk
         export_visibility_to_hdf5(vis, self.vis_path)
 
@@ -542,6 +877,8 @@ class InterferometerSimulation:
             prefix="simulation-parallelized-observation-",
             purpose="disk-cache simulation-parallelized-observation",
         )
+        # in use by the simulation until the returned visibilities pin their files
+        FileHandler.pin(path=tmp_dir, obj=self)
         ms_dir = os.path.join(tmp_dir, "measurements")
         os.makedirs(ms_dir, exist_ok=False)
         vis_dir = os.path.join(tmp_dir, "visibilities")
@@ -625,6 +962,115 @@ class InterferometerSimulation:
         print(f"Saved visibility to {vis_path}")
         return Visibility(vis_path, ms_file_path)
 
+    def _get_sky_chunk_bounds(self, sky: SkyModel) -> List[Tuple[int, int]]:
+        """Gets the (start, stop) source-indices of each sky chunk.
+
+        The chunks are defined either by `split_idxs_per_group` or by
+        `max_sky_chunk_memory`. Empty chunks are omitted.
+
+        Args:
+            sky: Sky to split.
+
+        Returns:
+            (start, stop) indices of each sky chunk.
+        """
+        if sky.sources is None:
+            raise KaraboInterferometerSimulationError(
+                "Sky model has not been loaded. Please load the sky model first."
+            )
+        n_sources = sky.num_sources
+        if self.split_idxs_per_group is not None:
+            split_idxs = [
+                idx for idx in self.split_idxs_per_group if 0 < idx < n_sources
+            ]
+        elif self.max_sky_chunk_memory is not None:
+            chunk_size = calculate_chunk_size_from_max_chunk_size_in_memory(
+                self.max_sky_chunk_memory, sky.sources
+            )
+            split_idxs = list(range(chunk_size, n_sources, chunk_size))
+        else:
+            split_idxs = []
+        starts = [0] + split_idxs
+        stops = split_idxs + [n_sources]
+        return list(zip(starts, stops))
+
+    def __run_simulation_sky_chunks(
+        self,
+        telescope: Telescope,
+        sky: SkyModel,
+        observation: ObservationAbstract,
+    ) -> Visibility:
+        """Runs a separate OSKAR simulation for each chunk of `sky` and sums up
+        the visibilities of all chunks into `self.ms_file_path`.
+
+        The chunks are simulated on the dask-client if dask is used, where each
+        worker just loads its own sky chunk. Otherwise, they are simulated one
+        after another, which still bounds the memory of each simulation.
+
+        :param telescope: telescope model defining its configuration
+        :param sky: sky model defining the sources
+        :param observation: observation settings
+        """
+        array_sky = sky.sources
+        if array_sky is None:
+            raise KaraboInterferometerSimulationError(
+                "Sky model has not been loaded. Please load the sky model first."
+            )
+        input_telpath = telescope.path
+        if input_telpath is None:
+            raise KaraboInterferometerSimulationError(
+                "`telescope.path` must be set but is None."
+            )
+        chunk_bounds = self._get_sky_chunk_bounds(sky=sky)
+        n_chunks = len(chunk_bounds)
+        print(f"Simulating sky of {sky.num_sources} sources in {n_chunks} chunks.")
+
+        # the chunk .vis files are just needed until they're combined
+        file_handler = FileHandler()
+        tmp_dir = file_handler.get_tmp_dir(
+            prefix="simulation-sky-chunks-",
+            purpose="disk-cache simulation-sky-chunks",
+        )
+        observation_params = observation.get_OSKAR_settings_tree()
+        params_per_chunk: List[OskarSettingsTreeType] = []
+        for chunk_idx in range(len(chunk_bounds)):
+            interferometer_params = self.__get_OSKAR_settings_tree(
+                input_telpath=input_telpath,
+                ms_file_path="",  # chunks are only combined from .vis files
+                vis_path=os.path.join(tmp_dir, f"sky_chunk_{chunk_idx}.vis"),
+            )
+            params_per_chunk.append({**interferometer_params, **observation_params})
+
+        if self.use_dask:
+            if self.client is None:
+                self.client = DaskHandler.get_dask_client()
+            run_simu_delayed = delayed(InterferometerSimulation.__run_simulation_oskar)
+            delayed_results = [
+                run_simu_delayed(
+                    os_sky=array_sky[start:stop],
+                    params_total=params_total,
+                    precision=self.precision,
+                )
+                for (start, stop), params_total in zip(chunk_bounds, params_per_chunk)
+            ]
+            results: List[Dict[str, Any]] = list(
+                compute(*delayed_results, scheduler="distributed")
+            )
+        else:
+            results = [
+                InterferometerSimulation.__run_simulation_oskar(
+                    array_sky[start:stop], params_total, self.precision
+                )
+                for (start, stop), params_total in zip(chunk_bounds, params_per_chunk)
+            ]
+
+        visibility_paths = [x["interferometer"]["oskar_vis_filename"] for x in results]
+        Visibility.combine_vis_sky_chunks(visibility_paths, self.ms_file_path)
+        print(f"Saved combined visibility to {self.ms_file_path}")
+        file_handler.clean_instance()
+        # There is no combined .vis file, so imagers fall back to the MS.
+        return Visibility(ms_file_path=self.ms_file_path)
+
     @staticmethod
     def __run_simulation_oskar(
         os_sky: Union[oskar.Sky, NDArray[np.float_], xr.DataArray, Delayed],
@@ -666,7 +1112,6 @@ class InterferometerSimulation:
         # Initialise the telescope and observation settings
         observation_params = observation.get_OSKAR_settings_tree()
         input_telpath = telescope.path
-        runs = []
 
         if self.beam_polX is None or self.beam_polY is None:
             raise KaraboInterferometerSimulationError(
@@ -678,56 +1123,79 @@ class InterferometerSimulation:
             raise KaraboInterferometerSimulationError(
                 "`telescope.path` must be set but is None."
             )
+        if sky.sources is None:
+            raise KaraboInterferometerSimulationError(
+                "Sky model has not been loaded. Please load the sky model first."
+            )
 
         tmp_dir = FileHandler().get_tmp_dir(
             prefix="simulation-long-",
             purpose="disk-cache simulation-long",
         )
-        ms_dir = os.path.join(tmp_dir, "measurements")
-        os.makedirs(ms_dir, exist_ok=False)
+        # in use by the simulation until the returned visibilities pin their files
+        FileHandler.pin(path=tmp_dir, obj=self)
         vis_dir = os.path.join(tmp_dir, "visibilities")
         os.makedirs(vis_dir, exist_ok=False)
 
-        # Loop over days
-        for i, current_date in enumerate(
+        # The beam doesn't change between days, so it's computed just once
+        if self.enable_array_beam:
+            # ------------ X-coordinate
+            pb = deepcopy(self.beam_polX)
+            beam = pb.sim_beam()
+            pb.save_cst_file(beam[3], telescope=telescope)
+            pb.fit_elements(telescope)
+
+            # ------------ Y-coordinate
+            pb = deepcopy(self.beam_polY)
+            pb.save_cst_file(beam[4], telescope=telescope)
+            pb.fit_elements(telescope)
+
+        # Each day is an independent simulation
+        params_per_day: List[OskarSettingsTreeType] = []
+        for i, current_datetime in enumerate(
             pd.date_range(
                 observation.start_date_and_time, periods=observation.number_of_days
             ),
             1,
         ):
-            # Convert to date
-            current_date = current_date.date()
+            current_date = current_datetime.date()
             print(f"Observing Day: {i}. Date: {current_date}")
-
-            if self.enable_array_beam:
-                # ------------ X-coordinate
-                pb = deepcopy(self.beam_polX)
-                beam = pb.sim_beam()
-                pb.save_cst_file(beam[3], telescope=telescope)
-                pb.fit_elements(telescope)
-
-                # ------------ Y-coordinate
-                pb = deepcopy(self.beam_polY)
-                pb.save_cst_file(beam[4], telescope=telescope)
-                pb.fit_elements(telescope)
-
-            ms_file_path = os.path.join(ms_dir, f"{current_date}.MS")
-            vis_path = os.path.join(ms_dir, f"{current_date}.vis")
+            day_observation_params = deepcopy(observation_params)
+            day_observation_params["observation"][
+                "start_time_utc"
+            ] = current_datetime.strftime("%d-%m-%Y %H:%M:%S.%f")[:-3]
             interferometer_params = self.__get_OSKAR_settings_tree(
                 input_telpath=input_telpath,
-                ms_file_path=ms_file_path,
-                vis_path=vis_path,
+                ms_file_path="",  # days are only combined from .vis files
+                vis_path=os.path.join(vis_dir, f"{current_date}.vis"),
             )
-
-            params_total = {**interferometer_params, **observation_params}
-
-            # Submit the simulation to the workers
-            params_total = InterferometerSimulation.__run_simulation_oskar(
-                sky.sources,
-                params_total,
-                self.precision,
+            params_per_day.append({**interferometer_params, **day_observation_params})
+
+        if self.use_dask:
+            if self.client is None:
+                self.client = DaskHandler.get_dask_client()
+            array_sky = self.client.scatter(sky.sources)
+            run_simu_delayed = delayed(InterferometerSimulation.__run_simulation_oskar)
+            delayed_results = [
+                run_simu_delayed(
+                    os_sky=array_sky,
+                    params_total=params_total,
+                    precision=self.precision,
+                )
+                for params_total in params_per_day
+            ]
+            runs: List[Dict[str, Any]] = list(
+                compute(*delayed_results, scheduler="distributed")
             )
-            runs.append(params_total)
+        else:
+            runs = [
+                InterferometerSimulation.__run_simulation_oskar(
+                    sky.sources,
+                    params_total,
+                    self.precision,
+                )
+                for params_total in params_per_day
+            ]
 
         # Combine the visibilities
         visibility_paths = [x["interferometer"]["oskar_vis_filename"] for x in runs]
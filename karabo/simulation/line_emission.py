@@ -1,9 +1,12 @@
+from __future__ import annotations
+
 import os
 from collections import namedtuple
 from copy import deepcopy
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import List, Literal, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 
 import astropy.units as u
 import matplotlib
@@ -21,10 +24,67 @@ from karabo.simulation.sky_model import SkyModel
 from karabo.simulation.telescope import Telescope
 from karabo.simulation.visibility import Visibility
 from karabo.simulator_backend import SimulatorBackend
+from karabo.util.dask import DaskHandler
+
+if TYPE_CHECKING:
+    from dask.distributed import Client
 
 CircleSkyRegion = namedtuple("CircleSkyRegion", ["center", "radius"])
 
 
+def _copy_interferometer_for_unit(
+    interferometer: InterferometerSimulation,
+    vis_path: str,
+    ms_file_path: str,
+) -> InterferometerSimulation:
+    """Copies `interferometer` for a single (channel, pointing) unit.
+
+    Each unit writes to its own files and runs its simulation locally, since the
+    units themselves are already distributed.
+    """
+    client = interferometer.client
+    interferometer.client = None
+    try:
+        unit_interferometer = deepcopy(interferometer)
+    finally:
+        interferometer.client = client
+    unit_interferometer.use_dask = False
+    unit_interferometer.vis_path = vis_path
+    unit_interferometer.ms_file_path = ms_file_path
+    return unit_interferometer
+
+
+def _run_line_emission_unit(
+    index_freq: int,
+    index_p: int,
+    filtered_sky: SkyModel,
+    observation: Observation,
+    telescope: Telescope,
+    interferometer: InterferometerSimulation,
+    simulator_backend: SimulatorBackend,
+    dirty_imager: DirtyImager,
+    output_fits_path: str,
+) -> Tuple[int, int, Union[Visibility, RASCILVisibility], Image]:
+    """Simulates and dirty-images a single (channel, pointing) unit."""
+    vis = interferometer.run_simulation(
+        telescope=telescope,
+        sky=filtered_sky,
+        observation=observation,
+        backend=simulator_backend,
+    )
+    dirty = dirty_imager.create_dirty_image(
+        visibility=vis,
+        output_fits_path=output_fits_path,
+    )
+    # dirty.data.shape meaning:
+    # (frequency channels, polarisations, pixels_x, pixels_y)
+    assert dirty.data.ndim == 4
+    # I.e. only one frequency channel,
+    # since we are performing a line emission analysis
+    assert dirty.data.shape[0] == 1
+    return index_freq, index_p, vis, dirty
+
+
 def line_emission_pipeline(
     output_base_directory: Union[Path, str],
     pointings: List[CircleSkyRegion],
@@ -34,12 +94,25 @@ def line_emission_pipeline(
     interferometer: InterferometerSimulation,
     simulator_backend: SimulatorBackend,
     dirty_imager: DirtyImager,
+    client: Optional[Client] = None,
+    max_in_flight: Optional[int] = None,
 ) -> Tuple[List[List[Union[Visibility, RASCILVisibility]]], List[List[Image]]]:
     """Perform a line emission simulation, to compute visibilities and dirty images.
     A line emission simulation involves assuming every source in the input SkyModel
     only emits within one frequency channel.
 
+    Each (frequency channel, pointing) unit is simulated and dirty-imaged as an
+    independent task. If `client` is set or `interferometer` uses dask, the units
+    run concurrently on the dask-client, otherwise one after another.
+
     If requested, combine the produced dirty images into a mosaic.
+
+    Args:
+        client: Dask-client to run the units on. Defaults to the client of
+            `interferometer` if it uses dask.
+        max_in_flight: Max number of units submitted to `client` at once, which
+            bounds the memory of the pending units. Defaults to twice the number
+            of worker-threads.
     """
     print(f"Selected backend: {simulator_backend}")
 
@@ -58,96 +131,144 @@ def line_emission_pipeline(
         endpoint=False,
     )
 
-    # Create observation instance to be used for each pointing and each channel
-    observation = deepcopy(observation_details)
-
-    print("Computing visibilities...")
+    if simulator_backend is SimulatorBackend.OSKAR:
+        backend = "OSKAR"
+    else:
+        backend = "RASCIL"
 
-    # Loop through pointings
-    visibilities: List[List[Union[Visibility, RASCILVisibility]]] = []
-    for index_freq, frequency_start in enumerate(frequency_channel_starts):
-        print(f"Processing frequency channel {index_freq}...")
-        visibilities.append([])
-        for index_p, p in enumerate(pointings):
-            print(f"Processing pointing {index_p}...")
-            center = p.center
-            radius = p.radius.to(u.deg).value
-            # Create observation details
-            observation.phase_centre_ra_deg = center.ra.deg
-            observation.phase_centre_dec_deg = center.dec.deg
-            observation.number_of_channels = 1  # For line emission
-            observation.start_frequency_hz = frequency_start
-
-            # Filter sky based on pointing and on frequency channel
-            filtered_sky = sky_model.filter_by_radius_euclidean_flat_approximation(
-                inner_radius_deg=0,
-                outer_radius_deg=radius,
-                ra0_deg=center.ra.deg,
-                dec0_deg=center.dec.deg,
-            )
-            z_min = convert_frequency_to_z(
-                frequency_start + observation.frequency_increment_hz
-            )
-            z_max = convert_frequency_to_z(frequency_start)
+    # Each source only emits within the channel of its redshift. Sorting the sky
+    # by redshift once turns the selection of each channel into a slice.
+    frequency_channel_edges = np.append(
+        frequency_channel_starts,
+        frequency_channel_starts[-1] + observation_details.frequency_increment_hz,
+    )
+    channel_skies = sky_model.partition_by_column(
+        col_idx=13,
+        edges=convert_frequency_to_z(frequency_channel_edges),
+    )
 
-            filtered_sky = filtered_sky.filter_by_column(
-                col_idx=13,
-                min_val=z_min,
-                max_val=z_max,
+    def create_unit_args(index_freq: int, index_p: int) -> Tuple[Any, ...]:
+        frequency_start = frequency_channel_starts[index_freq]
+        p = pointings[index_p]
+        center = p.center
+        radius = p.radius.to(u.deg).value
+        # Create observation details
+        observation = deepcopy(observation_details)
+        observation.phase_centre_ra_deg = center.ra.deg
+        observation.phase_centre_dec_deg = center.dec.deg
+        observation.number_of_channels = 1  # For line emission
+        observation.start_frequency_hz = frequency_start
+
+        # Filter sky of the frequency channel based on pointing. The channel's
+        # sky gets filtered for each pointing, hence index it once
+        channel_sky = channel_skies[index_freq]
+        filtered_sky = channel_sky
+        if channel_sky.num_sources > 0:
+            if channel_sky.spatial_index is None:
+                channel_sky.build_spatial_index()
+            filtered_sky = (
+                channel_sky.query()
+                .filter_by_radius_euclidean_flat_approximation(
+                    inner_radius_deg=0,
+                    outer_radius_deg=radius,
+                    ra0_deg=center.ra.deg,
+                    dec0_deg=center.dec.deg,
+                )
+                .to_sky_model()
             )
+        if filtered_sky.sources is not None:
+            # ship the small filtered sky, not a graph of the entire sky
+            filtered_sky.sources = filtered_sky.sources.compute()
+
+        assert (
+            filtered_sky.num_sources > 0
+        ), f"""For frequency channel {index_freq}
+                and pointing {index_p}, there are 0 sources in the sky model.
+                Setting visibility to None, and skipping analysis."""
+
+        vis_path = f"{output_base_directory}/visibilities_f{index_freq}_p{index_p}"
+        return (
+            index_freq,
+            index_p,
+            filtered_sky,
+            observation,
+            telescope,
+            _copy_interferometer_for_unit(
+                interferometer=interferometer,
+                vis_path=vis_path,
+                ms_file_path=f"{vis_path}.MS",
+            ),
+            simulator_backend,
+            dirty_imager,
+            os.path.join(
+                output_base_directory,
+                f"dirty_{backend}_f{index_freq}_p{index_p}.fits",
+            ),
+        )
 
-            assert (
-                filtered_sky.num_sources > 0
-            ), f"""For frequency channel {index_freq}
-                    and pointing {index_p}, there are 0 sources in the sky model.
-                    Setting visibility to None, and skipping analysis."""
+    if client is None and interferometer.use_dask:
+        client = interferometer.client
+        if client is None:
+            client = DaskHandler.get_dask_client()
 
-            interferometer.vis_path = (
-                f"{output_base_directory}/visibilities_f{index_freq}_p{index_p}"
+    units = [
+        (index_freq, index_p)
+        for index_freq in range(len(frequency_channel_starts))
+        for index_p in range(len(pointings))
+    ]
+    n_channels = len(frequency_channel_starts)
+    visibilities: List[List[Union[Visibility, RASCILVisibility]]] = [
+        [] for _ in range(n_channels)
+    ]
+    dirty_images: List[List[Image]] = [[] for _ in range(n_channels)]
+    results: Dict[
+        Tuple[int, int], Tuple[int, int, Union[Visibility, RASCILVisibility], Image]
+    ] = {}
+
+    print("Computing visibilities and dirty images...")
+    if client is None:
+        for index_freq, index_p in units:
+            print(f"Processing frequency channel {index_freq}, pointing {index_p}...")
+            results[(index_freq, index_p)] = _run_line_emission_unit(
+                *create_unit_args(index_freq, index_p)
             )
-
-            vis = interferometer.run_simulation(
-                telescope=telescope,
-                sky=filtered_sky,
-                observation=observation,
-                backend=simulator_backend,
+    else:
+        from dask.distributed import as_completed
+
+        if max_in_flight is None:
+            max_in_flight = 2 * max(sum(client.nthreads().values()), 1)
+        units_iter = iter(units)
+        in_flight = as_completed()
+        for index_freq, index_p in islice(units_iter, max_in_flight):
+            in_flight.add(
+                client.submit(
+                    _run_line_emission_unit,
+                    *create_unit_args(index_freq, index_p),
+                    pure=False,
+                )
             )
-
-            visibilities[-1].append(vis)
+        # gather each unit as it finishes and refill the window
+        for future in in_flight:
+            index_freq, index_p, vis, dirty = future.result()
+            print(f"Finished frequency channel {index_freq}, pointing {index_p}.")
+            results[(index_freq, index_p)] = (index_freq, index_p, vis, dirty)
+            future.release()
+            for index_freq, index_p in islice(units_iter, 1):
+                in_flight.add(
+                    client.submit(
+                        _run_line_emission_unit,
+                        *create_unit_args(index_freq, index_p),
+                        pure=False,
+                    )
+                )
+
+    for index_freq, index_p in units:
+        _, _, vis, dirty = results[(index_freq, index_p)]
+        visibilities[index_freq].append(vis)
+        dirty_images[index_freq].append(dirty)
 
     assert len(visibilities) == observation_details.number_of_channels
     assert len(visibilities[0]) == len(pointings)
-
-    print("Creating dirty images from visibilities...")
-
-    dirty_images: List[List[Image]] = []
-    for index_freq, _ in enumerate(frequency_channel_starts):
-        print(f"Processing frequency channel {index_freq}...")
-        dirty_images.append([])
-        for index_p, _ in enumerate(pointings):
-            print(f"Processing pointing {index_p}...")
-            vis = visibilities[index_freq][index_p]
-
-            if simulator_backend is SimulatorBackend.OSKAR:
-                backend = "OSKAR"
-            else:
-                backend = "RASCIL"
-            dirty = dirty_imager.create_dirty_image(
-                visibility=vis,
-                output_fits_path=os.path.join(
-                    output_base_directory, f"dirty_{backend}_{index_p}.fits"
-                ),
-            )
-
-            dirty_images[-1].append(dirty)
-
-            # dirty.data.shape meaning:
-            # (frequency channels, polarisations, pixels_x, pixels_y)
-            assert dirty.data.ndim == 4
-            # I.e. only one frequency channel,
-            # since we are performing a line emission analysis
-            assert dirty.data.shape[0] == 1
-
     assert len(dirty_images) == observation_details.number_of_channels
     assert len(dirty_images[0]) == len(
         pointings
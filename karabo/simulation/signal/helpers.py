@@ -1,6 +1,5 @@
 """Helpers for generating different types of signals."""
 
-import multiprocessing
 from typing import Annotated, Literal, cast
 
 import numpy as np
@@ -171,6 +170,9 @@ def _filter_series(
     # fmt: on
 
 
+GridReductionType = Literal["median", "mean", "sum"]
+
+
 # pylint: disable=too-many-locals
 def map_radec_datapoints_to_grid(
     data: pd.DataFrame,
@@ -179,12 +181,17 @@ def map_radec_datapoints_to_grid(
     dec_column: str,
     intensity_column: str,
     par_count: int = 5,
+    reduction: GridReductionType = "median",
 ) -> Annotated[npt.NDArray[np.float_], Literal["X", "Y"]]:
     """
     Map the given datapoints with a destination to source mapping.
 
-    For each pixel in the destination grid, the equivalent degree range in the
-    source will be summed together and set in the destination grid.
+    For each pixel in the destination grid, the positive intensities of the
+    equivalent degree range in the source will be reduced (by default to their
+    median) and set in the destination grid. Pixels without datapoints are 0.
+
+    The pixel of each datapoint is computed once and the datapoints are sorted by
+    pixel, so each pixel is reduced over a contiguous segment.
 
     Parameters
     ----------
@@ -199,7 +206,10 @@ def map_radec_datapoints_to_grid(
     intensity_column : str
         Name of the column to use for the intensities.
     par_count : int, optional
-        How many processes to use to map the datapoints. By default 5.
+        Unused, kept for backwards compatibility. The mapping doesn't need
+        multiple processes anymore.
+    reduction : GridReductionType, optional
+        How to reduce the intensities of a pixel, by default "median".
 
     Returns
     -------
@@ -213,66 +223,74 @@ def map_radec_datapoints_to_grid(
     x_delta = (x_max - x_min) / grid_size[0]
     y_delta = (y_max - y_min) / grid_size[1]
 
-    width = grid_size[1]
-
-    args: list[
-        tuple[pd.DataFrame, str, str, str, float, float, float, float, int, int, int]
-    ] = []
-    for x in range(int(grid_size[0] / par_count)):
-        args.append(
-            (
-                data,
-                ra_column,
-                dec_column,
-                intensity_column,
-                x_min,
-                x_delta,
-                y_min,
-                y_delta,
-                width,
-                x * par_count,
-                par_count,
-            )
-        )
-
-    with multiprocessing.Pool(par_count) as p:
-        chunks: list[npt.NDArray[np.float_]] = p.starmap(
-            _map_radec_datapoints_rows,
-            args,
-        )
-    return np.nan_to_num(np.vstack(chunks))
-
+    x_idxs = _get_bin_idxs(
+        data[ra_column].to_numpy(dtype=np.float_), x_min, x_delta, grid_size[0]
+    )
+    y_idxs = _get_bin_idxs(
+        data[dec_column].to_numpy(dtype=np.float_), y_min, y_delta, grid_size[1]
+    )
+    intensities = data[intensity_column].to_numpy(dtype=np.float_)
+
+    valid = (x_idxs >= 0) & (y_idxs >= 0) & (intensities > 0)
+    pixel_idxs = x_idxs[valid] * grid_size[1] + y_idxs[valid]
+    grid = _reduce_grouped(
+        pixel_idxs,
+        intensities[valid],
+        grid_size[0] * grid_size[1],
+        reduction,
+    )
+    return np.nan_to_num(grid.reshape(grid_size))
 
-def _map_radec_datapoints_rows(
-    data: pd.DataFrame,
-    ra_column: str,
-    dec_column: str,
-    intensity_column: str,
-    x_min: float,
-    x_delta: float,
-    y_min: float,
-    y_delta: float,
-    width: int,
-    x_start: int,
-    par_count: int,
-) -> npt.NDArray[np.float_]:
-    grid = np.zeros((par_count, width))
 
-    for x in range(par_count):
-        x_beg = x_min + (x + x_start) * x_delta
-        x_end = x_beg + x_delta
-        ra_filter = (data[ra_column] >= x_beg) & (data[ra_column] < x_end)
+def _get_bin_idxs(
+    values: npt.NDArray[np.float_],
+    v_min: float,
+    v_delta: float,
+    n_bins: int,
+) -> npt.NDArray[np.int_]:
+    """
+    Get the index of the half-open bin [v_min + i*v_delta, v_min + (i+1)*v_delta)
+    of each value, or -1 if a value isn't in any bin.
 
-        for y in range(width):
-            y_beg = y_min + y * y_delta
-            y_end = y_beg + y_delta
-            dec_filter = (data[dec_column] >= y_beg) & (data[dec_column] < y_end)
+    Each bin ends where the next one begins, so a value on a (rounded) bin-edge
+    is in exactly one bin.
+    """
+    bin_begs = v_min + np.arange(n_bins) * v_delta
+    idxs = np.searchsorted(bin_begs, values, side="right") - 1
+    in_bin = (idxs >= 0) & ((idxs < n_bins - 1) | (values < bin_begs[-1] + v_delta))
+    return np.where(in_bin, idxs, -1)
 
-            filt = data.loc[ra_filter & dec_filter, intensity_column]
-            pixel_value = np.median(filt[filt > 0])
-            grid[x, y] = pixel_value
 
-    return grid
+def _reduce_grouped(
+    group_idxs: npt.NDArray[np.int_],
+    values: npt.NDArray[np.float_],
+    n_groups: int,
+    reduction: GridReductionType,
+) -> npt.NDArray[np.float_]:
+    """
+    Reduce `values` per group, groups without values are NaN.
+    """
+    counts = np.bincount(group_idxs, minlength=n_groups)
+    has_values = counts > 0
+    reduced = np.full(n_groups, np.nan)
+    if reduction == "sum":
+        sums = np.bincount(group_idxs, weights=values, minlength=n_groups)
+        reduced[has_values] = sums[has_values]
+    elif reduction == "mean":
+        sums = np.bincount(group_idxs, weights=values, minlength=n_groups)
+        reduced[has_values] = sums[has_values] / counts[has_values]
+    elif reduction == "median":
+        # sorted by group first and by value second, so each group is a sorted
+        # contiguous segment
+        sorted_values = values[np.lexsort((values, group_idxs))]
+        group_counts = counts[has_values]
+        group_starts = np.cumsum(group_counts) - group_counts
+        lower = sorted_values[group_starts + (group_counts - 1) // 2]
+        upper = sorted_values[group_starts + group_counts // 2]
+        reduced[has_values] = (lower + upper) / 2
+    else:
+        raise ValueError(f"Unknown {reduction=}")
+    return reduced
 
 
 SciPyInterpolationModes = Literal[
@@ -4,14 +4,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated, Literal, NamedTuple, Optional
+from typing import TYPE_CHECKING, Annotated, Literal, NamedTuple, Optional
 
 import numpy as np
 import numpy.typing as npt
-import tools21cm as t2c
 
 from karabo.simulation.sky_model import SkyModel
 
+if TYPE_CHECKING:
+    import tools21cm as t2c
+
 
 class XFracDensLoaded(NamedTuple):
     """The Xfrac and dens files loaded into memory."""
@@ -74,6 +76,8 @@ class XFracDensFilePair(NamedTuple):
         XFracDensLoaded
             The loaded files.
         """
+        import tools21cm as t2c
+
         x_file = t2c.XfracFile(self.xfrac_path)
         d_file = t2c.DensityFile(self.dens_path)
 
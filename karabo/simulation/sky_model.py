@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import copy
 import enum
-import math
+import hashlib
+import json
+import os
 import re
+import shutil
+import uuid
 from collections.abc import Hashable, Mapping, Sequence
 from copy import deepcopy
 from dataclasses import dataclass, fields
+from functools import partial
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -25,9 +31,7 @@ from warnings import warn
 
 import dask.array as da
 import h5py
-import matplotlib.pyplot as plt
 import numpy as np
-import oskar
 import pandas as pd
 import xarray as xr
 from astropy import units as u
@@ -37,11 +41,10 @@ from astropy.io.fits import ColDefs
 from astropy.io.fits.fitsrec import FITS_rec
 from astropy.table import Table
 from astropy.units.core import PrefixUnit, Unit, UnitBase
-from astropy.visualization.wcsaxes import SphericalCircle
 from astropy.wcs import WCS
+from dask import compute, delayed  # type: ignore[attr-defined]
 from numpy.typing import NDArray
-from ska_sdp_datamodels.science_data_model.polarisation_model import PolarisationFrame
-from ska_sdp_datamodels.sky_model.sky_model import SkyComponent
+from scipy.spatial import KDTree
 from typing_extensions import assert_never
 from xarray.core.coordinates import DataArrayCoordinates
 
@@ -58,6 +61,7 @@ from karabo.simulation.line_emission_helpers import (
 )
 from karabo.simulator_backend import SimulatorBackend
 from karabo.util._types import (
+    DirPathType,
     FilePathType,
     IntFloat,
     IntFloatList,
@@ -65,11 +69,15 @@ from karabo.util._types import (
     NPFloatLike,
     PrecisionType,
 )
-from karabo.util.hdf5_util import convert_healpix_2_radec, get_healpix_image
-from karabo.util.math_util import get_poisson_disk_sky
+from karabo.util.file_handler import FileHandler, get_file_checksum
+from karabo.util.math_util import get_poisson_disk_sky, long_lat_to_cartesian
 from karabo.util.plotting_util import get_slices
 from karabo.warning import _DEV_ERROR_MSG, KaraboWarning
 
+if TYPE_CHECKING:
+    import oskar
+    from ska_sdp_datamodels.sky_model.sky_model import SkyComponent
+
 StokesType = Literal["Stokes I", "Stokes Q", "Stokes U", "Stokes V"]
 SkySourcesColName = Literal[  # preserve python-var-name compatibility
     "ra",
@@ -109,6 +117,11 @@ _ChunksType = Union[
 ]
 _TSkyModel = TypeVar("_TSkyModel", bound="SkyModel")
 
+_COLUMNAR_STORE_FORMAT = "karabo-sky-columnar"
+_COLUMNAR_STORE_VERSION = 1
+_COLUMNAR_STORE_METADATA = "metadata.json"
+_CATALOG_CACHE_VERSION = 1
+
 
 class Polarisation(enum.Enum):
     STOKES_I = (0,)
@@ -485,6 +498,260 @@ class SkySourcesUnits:
         return ra_dec
 
 
+class SkySpatialIndex:
+    """KD-tree based spatial index over the positions of `SkyModel.sources`.
+
+    The index holds two trees: one over the unit-vectors of the sources on the
+    celestial sphere for exact cone-searches, and one over the plain ra-dec plane
+    for the flat euclidean approximation. Queries return ascending positional
+    indices into `SkyModel.sources`, so they can be used as a drop-in replacement
+    of a full-scan boolean mask.
+
+    The index is immutable. It doesn't track changes of the sources it was built
+    from, therefore `SkyModel` drops it as soon as its `sources` get modified.
+    """
+
+    def __init__(
+        self,
+        ra_deg: NDArray[np.float_],
+        dec_deg: NDArray[np.float_],
+    ) -> None:
+        """Builds the index from ra-dec coordinates.
+
+        Args:
+            ra_deg: Right ascension of each source in deg.
+            dec_deg: Declination of each source in deg.
+        """
+        ra_deg = np.asarray(ra_deg, dtype=np.float64)
+        dec_deg = np.asarray(dec_deg, dtype=np.float64)
+        if ra_deg.shape != dec_deg.shape or ra_deg.ndim != 1:
+            raise KaraboSkyModelError(
+                "`ra_deg` and `dec_deg` must be 1-dimensional and of the same shape, "
+                + f"but are {ra_deg.shape=} and {dec_deg.shape=}."
+            )
+        self.n_sources = ra_deg.shape[0]
+        self._ra_deg = ra_deg
+        self._dec_deg = dec_deg
+        self._unit_tree = KDTree(self._to_unit_vectors(ra_deg, dec_deg))
+        self._flat_tree = KDTree(np.column_stack((ra_deg, dec_deg)))
+
+    @staticmethod
+    def _to_unit_vectors(
+        ra_deg: NDArray[np.float_],
+        dec_deg: NDArray[np.float_],
+    ) -> NDArray[np.float_]:
+        return long_lat_to_cartesian(lat=dec_deg, lon=ra_deg)
+
+    @staticmethod
+    def _chord_length(radius_deg: IntFloat) -> float:
+        """Converts an angular radius into the chord-length on the unit-sphere."""
+        radius_rad = np.radians(min(max(float(radius_deg), 0.0), 180.0))
+        return float(2 * np.sin(radius_rad / 2))
+
+    def query_radius(
+        self,
+        inner_radius_deg: IntFloat,
+        outer_radius_deg: IntFloat,
+        ra0_deg: IntFloat,
+        dec0_deg: IntFloat,
+    ) -> NDArray[np.int_]:
+        """Gets the indices of the sources within an annulus on the sphere.
+
+        Args:
+            inner_radius_deg: Inner radius in degrees (inclusive).
+            outer_radius_deg: Outer radius in degrees (inclusive).
+            ra0_deg: Center right ascension in degrees.
+            dec0_deg: Center declination in degrees.
+
+        Returns:
+            Ascending indices of the sources inside the annulus.
+        """
+        center = self._to_unit_vectors(
+            np.array([ra0_deg], dtype=np.float64),
+            np.array([dec0_deg], dtype=np.float64),
+        )[0]
+        idxs = np.asarray(
+            self._unit_tree.query_ball_point(
+                center, r=self._chord_length(outer_radius_deg)
+            ),
+            dtype=np.int_,
+        )
+        if inner_radius_deg > 0 and idxs.shape[0] > 0:
+            chords = np.linalg.norm(self._unit_tree.data[idxs] - center, axis=1)
+            idxs = idxs[chords >= self._chord_length(inner_radius_deg)]
+        return np.sort(idxs)
+
+    def query_radius_euclidean_flat_approximation(
+        self,
+        inner_radius_deg: IntFloat,
+        outer_radius_deg: IntFloat,
+        ra0_deg: IntFloat,
+        dec0_deg: IntFloat,
+    ) -> NDArray[np.int_]:
+        """Gets the indices of the sources within an annulus of the ra-dec plane.
+
+        Uses the same flat euclidean approximation as
+        `SkyModel.filter_by_radius_euclidean_flat_approximation`.
+
+        Args:
+            inner_radius_deg: Inner radius in degrees (inclusive).
+            outer_radius_deg: Outer radius in degrees (inclusive).
+            ra0_deg: Center right ascension in degrees.
+            dec0_deg: Center declination in degrees.
+
+        Returns:
+            Ascending indices of the sources inside the annulus.
+        """
+        cos_dec0 = float(np.cos(np.radians(dec0_deg)))
+        if abs(cos_dec0) > 1e-12:
+            # bounding-box of the ellipse in the ra-dec plane, dec half-width is
+            # always smaller or equal than the ra half-width
+            box_radius = outer_radius_deg / abs(cos_dec0)
+            idxs = np.asarray(
+                self._flat_tree.query_ball_point(
+                    np.array([ra0_deg, dec0_deg], dtype=np.float64),
+                    r=box_radius,
+                    p=np.inf,
+                ),
+                dtype=np.int_,
+            )
+        else:
+            idxs = np.arange(self.n_sources, dtype=np.int_)
+        x = (self._ra_deg[idxs] - ra0_deg) * cos_dec0
+        y = self._dec_deg[idxs] - dec0_deg
+        distances_sq = np.square(x) + np.square(y)
+        mask = (distances_sq >= np.square(inner_radius_deg)) & (
+            distances_sq <= np.square(outer_radius_deg)
+        )
+        return np.sort(idxs[mask])
+
+
+def _radec_block_to_cartesian(radec: NDArray[np.float_]) -> NDArray[np.float_]:
+    """Converts a (n, 2) RA/DEC [deg] block into (n, 3) cartesian unit-vectors."""
+    radec = np.asarray(radec, dtype=np.float_)
+    return long_lat_to_cartesian(lat=radec[:, 1], lon=radec[:, 0])
+
+
+def _write_columnar_store_chunk(
+    block: NDArray[np.float_],
+    path: str,
+    col_names: List[str],
+    chunk_idx: int,
+) -> None:
+    """Writes each column of a row-chunk of `SkyModel.sources` into its own file.
+
+    Args:
+        block: Row-chunk of `SkyModel.sources` containing all columns.
+        path: Root-directory of the columnar store.
+        col_names: Column-names according to the col-order of `block`.
+        chunk_idx: Index of the row-chunk.
+    """
+    for col_idx, col_name in enumerate(col_names):
+        np.save(
+            os.path.join(path, col_name, f"{chunk_idx}.npy"),
+            np.ascontiguousarray(block[:, col_idx]),
+        )
+
+
+class _ColumnarStoreLoader:
+    """Memory-maps the chunk-files of a columnar store column.
+
+    Each lazy chunk references the loader, so the loader lives as long as any
+    (derived) dask-array of the column. It pins the column's dir for that long,
+    which protects stores in the disk-cache from eviction while they're in use.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        FileHandler.pin(path=path, obj=self)
+
+    def __call__(self, file_name: str) -> NDArray[Any]:
+        return np.load(os.path.join(self.path, file_name), mmap_mode="r")
+
+
+def _open_columnar_store_column(
+    path: str,
+    chunks: Tuple[int, ...],
+    dtype: np.dtype[Any],
+) -> da.Array:
+    """Opens a single column of a columnar store lazily as a memory-mapped array.
+
+    Args:
+        path: Directory of the column.
+        chunks: Number of sources of each row-chunk.
+        dtype: Data-type of the column.
+
+    Returns:
+        Lazy column, where each chunk gets memory-mapped on access.
+    """
+    loader = _ColumnarStoreLoader(path=path)
+    blocks = [
+        da.from_delayed(  # type: ignore[attr-defined]
+            delayed(loader)(f"{i}.npy"),
+            shape=(chunk,),
+            dtype=dtype,
+        )
+        for i, chunk in enumerate(chunks)
+    ]
+    return da.concatenate(blocks)  # type: ignore[attr-defined,no-any-return]
+
+
+class SkyColumnIndex:
+    """Sorted index over a single column of `SkyModel.sources`.
+
+    The index holds the permutation which sorts the column, so a value-range of the
+    column maps to a contiguous range of that permutation, found by binary search.
+    Range queries therefore cost O(log N + k) instead of a full scan over N sources.
+
+    Like `SkySpatialIndex`, the index is immutable and `SkyModel` drops it as soon
+    as its `sources` get modified.
+    """
+
+    def __init__(self, values: NDArray[np.float_], col_idx: int) -> None:
+        """Builds the index by sorting `values`.
+
+        Args:
+            values: Column values of each source.
+            col_idx: Column of `SkyModel.sources` the values are from.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 1:
+            raise KaraboSkyModelError(
+                f"`values` must be 1-dimensional, but is of shape {values.shape}."
+            )
+        self.col_idx = col_idx
+        self.n_sources = values.shape[0]
+        self.order = np.argsort(values, kind="stable")
+        self.sorted_values = values[self.order]
+
+    def range_bounds(self, min_val: IntFloat, max_val: IntFloat) -> Tuple[int, int]:
+        """Gets the bounds of `min_val` <= value <= `max_val` in the sorted column.
+
+        Args:
+            min_val: Minimum value (inclusive).
+            max_val: Maximum value (inclusive).
+
+        Returns:
+            (start, stop) positions of the range in `sorted_values` and `order`.
+        """
+        start = int(np.searchsorted(self.sorted_values, min_val, side="left"))
+        stop = int(np.searchsorted(self.sorted_values, max_val, side="right"))
+        return start, max(start, stop)
+
+    def query_range(self, min_val: IntFloat, max_val: IntFloat) -> NDArray[np.int_]:
+        """Gets the indices of the sources where `min_val` <= value <= `max_val`.
+
+        Args:
+            min_val: Minimum value (inclusive).
+            max_val: Maximum value (inclusive).
+
+        Returns:
+            Ascending indices of the selected sources of `SkyModel.sources`.
+        """
+        start, stop = self.range_bounds(min_val=min_val, max_val=max_val)
+        return np.sort(self.order[start:stop])
+
+
 XARRAY_DIM_0_DEFAULT, XARRAY_DIM_1_DEFAULT = cast(
     Tuple[str, str], xr.DataArray([[]]).dims
 )
@@ -591,6 +858,8 @@ class SkyModel:
         self.__sources_dim_sources = XARRAY_DIM_0_DEFAULT
         self.__sources_dim_data = XARRAY_DIM_1_DEFAULT
         self._sources: Optional[xr.DataArray] = None
+        self._spatial_index: Optional[SkySpatialIndex] = None
+        self._column_indices: Dict[int, SkyColumnIndex] = {}
         self.precision = precision
         self.wcs = wcs
         self.sources = sources  # type: ignore [assignment]
@@ -630,13 +899,122 @@ class SkyModel:
             sky.h5_file_connection = None
         else:
             h5_connection = None
+        # the indices are immutable and therefore shared instead of copied
+        spatial_index, column_indices = sky._spatial_index, sky._column_indices
+        sky._spatial_index, sky._column_indices = None, {}
 
         copied_sky = copy.deepcopy(sky)
         if h5_connection is not None:
+            sky.h5_file_connection = h5_connection
             copied_sky.h5_file_connection = h5_connection
+        sky._spatial_index, sky._column_indices = spatial_index, column_indices
+        copied_sky._spatial_index = spatial_index
+        copied_sky._column_indices = dict(column_indices)
 
         return copied_sky
 
+    @property
+    def spatial_index(self) -> Optional[SkySpatialIndex]:
+        """The spatial-index of `sources` if built, otherwise None."""
+        return self._spatial_index
+
+    def build_spatial_index(self) -> SkySpatialIndex:
+        """Builds a spatial-index over the positions of `sources`.
+
+        Once built, `filter_by_radius` and
+        `filter_by_radius_euclidean_flat_approximation` turn into index lookups
+        instead of full scans over all sources. This pays off as soon as the
+        same sky gets filtered multiple times, e.g. for each pointing and channel.
+
+        Only the ra-dec columns get loaded into memory to build the index. The index
+        gets dropped if `sources` get modified afterwards.
+
+        Returns:
+            The built spatial-index, which is also available at `spatial_index`.
+        """
+        if self.sources is None:
+            raise KaraboSkyModelError(
+                "`sources` is None, add sources before calling `build_spatial_index`."
+            )
+        ra_dec = self.sources[:, 0:2].to_numpy()
+        self._spatial_index = SkySpatialIndex(ra_deg=ra_dec[:, 0], dec_deg=ra_dec[:, 1])
+        return self._spatial_index
+
+    def get_column_index(self, col_idx: int) -> Optional[SkyColumnIndex]:
+        """Gets the sorted index of column `col_idx` if built, otherwise None."""
+        return self._column_indices.get(col_idx)
+
+    def build_column_index(self, col_idx: int) -> SkyColumnIndex:
+        """Builds a sorted index over column `col_idx` of `sources`.
+
+        Once built, range-filters on that column through `query` turn into binary
+        searches instead of full scans over all sources. Only the column gets
+        loaded into memory to build the index. The index gets dropped if `sources`
+        get modified afterwards.
+
+        Args:
+            col_idx: Column to index, e.g. 13 for the observed redshift.
+
+        Returns:
+            The built column-index, also available at `get_column_index`.
+        """
+        if self.sources is None:
+            raise KaraboSkyModelError(
+                "`sources` is None, add sources before calling `build_column_index`."
+            )
+        self._column_indices[col_idx] = SkyColumnIndex(
+            values=self.sources[:, col_idx].to_numpy(), col_idx=col_idx
+        )
+        return self._column_indices[col_idx]
+
+    def partition_by_column(
+        self,
+        col_idx: int,
+        edges: Union[Sequence[IntFloat], NDArray[np.float_]],
+    ) -> List[SkyModel]:
+        """Partitions the sky into the bins of `edges` along column `col_idx`.
+
+        The column gets sorted once (see `build_column_index`), after which the
+        sources of each bin are a contiguous slice of the sorted index, found by
+        binary search. This replaces one full `filter_by_column` scan per bin, e.g.
+        per frequency channel of a line-emission simulation.
+
+        Like `filter_by_column`, the bounds of each bin are inclusive, so sources
+        exactly on an edge belong to both adjacent bins.
+
+        Args:
+            col_idx: Column to partition by, e.g. 13 for the observed redshift.
+            edges: Bin-edges, monotonic increasing or decreasing. Bin i is bounded
+                by edges i and i+1.
+
+        Returns:
+            A sky for each bin, with the sources in the order of this sky. Skies of
+            a dask-backed sky stay lazy, and computing one only reads the blocks
+            holding the sources of its bin.
+        """
+        if self.sources is None:
+            raise KaraboSkyModelError(
+                "`sources` is None, add sources before partitioning."
+            )
+        index = self.get_column_index(col_idx)
+        if index is None:
+            index = self.build_column_index(col_idx)
+        skies: List[SkyModel] = []
+        for lower, upper in zip(edges[:-1], edges[1:]):
+            start, stop = index.range_bounds(
+                min_val=min(lower, upper), max_val=max(lower, upper)
+            )
+            # ascending, so a lazy sky takes its sources block by block
+            idxs = np.sort(index.order[start:stop])
+            sky = type(self)(
+                sources=self.rechunk_array_based_on_self(self.sources[idxs]),
+                wcs=copy.deepcopy(self.wcs),
+                precision=self.precision,
+                h5_file_connection=self.h5_file_connection,
+            )
+            skies.append(sky)
+        return skies
+
     def compute(self) -> None:
         """
         Loads the lazy data into a numpy array, wrapped in a xarray.DataArray.
@@ -783,6 +1161,8 @@ class SkyModel:
                 )
             else:
                 self._sources = sky_sources
+            self._spatial_index = None
+            self._column_indices = {}
         except BaseException:  # rollback of dim-names if sth goes wrong
             self._sources_dim_sources, self._sources_dim_data = sds, sdd
             raise
@@ -910,12 +1290,30 @@ class SkyModel:
         :param indices: Optional parameter, if set to True,
         we also return the indices of the filtered sky copy
         :return sky: Filtered copy of the sky
+
+        If a spatial-index exists (see `build_spatial_index`), the filtering is an
+        index lookup instead of a full scan.
         """
         copied_sky = SkyModel.copy_sky(self)
         if copied_sky.sources is None:
             raise KaraboSkyModelError(
                 "`sources` is None, add sources before calling `filter_by_radius`."
             )
+        if self._spatial_index is not None:
+            filtered_sources_idxs = self._spatial_index.query_radius(
+                inner_radius_deg=inner_radius_deg,
+                outer_radius_deg=outer_radius_deg,
+                ra0_deg=ra0_deg,
+                dec0_deg=dec0_deg,
+            )
+            copied_sky.sources = copied_sky.sources[filtered_sources_idxs]
+            copied_sky.sources = self.rechunk_array_based_on_self(copied_sky.sources)
+            if indices:
+                return copied_sky, filtered_sources_idxs
+            else:
+                return copied_sky
+        from astropy.visualization.wcsaxes import SphericalCircle
+
         inner_circle = SphericalCircle(
             (ra0_deg * u.deg, dec0_deg * u.deg),
             inner_radius_deg * u.deg,
@@ -1014,6 +1412,9 @@ class SkyModel:
         calculation is not feasible due to memory constraints. It is particularly
         beneficial when working with Xarray and Dask, facilitating scalable data
         analysis on datasets that are too large to fit into memory.
+
+        If a spatial-index exists (see `build_spatial_index`), the filtering is an
+        index lookup instead of a full scan.
         """
         copied_sky = SkyModel.copy_sky(self)
 
@@ -1022,6 +1423,22 @@ class SkyModel:
                 "`sources` is None, add sources before calling `filter_by_radius`."
             )
 
+        if self._spatial_index is not None:
+            filtered_indices = (
+                self._spatial_index.query_radius_euclidean_flat_approximation(
+                    inner_radius_deg=inner_radius_deg,
+                    outer_radius_deg=outer_radius_deg,
+                    ra0_deg=ra0_deg,
+                    dec0_deg=dec0_deg,
+                )
+            )
+            copied_sky.sources = copied_sky.sources[filtered_indices]
+            copied_sky.sources = self.rechunk_array_based_on_self(copied_sky.sources)
+            if indices:
+                return copied_sky, filtered_indices
+            else:
+                return copied_sky
+
         # Calculate distances to phase center using flat Euclidean approximation
         x = (copied_sky[:, 0] - ra0_deg) * np.cos(np.radians(dec0_deg))
         y = copied_sky[:, 1] - dec0_deg
@@ -1044,6 +1461,26 @@ class SkyModel:
         else:
             return copied_sky
 
+    def query(self) -> SkyQuery:
+        """Creates a deferred query to filter `sources` without intermediate copies.
+
+        In contrast to chaining the `filter_by_*` methods, which copy and scan the
+        sky once per step, the predicates of a `SkyQuery` get composed and evaluated
+        in a single pass over `sources` (chunk by chunk if dask-backed).
+
+        Example:
+            filtered_sky = (
+                sky.query()
+                .filter_by_radius(0, 1, ra0_deg=20, dec0_deg=-30)
+                .filter_by_flux(1e-3, 1)
+                .to_sky_model()
+            )
+
+        Returns:
+            Empty query on `self`.
+        """
+        return SkyQuery(sky=self)
+
     def filter_by_column(
         self,
         col_idx: int,
@@ -1186,6 +1623,8 @@ class SkyModel:
         :param kwargs: matplotlib kwargs for scatter & Collections, e.g. customize `s`,
                        `vmin` or `vmax`
         """
+        import matplotlib.pyplot as plt
+
         # To avoid having to read the data multiple times, we read it once here
         if self.sources is None:
             raise KaraboSkyModelError("Can't plot sky if `sources` is None.")
@@ -1291,6 +1730,8 @@ class SkyModel:
 
         :return: oskar sky model
         """
+        import oskar
+
         if sky.shape[1] > 12:
             return oskar.Sky.from_array(sky[:, :12], precision)
         else:
@@ -1312,6 +1753,8 @@ class SkyModel:
         :param polarisation: 0 = Stokes I, 1 = Stokes Q, 2 = Stokes U, 3 = Stokes  V
         :return:
         """
+        from karabo.util.hdf5_util import convert_healpix_2_radec, get_healpix_image
+
         arr = get_healpix_image(file)
         filtered = arr[channel][polarisation.value]
         ra, dec, nside = convert_healpix_2_radec(filtered)
@@ -1348,6 +1791,8 @@ class SkyModel:
             value: sources, `xarray.DataArray` or `np.ndarray`
         """
         self._sources = None
+        self._spatial_index = None
+        self._column_indices = {}
         self._sources_dim_sources = XARRAY_DIM_0_DEFAULT
         self._sources_dim_data = XARRAY_DIM_1_DEFAULT
         if value is not None:
@@ -1460,6 +1905,8 @@ class SkyModel:
             raise KaraboSkyModelError("Can't acces `sources` because it's None.")
         # access `sources.getter`, not `sources.setter` which is fine
         self.sources[key] = value
+        self._spatial_index = None
+        self._column_indices = {}
 
     def save_sky_model_as_csv(self, path: str) -> None:
         """
@@ -1492,31 +1939,192 @@ class SkyModel:
             ],
         )
 
-    @staticmethod
-    def __convert_ra_dec_to_cartesian(
-        ra: IntFloat, dec: IntFloat
-    ) -> NDArray[np.float_]:
-        x = math.cos(math.radians(ra)) * math.cos(math.radians(dec))
-        y = math.sin(math.radians(ra)) * math.cos(math.radians(dec))
-        z = math.sin(math.radians(dec))
-        r = np.array([x, y, z])
-        norm = cast(np.float_, np.linalg.norm(r))
-        if norm == 0:
-            return r
-        return r / norm
+    def save_sky_model_as_columnar_store(
+        self,
+        path: DirPathType,
+        chunk_size: Optional[int] = None,
+        overwrite: bool = False,
+    ) -> None:
+        """Saves `sources` as a column-oriented and chunked directory of .npy files.
+
+        Each column of `sources` (and the source-ids if available) is stored in its
+        own sub-directory, split into row-chunks. In contrast to
+        `save_sky_model_as_csv`, the values are stored binary without any loss of
+        precision, and the store can be opened lazily and memory-mapped through
+        `get_sky_model_from_columnar_store`, which also supports loading just a
+        subset of the columns. `wcs` and `precision` are stored in the metadata.
+
+        Dask-backed `sources` are written chunk by chunk, without loading the
+        entire sky into memory.
+
+        Args:
+            path: Directory to create the store in.
+            chunk_size: Number of sources per chunk. Defaults to the chunks of
+                dask-backed `sources`, or to a single chunk otherwise.
+            overwrite: Overwrite `path` if it already exists?
+        """
+        if self.sources is None:
+            raise KaraboSkyModelError("Can't save `sources` because they're None.")
+        path = str(path)
+        if os.path.exists(path):
+            if not overwrite:
+                raise FileExistsError(f"{path} already exists.")
+            shutil.rmtree(path)
+        sds, sdd = self._sources_dim_sources, self._sources_dim_data
+        if chunk_size is not None:
+            sources = self.sources.chunk({sds: chunk_size, sdd: -1})
+        elif self.sources.chunks is not None:
+            sources = self.sources.chunk({sdd: -1})
+        else:
+            sources = self.sources.chunk({sds: -1, sdd: -1})
+        data = cast(da.Array, sources.data)
+        row_chunks = tuple(int(chunk) for chunk in data.chunks[0])
+        col_names: List[str] = [
+            self.COL_NAME[col_idx] for col_idx in range(self.SOURCES_COLS)
+        ]
+
+        os.makedirs(path)
+        for col_name in col_names:
+            os.makedirs(os.path.join(path, col_name))
+        writes = [
+            delayed(_write_columnar_store_chunk)(block, path, col_names, chunk_idx)
+            for chunk_idx, block in enumerate(data.to_delayed()[:, 0])
+        ]
+        compute(*writes)
+
+        id_dtype: Optional[str] = None
+        if self.source_ids is not None:
+            ids = self.source_ids[sds].to_numpy()
+            if ids.dtype == np.object_:
+                ids = ids.astype(str)
+            id_dtype = ids.dtype.str
+            os.makedirs(os.path.join(path, "id"))
+            start = 0
+            for chunk_idx, chunk in enumerate(row_chunks):
+                np.save(
+                    os.path.join(path, "id", f"{chunk_idx}.npy"),
+                    ids[start : start + chunk],
+                )
+                start += chunk
+
+        metadata = {
+            "format": _COLUMNAR_STORE_FORMAT,
+            "version": _COLUMNAR_STORE_VERSION,
+            "num_sources": int(sum(row_chunks)),
+            "chunks": row_chunks,
+            "dtype": data.dtype.str,
+            "columns": col_names,
+            "dims": [sds, sdd],
+            "id_dtype": id_dtype,
+            "precision": np.dtype(self.precision).str,
+            "wcs": None if self.wcs is None else self.wcs.to_header_string(),
+        }
+        with open(os.path.join(path, _COLUMNAR_STORE_METADATA), "w") as f:
+            json.dump(metadata, f)
+
+    @classmethod
+    def get_sky_model_from_columnar_store(
+        cls: Type[_TSkyModel],
+        path: DirPathType,
+        columns: Optional[Sequence[SkySourcesColName]] = None,
+        load_as: Literal["numpy_array", "dask_array"] = "dask_array",
+    ) -> _TSkyModel:
+        """Opens a sky-model store created by `save_sky_model_as_columnar_store`.
+
+        The chunks of each column are memory-mapped lazily, so only the chunks
+        needed by subsequent filtering or computations are read from disk.
+
+        Args:
+            path: Directory of the store.
+            columns: Columns to load. Not loaded columns of `SkyModel.sources` are
+                filled with zeros. Loads all columns (including the source-ids if
+                available) if None.
+            load_as: What type of array to load the data inside the xarray
+                DataArray as. "numpy_array" loads the selected columns into memory.
+
+        Returns:
+            Sky-model with the sources, `wcs` and `precision` of the store.
+        """
+        path = str(path)
+        metadata_path = os.path.join(path, _COLUMNAR_STORE_METADATA)
+        if not os.path.exists(metadata_path):
+            raise KaraboSkyModelError(f"{path} is not a columnar sky-model store.")
+        with open(metadata_path, "r") as f:
+            metadata = json.load(f)
+        if (
+            metadata.get("format") != _COLUMNAR_STORE_FORMAT
+            or metadata.get("version") != _COLUMNAR_STORE_VERSION
+        ):
+            raise KaraboSkyModelError(
+                f"{path} has an unsupported store-format: {metadata.get('format')} "
+                + f"version {metadata.get('version')}."
+            )
+        if columns is None:
+            columns = list(cls.COL_IDX.keys())
+        elif len(unknown := set(columns) - set(cls.COL_IDX.keys())) > 0:
+            raise KaraboSkyModelError(f"Unknown columns {unknown} requested.")
+        chunks = tuple(int(chunk) for chunk in metadata["chunks"])
+        dtype = np.dtype(metadata["dtype"])
+        dim_sources, dim_data = metadata["dims"]
+
+        col_arrays: List[da.Array] = []
+        for col_idx in range(cls.SOURCES_COLS):
+            col_name = cls.COL_NAME[col_idx]
+            if col_name in columns:
+                col_array = _open_columnar_store_column(
+                    path=os.path.join(path, col_name),
+                    chunks=chunks,
+                    dtype=dtype,
+                )
+            else:
+                col_array = da.zeros(  # type: ignore[attr-defined]
+                    (sum(chunks),), chunks=(chunks,), dtype=dtype
+                )
+            col_arrays.append(col_array)
+        data = da.stack(col_arrays, axis=1).rechunk(  # type: ignore[attr-defined]
+            {1: -1}
+        )
+        if load_as == "numpy_array":
+            data = data.compute()
+        sources = xr.DataArray(data, dims=[dim_sources, dim_data])
+        if "id" in columns and metadata["id_dtype"] is not None:
+            sources.coords[dim_sources] = np.concatenate(
+                [
+                    np.load(os.path.join(path, "id", f"{i}.npy"))
+                    for i in range(len(chunks))
+                ]
+            )
+        # stores written before `precision` & `wcs` were stored have the defaults
+        wcs: Optional[WCS] = None
+        if (wcs_header := metadata.get("wcs")) is not None:
+            wcs = WCS(fits.Header.fromstring(wcs_header))
+        precision = np.dtype(metadata.get("precision", np.dtype(np.float64).str))
+        return cls(
+            sources=sources,
+            wcs=wcs,
+            precision=cast(Type[np.float_], precision.type),
+        )
 
     def get_cartesian_sky(self) -> NDArray[np.float_]:
+        """Converts the RA/DEC of each source into a cartesian unit-vector.
+
+        The conversion is vectorized and, for dask-backed skies, done blockwise.
+
+        Returns:
+            Unit-vectors of shape (n_sources, 3).
+        """
         if self.sources is None:
             raise AttributeError("Can't create cartesian-sky when `sources` is None.")
-        cartesian_sky = np.squeeze(
-            np.apply_along_axis(
-                lambda row: [
-                    self.__convert_ra_dec_to_cartesian(float(row[0]), float(row[1]))
-                ],
-                axis=1,
-                arr=self.sources,
+        radec = self.sources[:, :2].data
+        if isinstance(radec, da.Array):
+            radec = radec.rechunk({1: -1}).map_blocks(
+                _radec_block_to_cartesian,
+                chunks=(radec.chunks[0], (3,)),
+                dtype=np.float_,
             )
-        )
+            cartesian_sky = np.asarray(radec.compute())
+        else:
+            cartesian_sky = _radec_block_to_cartesian(radec)
         return cartesian_sky
 
     @classmethod
@@ -1896,11 +2504,74 @@ class SkyModel:
             )
         return sky
 
+    @classmethod
+    def _get_cached_catalog_sky(
+        cls: Type[_TSkyModel],
+        survey_file: FilePathType,
+        loader: str,
+        loader_args: Dict[str, Any],
+        load: Callable[[], _TSkyModel],
+        use_cache: bool = True,
+    ) -> _TSkyModel:
+        """Loads a survey-catalog through the long-term catalog-cache.
+
+        The parsed sky of `load` is stored as a columnar store (see
+        `save_sky_model_as_columnar_store`) in the LTM, keyed by the checksum of
+        `survey_file`, `loader` and `loader_args`. Subsequent loads just memory-map
+        the stored columns, which is also possible from multiple processes.
+
+        Args:
+            survey_file: The catalog-file `load` parses.
+            loader: Name of the loader, part of the cache-key.
+            loader_args: Arguments of the loader, part of the cache-key. Values
+                must be json-serializable.
+            load: Parses `survey_file` into a sky-model on a cache-miss.
+            use_cache: If False, just calls `load`.
+
+        Returns:
+            The (cached) sky-model. If `use_cache`, its `sources` are a lazy dask-array
+            memory-mapped from the cache, also on a cache-miss. `wcs` and `precision`
+            are the ones of the parsed sky.
+        """
+        if not use_cache:
+            return load()
+        cache_dir = FileHandler().get_tmp_dir(
+            prefix="sky-catalog-cache-",
+            term="long",
+        )
+        key_content = json.dumps(
+            {
+                "version": _CATALOG_CACHE_VERSION,
+                "checksum": get_file_checksum(survey_file),
+                "loader": loader,
+                "args": loader_args,
+            },
+            sort_keys=True,
+        )
+        key = hashlib.sha256(key_content.encode()).hexdigest()
+        store_path = os.path.join(cache_dir, key)
+        if not os.path.exists(os.path.join(store_path, _COLUMNAR_STORE_METADATA)):
+            sky = load()
+            # write to a tmp-dir first to not expose incomplete stores to
+            # concurrent processes
+            tmp_store_path = f"{store_path}.tmp-{uuid.uuid4().hex}"
+            try:
+                sky.save_sky_model_as_columnar_store(tmp_store_path)
+                os.rename(tmp_store_path, store_path)
+            except OSError:
+                if not os.path.exists(store_path):
+                    raise
+            finally:
+                if os.path.exists(tmp_store_path):
+                    shutil.rmtree(tmp_store_path)
+        return cls.get_sky_model_from_columnar_store(store_path)
+
     @classmethod
     def get_GLEAM_Sky(
         cls: Type[_TSkyModel],
         min_freq: Optional[float] = None,
         max_freq: Optional[float] = None,
+        use_cache: bool = True,
     ) -> _TSkyModel:
         """Creates a SkyModel containing GLEAM sources from
         https://vizier.cfa.harvard.edu/ service with more than 300,000 sources
@@ -1911,11 +2582,15 @@ class SkyModel:
 
         GLEAM's frequency-range: 72-231 MHz
 
-        The required .fits file will get downloaded and cached on disk.
+        The required .fits file will get downloaded and cached on disk. The parsed
+        sky is cached on disk as well.
 
         Args:
             min_freq: Set min-frequency in Hz for pre-filtering.
             max_freq: Set max-frequency in Hz for pre-filtering.
+            use_cache: Load the parsed sky from (or store it in) the catalog-cache?
+                If so, `sources` are a lazy dask-array memory-mapped from the cache,
+                use `SkyModel.compute` to load them into memory.
 
         Returns:
             GLEAM sky as `SkyModel`.
@@ -1941,27 +2616,42 @@ class SkyModel:
             stokes_i=u.Jy / u.beam,
         )
 
-        return cls.get_sky_model_from_fits(
-            fits_file=survey_file,
-            prefix_mapping=prefix_mapping,
-            unit_mapping=unit_mapping,
-            units_sources=units_sources,
-            min_freq=min_freq,
-            max_freq=max_freq,
-            encoded_freq=encoded_freq,
+        return cls._get_cached_catalog_sky(
+            survey_file=survey_file,
+            loader=f"{cls.__name__}.get_GLEAM_Sky",
+            loader_args={"min_freq": min_freq, "max_freq": max_freq},
+            load=lambda: cls.get_sky_model_from_fits(
+                fits_file=survey_file,
+                prefix_mapping=prefix_mapping,
+                unit_mapping=unit_mapping,
+                units_sources=units_sources,
+                min_freq=min_freq,
+                max_freq=max_freq,
+                encoded_freq=encoded_freq,
+            ),
+            use_cache=use_cache,
         )
 
     @classmethod
-    def get_sample_simulated_catalog(cls: Type[_TSkyModel]) -> _TSkyModel:
+    def get_sample_simulated_catalog(
+        cls: Type[_TSkyModel],
+        use_cache: bool = True,
+    ) -> _TSkyModel:
         """
         Downloads a sample simulated HI source catalog and generates a sky
         model using the downloaded data. The catalog size is around 8MB.
+        The generated sky model is cached on disk.
 
         Source:
         The simulated catalog data was provided by Luis Machado
         (https://github.com/lmachadopolettivalle) in collaboration
         with the ETHZ Cosmology Research Group.
 
+        Args:
+            use_cache: Load the sky from (or store it in) the catalog-cache?
+                If so, `sources` are a lazy dask-array memory-mapped from the cache,
+                use `SkyModel.compute` to load them into memory.
+
         Returns:
             SkyModel: The corresponding sky model.
             The sky model contains the following information:
@@ -1981,7 +2671,13 @@ class SkyModel:
         """
         survey = HISourcesSmallCatalogDownloadObject()
         path = survey.get()
-        sky = cls.get_sky_model_from_h5_to_xarray(path=path)
+        sky = cls._get_cached_catalog_sky(
+            survey_file=path,
+            loader=f"{cls.__name__}.get_sample_simulated_catalog",
+            loader_args={},
+            load=lambda: cls.get_sky_model_from_h5_to_xarray(path=path),
+            use_cache=use_cache,
+        )
         if sky.sources is None:
             raise KaraboSkyModelError("`sky.sources` is None, which is unexpected.")
 
@@ -1992,6 +2688,7 @@ class SkyModel:
         cls: Type[_TSkyModel],
         min_freq: Optional[float] = None,
         max_freq: Optional[float] = None,
+        use_cache: bool = True,
     ) -> _TSkyModel:
         """Creates a SkyModel containing "MIGHTEE Continuum Early Science L1 catalogue"
         sources from https://archive.sarao.ac.za service, consisting of 9896 sources.
@@ -2001,11 +2698,15 @@ class SkyModel:
 
         MIGHTEES's frequency-range: 1304-1375 MHz
 
-        The required .fits file will get downloaded and cached on disk.
+        The required .fits file will get downloaded and cached on disk. The parsed
+        sky is cached on disk as well.
 
         Args:
             min_freq: Set min-frequency in Hz for pre-filtering.
             max_freq: Set max-frequency in Hz for pre-filtering.
+            use_cache: Load the parsed sky from (or store it in) the catalog-cache?
+                If so, `sources` are a lazy dask-array memory-mapped from the cache,
+                use `SkyModel.compute` to load them into memory.
 
         Returns:
             MIGHTEE sky as `SkyModel`.
@@ -2030,15 +2731,21 @@ class SkyModel:
         units_sources = SkySourcesUnits(
             stokes_i=u.Jy / u.beam,
         )
-        return cls.get_sky_model_from_fits(
-            fits_file=survey_file,
-            prefix_mapping=prefix_mapping,
-            unit_mapping=unit_mapping,
-            units_sources=units_sources,
-            min_freq=min_freq,
-            max_freq=max_freq,
-            encoded_freq=None,
-            memmap=False,
+        return cls._get_cached_catalog_sky(
+            survey_file=survey_file,
+            loader=f"{cls.__name__}.get_MIGHTEE_Sky",
+            loader_args={"min_freq": min_freq, "max_freq": max_freq},
+            load=lambda: cls.get_sky_model_from_fits(
+                fits_file=survey_file,
+                prefix_mapping=prefix_mapping,
+                unit_mapping=unit_mapping,
+                units_sources=units_sources,
+                min_freq=min_freq,
+                max_freq=max_freq,
+                encoded_freq=None,
+                memmap=False,
+            ),
+            use_cache=use_cache,
         )
 
     @classmethod
@@ -2046,6 +2753,7 @@ class SkyModel:
         cls: Type[_TSkyModel],
         min_freq: Optional[float] = None,
         max_freq: Optional[float] = None,
+        use_cache: bool = True,
     ) -> _TSkyModel:
         """Creates a SkyModel containing "MALS V3" catalogue, of 715,760 sources,
         where the catalogue and it's information are from 'https://mals.iucaa.in/'.
@@ -2065,9 +2773,14 @@ class SkyModel:
         - If you describe MALS or associated science, please cite 'Gupta et al. 2016'.
         - If you use DR1 data products, please cite 'Deka et al. 2024'.
 
+        The parsed sky is cached on disk.
+
         Args:
             min_freq: Set min-frequency in Hz for pre-filtering.
             max_freq: Set max-frequency in Hz for pre-filtering.
+            use_cache: Load the parsed sky from (or store it in) the catalog-cache?
+                If so, `sources` are a lazy dask-array memory-mapped from the cache,
+                use `SkyModel.compute` to load them into memory.
 
         Returns:
             MALS sky as `SkyModel`.
@@ -2092,13 +2805,19 @@ class SkyModel:
         unit_sources = SkySourcesUnits(
             stokes_i=u.Jy / u.beam,
         )
-        return cls.get_sky_model_from_fits(
-            fits_file=survey_file,
-            prefix_mapping=prefix_mapping,
-            unit_mapping=unit_mapping,
-            units_sources=unit_sources,
-            min_freq=min_freq,
-            max_freq=max_freq,
+        return cls._get_cached_catalog_sky(
+            survey_file=survey_file,
+            loader=f"{cls.__name__}.get_MALS_DR1V3_Sky",
+            loader_args={"min_freq": min_freq, "max_freq": max_freq},
+            load=lambda: cls.get_sky_model_from_fits(
+                fits_file=survey_file,
+                prefix_mapping=prefix_mapping,
+                unit_mapping=unit_mapping,
+                units_sources=unit_sources,
+                min_freq=min_freq,
+                max_freq=max_freq,
+            ),
+            use_cache=use_cache,
         )
 
     @classmethod
@@ -2139,6 +2858,104 @@ class SkyModel:
 
         return sky
 
+    def _get_rascil_point_source_arrays(
+        self,
+        desired_frequencies_hz: NDArray[np.float_],
+        channel_bandwidth_hz: Optional[float] = None,
+        verbose: bool = False,
+    ) -> Tuple[SkyCoord, NDArray[np.float_], NDArray[np.float_]]:
+        """Computes the RASCIL point-source representation of all sources at once.
+
+        See `convert_to_backend` for the meaning of the arguments. The flux of
+        each source is placed onto the frequency channel closest to its redshift,
+        which is equivalent to a delta-function SED as in line emission
+        catalogues. Sources outside all channels are removed.
+
+        Returns:
+            Array-`SkyCoord` of the remaining sources, their fluxes of shape
+            (n_sources, n_channels, 1) (1 == stokesI) and the channel centers.
+        """
+        assert (
+            len(desired_frequencies_hz) > 0
+        ), """Must have at least 1 element
+        in desired_frequencies_hz array"""
+
+        desired_frequencies_hz = np.sort(desired_frequencies_hz)
+
+        if len(desired_frequencies_hz) == 1:
+            if channel_bandwidth_hz is None:
+                raise ValueError(
+                    """desired_frequencies_hz has one entry
+                    and channel_bandwidth_hz is None.
+                    There is not enough information to find channel bandwidths.
+                    Please specify channel_bandwidth_hz,
+                    or add entries to desired_frequencies_hz."""
+                )
+            frequency_bandwidth = channel_bandwidth_hz
+        else:
+            frequency_bandwidth = desired_frequencies_hz[1] - desired_frequencies_hz[0]
+
+        frequency_channel_centers = desired_frequencies_hz + frequency_bandwidth / 2
+
+        # Set endpoints, i.e. all channel starts + the final channel's end
+        frequency_channel_endpoints = np.append(
+            desired_frequencies_hz, desired_frequencies_hz[-1] + frequency_bandwidth
+        )
+        n_channels = len(frequency_channel_endpoints) - 1
+
+        redshift_limits = convert_frequency_to_z(
+            np.array(
+                [
+                    np.max(frequency_channel_endpoints),
+                    np.min(frequency_channel_endpoints),
+                ]
+            )
+        )
+        min_redshift, max_redshift = cast(Tuple[np.float_, np.float_], redshift_limits)
+
+        if self.sources is None:
+            raise KaraboSkyModelError("`sources` is None, can't convert sources.")
+        # ra [deg], dec [deg], stokes I [Jy * MHz], redshift
+        sources = np.asarray(self.sources[:, [0, 1, 2, 13]].to_numpy(), dtype=np.float_)
+        redshifts = sources[:, 3]
+        sources = sources[(redshifts <= max_redshift) & (redshifts >= min_redshift)]
+        if verbose is True:
+            print(min_redshift, max_redshift)
+            print(
+                f"""Reduced size of source catalog, after removing sources
+                outside of desired frequency range: {sources.shape[0]}"""
+            )
+
+        # For each source, find the channel to which it belongs
+        # E.g. if channel starts are [1e8, 2e8],
+        # then a source at frequency 1.5e8 should fall into the 0th channel.
+        # However, digitize returns index 1 for such a source.
+        # Therefore, we subtract 1 from the return value of np.digitize
+        source_channel_indices = (
+            np.digitize(
+                convert_z_to_frequency(sources[:, 3]),
+                frequency_channel_endpoints,
+                right=False,
+            )
+            - 1
+        )
+        # The upper channel-end is inclusive for the redshift-filter above
+        source_channel_indices = np.minimum(source_channel_indices, n_channels - 1)
+
+        # 1 == npolarisations, fixed as 1 (stokesI) for now
+        # TODO eventually handle full stokes source catalogs
+        fluxes = np.zeros((sources.shape[0], n_channels, 1))
+        fluxes[np.arange(sources.shape[0]), source_channel_indices, 0] = sources[:, 2]
+
+        directions = SkyCoord(
+            ra=sources[:, 0],
+            dec=sources[:, 1],
+            unit="deg",
+            frame="icrs",
+            equinox="J2000",
+        )
+        return directions, fluxes, frequency_channel_centers
+
     @overload
     def convert_to_backend(
         self,
@@ -2183,6 +3000,11 @@ class SkyModel:
             Otherwise, bandwidth is determined as the delta between
             the first two entries in desired_frequencies_hz.
         verbose: Determines whether to display additional print statements.
+
+        The RASCIL conversion creates one `SkyComponent` (and `SkyCoord`) per source,
+        which is slow for skies of 10^5 sources or more. `InterferometerSimulation`
+        with the "cpu_blockwise" `dft_compute_kernel` avoids it by working on the
+        source arrays of `_get_rascil_point_source_arrays` directly.
         """
 
         if backend is SimulatorBackend.OSKAR:
@@ -2200,125 +3022,298 @@ class SkyModel:
                     RASCIL SkyComponent instances."""
                 )
 
+            from ska_sdp_datamodels.science_data_model.polarisation_model import (
+                PolarisationFrame,
+            )
+            from ska_sdp_datamodels.sky_model.sky_model import SkyComponent
+
             desired_frequencies_hz = cast(NDArray[np.float_], desired_frequencies_hz)
+            if self.sources is None:
+                return []
+            (
+                directions,
+                fluxes,
+                frequency_channel_centers,
+            ) = self._get_rascil_point_source_arrays(
+                desired_frequencies_hz=desired_frequencies_hz,
+                channel_bandwidth_hz=channel_bandwidth_hz,
+                verbose=verbose,
+            )
 
-            assert (
-                len(desired_frequencies_hz) > 0
-            ), """Must have at least 1 element
-            in desired_frequencies_hz array"""
-
-            desired_frequencies_hz = np.sort(desired_frequencies_hz)
-
-            if len(desired_frequencies_hz) == 1:
-                if channel_bandwidth_hz is None:
-                    raise ValueError(
-                        """desired_frequencies_hz has one entry
-                        and channel_bandwidth_hz is None.
-                        There is not enough information to find channel bandwidths.
-                        Please specify channel_bandwidth_hz,
-                        or add entries to desired_frequencies_hz."""
-                    )
-                frequency_bandwidth = channel_bandwidth_hz
-            else:
-                frequency_bandwidth = (
-                    desired_frequencies_hz[1] - desired_frequencies_hz[0]
+            # The coordinates and fluxes of all sources are computed at once
+            # above. Still, `directions[i]` creates a new `SkyCoord` per source,
+            # which dominates the cost of the conversion for large skies.
+            polarisation_frame = PolarisationFrame("stokesI")
+            skycomponents: List[SkyComponent] = [
+                SkyComponent(
+                    direction=directions[i],
+                    frequency=frequency_channel_centers,
+                    name=f"pointsource{ra}{dec}",
+                    flux=fluxes[i],  # shape: nchannels, npolarisations
+                    shape="Point",
+                    polarisation_frame=polarisation_frame,
+                    params=None,
+                )
+                for i, (ra, dec) in enumerate(
+                    zip(directions.ra.deg, directions.dec.deg)
                 )
+            ]
+            return skycomponents
 
-            frequency_channel_centers = desired_frequencies_hz + frequency_bandwidth / 2
+        assert_never(backend)
 
-            # Set endpoints, i.e. all channel starts + the final channel's end
-            frequency_channel_endpoints = np.append(
-                desired_frequencies_hz, desired_frequencies_hz[-1] + frequency_bandwidth
-            )
 
-            # 1. Remove sources that fall outside all desired frequency channels
-            # 2. Assign each source to the frequency channel closest
-            # to its corresponding redshift (using np.digitize)
-            # 3. For each source, create a SkyComponent,
-            # with flux array equal to 0 on all channels,
-            # except for its closest channel, where all its flux will belong
-            # This is equivalent to having the source's SED equal to a delta function
-            # at the frequency corresponding to its redshift,
-            # which is true for line emission catalogues.
-            redshift_limits = convert_frequency_to_z(
-                np.array(
-                    [
-                        np.max(frequency_channel_endpoints),
-                        np.min(frequency_channel_endpoints),
-                    ]
-                )
+@dataclass(frozen=True)
+class _SkyColumnRangePredicate:
+    """Selects sources where `min_val` <= `col_idx`-column <= `max_val`."""
+
+    col_idx: int
+    min_val: IntFloat
+    max_val: IntFloat
+
+    def mask(self, block: NDArray[np.float_]) -> NDArray[np.bool_]:
+        col = block[:, self.col_idx]
+        return cast(NDArray[np.bool_], (col >= self.min_val) & (col <= self.max_val))
+
+
+@dataclass(frozen=True)
+class _SkyRadiusPredicate:
+    """Selects sources within an annulus around a phase center.
+
+    The annulus is either on the sphere (inner radius exclusive) or in the flat
+    ra-dec plane according to `SkyModel.filter_by_radius_euclidean_flat_approximation`
+    (inner radius inclusive).
+    """
+
+    inner_radius_deg: IntFloat
+    outer_radius_deg: IntFloat
+    ra0_deg: IntFloat
+    dec0_deg: IntFloat
+    flat: bool
+
+    def mask(self, block: NDArray[np.float_]) -> NDArray[np.bool_]:
+        ra, dec = block[:, 0].astype(np.float64), block[:, 1].astype(np.float64)
+        if self.flat:
+            x = (ra - self.ra0_deg) * np.cos(np.radians(self.dec0_deg))
+            y = dec - self.dec0_deg
+            distances_sq = np.square(x) + np.square(y)
+            return cast(
+                NDArray[np.bool_],
+                (distances_sq >= np.square(self.inner_radius_deg))
+                & (distances_sq <= np.square(self.outer_radius_deg)),
             )
-            min_redshift, max_redshift = cast(
-                Tuple[np.float_, np.float_], redshift_limits
+        center = SkySpatialIndex._to_unit_vectors(
+            np.array([self.ra0_deg], dtype=np.float64),
+            np.array([self.dec0_deg], dtype=np.float64),
+        )[0]
+        chords = np.linalg.norm(
+            SkySpatialIndex._to_unit_vectors(ra, dec) - center, axis=1
+        )
+        outer_chord = SkySpatialIndex._chord_length(self.outer_radius_deg)
+        mask = chords <= outer_chord
+        if self.inner_radius_deg > 0:
+            mask &= chords >= SkySpatialIndex._chord_length(self.inner_radius_deg)
+        return cast(NDArray[np.bool_], mask)
+
+    def query_index(self, index: SkySpatialIndex) -> NDArray[np.int_]:
+        if self.flat:
+            return index.query_radius_euclidean_flat_approximation(
+                inner_radius_deg=self.inner_radius_deg,
+                outer_radius_deg=self.outer_radius_deg,
+                ra0_deg=self.ra0_deg,
+                dec0_deg=self.dec0_deg,
             )
+        return index.query_radius(
+            inner_radius_deg=self.inner_radius_deg,
+            outer_radius_deg=self.outer_radius_deg,
+            ra0_deg=self.ra0_deg,
+            dec0_deg=self.dec0_deg,
+        )
 
-            if self.sources is None:
-                return []
 
-            assert self.sources is not None
+_SkyPredicate = Union[_SkyColumnRangePredicate, _SkyRadiusPredicate]
+
 
-            redshift_mask = (self.sources[:, 13] <= max_redshift) & (
-                self.sources[:, 13] >= min_redshift
+def _evaluate_sky_predicates(
+    block: NDArray[np.float_],
+    predicates: Tuple[_SkyPredicate, ...],
+) -> NDArray[np.bool_]:
+    """Evaluates the conjunction of `predicates` on a row-block of sources."""
+    mask = np.ones(block.shape[0], dtype=np.bool_)
+    for predicate in predicates:
+        mask &= predicate.mask(block)
+    return mask
+
+
+class SkyQuery:
+    """Deferred, composable filter over the sources of a `SkyModel`.
+
+    Each `filter_by_*` call just records a predicate and returns a new query,
+    so queries can be built up and reused without touching the data. The
+    predicates get evaluated in a single pass over `SkyModel.sources` when
+    `indices` or `to_sky_model` is called. For dask-backed sources, the
+    evaluation happens chunk by chunk. Radius predicates are resolved through
+    `SkyModel.spatial_index` and column predicates through
+    `SkyModel.get_column_index` if such an index exists, in which case the
+    remaining predicates are only evaluated on the candidates of the indices.
+
+    Create a query through `SkyModel.query`.
+    """
+
+    def __init__(
+        self,
+        sky: SkyModel,
+        predicates: Tuple[_SkyPredicate, ...] = (),
+    ) -> None:
+        """Creates a query on `sky`.
+
+        Args:
+            sky: Sky to filter.
+            predicates: Predicates to select sources, combined by logical and.
+        """
+        self.sky = sky
+        self._predicates = predicates
+
+    def _add(self, predicate: _SkyPredicate) -> SkyQuery:
+        return SkyQuery(sky=self.sky, predicates=self._predicates + (predicate,))
+
+    def filter_by_radius(
+        self,
+        inner_radius_deg: IntFloat,
+        outer_radius_deg: IntFloat,
+        ra0_deg: IntFloat,
+        dec0_deg: IntFloat,
+    ) -> SkyQuery:
+        """Deferred `SkyModel.filter_by_radius`."""
+        return self._add(
+            _SkyRadiusPredicate(
+                inner_radius_deg=inner_radius_deg,
+                outer_radius_deg=outer_radius_deg,
+                ra0_deg=ra0_deg,
+                dec0_deg=dec0_deg,
+                flat=False,
             )
-            if verbose is True:
-                print(min_redshift, max_redshift)
-                print(self.sources)
-            ras = self.sources[:, 0][redshift_mask]  # Degrees
-            decs = self.sources[:, 1][redshift_mask]  # Degrees
-            fluxes = self.sources[:, 2][redshift_mask]  # Jy * MHz
-            redshifts = self.sources[:, 13][redshift_mask]
-            if verbose is True:
-                print(
-                    f"""Reduced size of source catalog, after removing sources
-                    outside of desired frequency range: {redshifts.shape}"""
-                )
+        )
 
-            # For each source, find the channel to which it belongs
-            source_channel_indices = np.digitize(
-                convert_z_to_frequency(redshifts),
-                frequency_channel_endpoints,
-                right=False,
+    def filter_by_radius_euclidean_flat_approximation(
+        self,
+        inner_radius_deg: IntFloat,
+        outer_radius_deg: IntFloat,
+        ra0_deg: IntFloat,
+        dec0_deg: IntFloat,
+    ) -> SkyQuery:
+        """Deferred `SkyModel.filter_by_radius_euclidean_flat_approximation`."""
+        return self._add(
+            _SkyRadiusPredicate(
+                inner_radius_deg=inner_radius_deg,
+                outer_radius_deg=outer_radius_deg,
+                ra0_deg=ra0_deg,
+                dec0_deg=dec0_deg,
+                flat=True,
             )
+        )
+
+    def filter_by_column(
+        self,
+        col_idx: int,
+        min_val: IntFloat,
+        max_val: IntFloat,
+    ) -> SkyQuery:
+        """Deferred `SkyModel.filter_by_column`."""
+        return self._add(
+            _SkyColumnRangePredicate(col_idx=col_idx, min_val=min_val, max_val=max_val)
+        )
 
-            # E.g. if channel starts are [1e8, 2e8],
-            # then a source at frequency 1.5e8 should fall into the 0th channel.
-            # However, digitize returns index 1 for such a source.
-            # Therefore, we subtract 1 from the return value of np.digitize
-            source_channel_indices -= 1
+    def filter_by_flux(
+        self,
+        min_flux_jy: IntFloat,
+        max_flux_jy: IntFloat,
+    ) -> SkyQuery:
+        """Deferred `SkyModel.filter_by_flux`."""
+        return self.filter_by_column(2, min_flux_jy, max_flux_jy)
 
-            skycomponents: List[SkyComponent] = []
-            for ra, dec, flux, index in zip(
-                ras,
-                decs,
-                fluxes,
-                source_channel_indices,
-            ):
-                # 1 == npolarisations, fixed as 1 (stokesI) for now
-                # TODO eventually handle full stokes source catalogs
-                flux_array = np.zeros((len(frequency_channel_endpoints) - 1, 1))
-
-                # Access [0] since this is the stokesI flux,
-                # and [index] to place the source's flux onto
-                # the correct frequency channel (since this works for line emission)
-                flux_array[index][0] = flux
-
-                skycomponents.append(
-                    SkyComponent(
-                        direction=SkyCoord(
-                            ra=ra,
-                            dec=dec,
-                            unit="deg",
-                            frame="icrs",
-                            equinox="J2000",
-                        ),
-                        frequency=frequency_channel_centers,
-                        name=f"pointsource{ra}{dec}",
-                        flux=flux_array,  # shape: nchannels, npolarisations
-                        shape="Point",
-                        polarisation_frame=PolarisationFrame("stokesI"),
-                        params=None,
+    def filter_by_frequency(
+        self,
+        min_freq: IntFloat,
+        max_freq: IntFloat,
+    ) -> SkyQuery:
+        """Deferred `SkyModel.filter_by_frequency`."""
+        return self.filter_by_column(6, min_freq, max_freq)
+
+    def indices(self) -> NDArray[np.int_]:
+        """Evaluates the query.
+
+        Returns:
+            Ascending indices of the selected sources of `sky.sources`.
+        """
+        sources = self.sky.sources
+        if sources is None:
+            raise KaraboSkyModelError(
+                "`sources` is None, add sources before evaluating a query."
+            )
+        candidates: Optional[NDArray[np.int_]] = None
+        predicates: Tuple[_SkyPredicate, ...] = ()
+        index = self.sky.spatial_index
+        for predicate in self._predicates:
+            idxs: Optional[NDArray[np.int_]] = None
+            if index is not None and isinstance(predicate, _SkyRadiusPredicate):
+                idxs = predicate.query_index(index)
+            elif isinstance(predicate, _SkyColumnRangePredicate):
+                column_index = self.sky.get_column_index(predicate.col_idx)
+                if column_index is not None:
+                    idxs = column_index.query_range(
+                        min_val=predicate.min_val, max_val=predicate.max_val
                     )
+            if idxs is not None:
+                if candidates is None:
+                    candidates = idxs
+                else:
+                    candidates = np.intersect1d(candidates, idxs, assume_unique=True)
+            else:
+                predicates = predicates + (predicate,)
+
+        if candidates is not None:
+            if len(predicates) == 0 or candidates.shape[0] == 0:
+                return candidates
+            sources = sources[candidates]
+        elif len(predicates) == 0:
+            return np.arange(sources.shape[0], dtype=np.int_)
+
+        data = sources.data
+        if isinstance(data, da.Array):
+            mask = (
+                data.rechunk({1: -1})
+                .map_blocks(
+                    partial(_evaluate_sky_predicates, predicates=predicates),
+                    drop_axis=1,
+                    dtype=np.bool_,
                 )
-            return skycomponents
+                .compute()
+            )
+        else:
+            mask = _evaluate_sky_predicates(np.asarray(data), predicates)
+        idxs = np.flatnonzero(mask)
+        if candidates is not None:
+            idxs = candidates[idxs]
+        return idxs
 
-        assert_never(backend)
+    def to_sky_model(self) -> SkyModel:
+        """Evaluates the query and creates a sky of the selected sources.
+
+        The selected rows are taken from `sky.sources` directly instead of
+        deep-copying the whole sky first. The result keeps the chunking,
+        `wcs` and h5-file connection of `sky`.
+
+        Returns:
+            Filtered sky.
+        """
+        idxs = self.indices()
+        if self.sky.sources is None:  # checked in `indices`, just for mypy
+            raise KaraboSkyModelError(_DEV_ERROR_MSG)
+        filtered_sources = self.sky.rechunk_array_based_on_self(self.sky.sources[idxs])
+        return type(self.sky)(
+            sources=filtered_sources,
+            wcs=copy.deepcopy(self.sky.wcs),
+            precision=self.sky.precision,
+            h5_file_connection=self.sky.h5_file_connection,
+        )
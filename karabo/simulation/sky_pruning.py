@@ -0,0 +1,250 @@
+"""Removes sources of a sky which can't contribute to an observation.
+
+Simulators evaluate every source of the sky for every baseline, time-step and
+channel, even if it's below the horizon for the whole observation or far outside
+the primary beam. Pruning such sources before the simulation is cheap: the
+highest altitude of each source during the observation follows in closed form
+from the sidereal time at the start of each observation-interval, and the
+primary beam is approximated by a Gaussian.
+"""
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from karabo.error import KaraboSkyModelError
+from karabo.simulation.sky_model import SkyModel
+
+# Sidereal degrees per solar day
+_SIDEREAL_RATE_DEG_PER_DAY = 360.98564736629
+_J2000 = np.datetime64("2000-01-01T12:00:00", "us")
+
+
+@dataclass
+class SkyPruningReport:
+    """Summary of `prune_sky`.
+
+    Attributes:
+        n_sources: Number of sources before pruning.
+        n_below_horizon: Number of removed sources which are below the horizon
+            during the whole observation.
+        n_faint: Number of removed sources (above the horizon) whose apparent
+            flux is below the threshold.
+        removed_flux_fraction: Fraction of the total (absolute) stokes I flux of
+            the sky which got removed.
+    """
+
+    n_sources: int
+    n_below_horizon: int
+    n_faint: int
+    removed_flux_fraction: float
+
+    @property
+    def n_removed(self) -> int:
+        return self.n_below_horizon + self.n_faint
+
+    def __str__(self) -> str:
+        return (
+            f"Pruned {self.n_removed} of {self.n_sources} sources "
+            + f"({self.n_below_horizon} below the horizon, {self.n_faint} below "
+            + "the apparent flux threshold), which hold "
+            + f"{self.removed_flux_fraction:.2%} of the flux."
+        )
+
+
+def local_sidereal_time_deg(
+    times: NDArray[np.datetime64],
+    longitude_deg: float,
+) -> NDArray[np.float64]:
+    """Computes the local mean sidereal time of UTC-times.
+
+    Uses the GMST-expression of Meeus, Astronomical Algorithms, eq. 12.4, with
+    UTC as approximation of UT1 (error < 1s).
+
+    Args:
+        times: UTC-times.
+        longitude_deg: East-positive longitude of the observer.
+
+    Returns:
+        Local sidereal times in [0, 360) degrees.
+    """
+    days = (np.asarray(times, dtype="datetime64[us]") - _J2000) / np.timedelta64(1, "D")
+    centuries = days / 36525.0
+    gmst_deg = (
+        280.46061837
+        + _SIDEREAL_RATE_DEG_PER_DAY * days
+        + 0.000387933 * centuries**2
+        - centuries**3 / 38710000.0
+    )
+    lst_deg: NDArray[np.float64] = np.mod(gmst_deg + longitude_deg, 360.0)
+    return lst_deg
+
+
+def max_altitude_deg(
+    ra_deg: NDArray[np.float64],
+    dec_deg: NDArray[np.float64],
+    latitude_deg: float,
+    lst_start_deg: NDArray[np.float64],
+    lst_span_deg: float,
+) -> NDArray[np.float64]:
+    """Computes the highest altitude of sources during observation-intervals.
+
+    The altitude of a source is highest where its hour angle is closest to 0
+    (transit). Within an interval of sidereal time, this is either the transit or
+    one of the interval-ends, which makes the maximum exact and not limited to the
+    time-steps of the observation.
+
+    Args:
+        ra_deg: Right ascensions of the sources.
+        dec_deg: Declinations of the sources.
+        latitude_deg: Latitude of the observer.
+        lst_start_deg: Local sidereal time at the start of each interval.
+        lst_span_deg: Sidereal degrees covered by each interval.
+
+    Returns:
+        Highest altitude of each source over all intervals.
+    """
+    ra_deg = np.asarray(ra_deg, dtype=np.float64)
+    dec_rad = np.radians(np.asarray(dec_deg, dtype=np.float64))
+    lat_rad = np.radians(latitude_deg)
+    max_cos_hour_angle = np.full(ra_deg.shape, -1.0)
+    for lst_deg in np.atleast_1d(lst_start_deg):
+        hour_angle_start = np.mod(lst_deg - ra_deg, 360.0)
+        hour_angle_end = hour_angle_start + lst_span_deg
+        # angular distance of the closest hour angle in the interval to transit
+        distance_deg = np.where(
+            hour_angle_end >= 360.0,
+            0.0,
+            np.minimum(
+                np.minimum(hour_angle_start, 360.0 - hour_angle_start),
+                360.0 - hour_angle_end,
+            ),
+        )
+        np.maximum(
+            max_cos_hour_angle,
+            np.cos(np.radians(distance_deg)),
+            out=max_cos_hour_angle,
+        )
+    sin_altitude = (
+        np.sin(dec_rad) * np.sin(lat_rad)
+        + np.cos(dec_rad) * np.cos(lat_rad) * max_cos_hour_angle
+    )
+    altitude: NDArray[np.float64] = np.degrees(np.arcsin(np.clip(sin_altitude, -1, 1)))
+    return altitude
+
+
+def gaussian_beam_power(
+    ra_deg: NDArray[np.float64],
+    dec_deg: NDArray[np.float64],
+    phase_centre_deg: Tuple[float, float],
+    fwhm_deg: float,
+) -> NDArray[np.float64]:
+    """Evaluates a Gaussian power-beam pointed at the phase-centre.
+
+    Args:
+        ra_deg: Right ascensions of the sources.
+        dec_deg: Declinations of the sources.
+        phase_centre_deg: RA & DEC of the pointing.
+        fwhm_deg: Full width at half maximum of the power-beam.
+
+    Returns:
+        Beam-power in [0, 1] at each source.
+    """
+    ra_rad, dec_rad = np.radians(ra_deg), np.radians(dec_deg)
+    ra0_rad, dec0_rad = np.radians(phase_centre_deg[0]), np.radians(phase_centre_deg[1])
+    cos_separation = np.sin(dec_rad) * np.sin(dec0_rad) + np.cos(dec_rad) * np.cos(
+        dec0_rad
+    ) * np.cos(ra_rad - ra0_rad)
+    separation_deg = np.degrees(np.arccos(np.clip(cos_separation, -1, 1)))
+    power: NDArray[np.float64] = np.exp(
+        -4.0 * np.log(2.0) * (separation_deg / fwhm_deg) ** 2
+    )
+    return power
+
+
+def prune_sky(
+    sky: SkyModel,
+    longitude_deg: float,
+    latitude_deg: float,
+    start_times: Sequence[datetime],
+    length: timedelta,
+    phase_centre_deg: Tuple[float, float],
+    min_altitude_deg: float = 0.0,
+    horizon_margin_deg: float = 1.0,
+    min_apparent_flux_jy: float = 0.0,
+    beam_fwhm_deg: Optional[float] = None,
+) -> Tuple[SkyModel, SkyPruningReport]:
+    """Removes sources which can't contribute meaningfully to an observation.
+
+    A source gets removed if it's below `min_altitude_deg - horizon_margin_deg`
+    during the whole observation, or if its stokes I flux times the Gaussian
+    beam-power is below `min_apparent_flux_jy`. The margin covers precession &
+    nutation, which are neglected because the sky is in J2000 coordinates.
+
+    Args:
+        sky: Sky to prune.
+        longitude_deg: Longitude of the telescope.
+        latitude_deg: Latitude of the telescope.
+        start_times: UTC start of each observation-interval, e.g. one per day.
+        length: Length of each observation-interval.
+        phase_centre_deg: RA & DEC of the pointing.
+        min_altitude_deg: Altitude of the horizon.
+        horizon_margin_deg: Sources this close below the horizon are kept.
+        min_apparent_flux_jy: Apparent flux threshold. 0 disables the
+            flux-pruning.
+        beam_fwhm_deg: FWHM of the power-beam. If None, no beam-attenuation
+            is applied, i.e. the intrinsic flux is compared to the threshold.
+
+    Returns:
+        Pruned copy of `sky` (or `sky` itself if nothing got removed) and a report
+        of the removed sources.
+    """
+    if sky.sources is None:
+        raise KaraboSkyModelError(
+            "`sources` is None, add sources before calling `prune_sky`."
+        )
+    # ra [deg], dec [deg], stokes I [Jy]
+    ra_dec_flux = np.asarray(sky.sources[:, [0, 1, 2]].to_numpy(), dtype=np.float64)
+    ra_deg, dec_deg = ra_dec_flux[:, 0], ra_dec_flux[:, 1]
+    abs_flux = np.abs(ra_dec_flux[:, 2])
+
+    lst_start_deg = local_sidereal_time_deg(
+        np.array(start_times, dtype="datetime64[us]"), longitude_deg
+    )
+    lst_span_deg = length / timedelta(days=1) * _SIDEREAL_RATE_DEG_PER_DAY
+    below_horizon = (
+        max_altitude_deg(ra_deg, dec_deg, latitude_deg, lst_start_deg, lst_span_deg)
+        < min_altitude_deg - horizon_margin_deg
+    )
+
+    apparent_flux = abs_flux
+    if beam_fwhm_deg is not None:
+        apparent_flux = abs_flux * gaussian_beam_power(
+            ra_deg, dec_deg, phase_centre_deg, beam_fwhm_deg
+        )
+    faint = ~below_horizon & (apparent_flux < min_apparent_flux_jy)
+
+    keep_idxs = np.flatnonzero(~(below_horizon | faint))
+    total_flux = np.sum(abs_flux)
+    removed_flux = total_flux - np.sum(abs_flux[keep_idxs])
+    report = SkyPruningReport(
+        n_sources=len(ra_deg),
+        n_below_horizon=int(np.count_nonzero(below_horizon)),
+        n_faint=int(np.count_nonzero(faint)),
+        removed_flux_fraction=float(removed_flux / total_flux) if total_flux else 0.0,
+    )
+
+    if report.n_removed == 0:
+        return sky, report
+    pruned_sky = type(sky)(
+        sources=sky.rechunk_array_based_on_self(sky.sources[keep_idxs]),
+        wcs=copy.deepcopy(sky.wcs),
+        precision=sky.precision,
+        h5_file_connection=sky.h5_file_connection,
+    )
+    return pruned_sky, report
@@ -8,6 +8,7 @@ import re
 import shutil
 from itertools import product
 from typing import (
+    TYPE_CHECKING,
     Dict,
     List,
     Literal,
@@ -23,12 +24,6 @@ from typing import (
 import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
-from oskar.telescope import Telescope as OskarTelescope
-from rascil.processing_components.simulation.simulation_helpers import (
-    plot_configuration,
-)
-from ska_sdp_datamodels.configuration.config_create import create_named_configuration
-from ska_sdp_datamodels.configuration.config_model import Configuration
 from typing_extensions import assert_never
 
 import karabo.error
@@ -52,6 +47,10 @@ from karabo.util.data_util import get_module_absolute_path
 from karabo.util.file_handler import FileHandler
 from karabo.util.math_util import long_lat_to_cartesian
 
+if TYPE_CHECKING:
+    from oskar.telescope import Telescope as OskarTelescope
+    from ska_sdp_datamodels.configuration.config_model import Configuration
+
 OSKARTelescopesWithVersionType = Literal[
     "ACA",
     "ALMA",
@@ -272,6 +271,10 @@ but was not provided. Please provide a value for the version field."
     The version value {version} provided will be ignored."""
                 )
             assert name in get_args(RASCILTelescopes)
+            from ska_sdp_datamodels.configuration.config_create import (
+                create_named_configuration,
+            )
+
             try:
                 configuration = create_named_configuration(name)
             except ValueError as e:
@@ -385,6 +388,10 @@ but was not provided. Please provide a value for the version field."
         if self.backend is SimulatorBackend.OSKAR:
             self.plot_telescope_OSKAR(file)
         elif self.backend is SimulatorBackend.RASCIL:
+            from rascil.processing_components.simulation.simulation_helpers import (
+                plot_configuration,
+            )
+
             plot_configuration(self.get_backend_specific_information())
         else:
             logging.warning(
@@ -448,6 +455,8 @@ but was not provided. Please provide a value for the version field."
 
         :return: OSKAR Telescope object
         """
+        from oskar.telescope import Telescope as OskarTelescope
+
         tmp_dir = FileHandler().get_tmp_dir(
             prefix="telescope-",
             purpose="telescope disk-cache",
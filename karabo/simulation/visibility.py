@@ -3,14 +3,19 @@ from __future__ import annotations
 import os
 import os.path
 import shutil
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 import numpy as np
-import oskar
 from numpy.typing import NDArray
 
 from karabo.util._types import DirPathType, FilePathType
 from karabo.util.file_handler import FileHandler
+from karabo.util.import_util import lazy_import
+
+if TYPE_CHECKING:
+    import oskar
+else:
+    oskar = lazy_import("oskar")
 
 
 class Visibility:
@@ -48,6 +53,9 @@ class Visibility:
                 ms_file_path = os.path.join(tmp_dir, "measurements.MS")
         self.vis_path = vis_path
         self.ms_file_path = ms_file_path
+        # the files may be located in a disk-cache sub-dir of another object
+        FileHandler.pin(path=self.vis_path, obj=self)
+        FileHandler.pin(path=self.ms_file_path, obj=self)
 
     def write_to_file(self, path: FilePathType) -> None:
         """Does just copying .vis file to `path`.
@@ -171,38 +179,52 @@ class Visibility:
         )
 
     @staticmethod
-    def combine_vis(
-        visiblity_files: List[FilePathType],
-        combined_ms_filepath: Optional[DirPathType] = None,
-        group_by: str = "day",
-        return_path: bool = False,
-    ) -> Optional[DirPathType]:
-        print(f"Combining {len(visiblity_files)} visibilities...")
-        if combined_ms_filepath is None:
-            tmp_dir = FileHandler().get_tmp_dir(
-                prefix="combine-vis-",
-                purpose="combine-vis disk-cache.",
-            )
-            combined_ms_filepath = os.path.join(tmp_dir, "combined.MS")
+    def _iter_vis_blocks(
+        vis_file: FilePathType,
+    ) -> Iterator[Tuple[oskar.VisHeader, oskar.VisBlock]]:
+        """Iterates lazily over the blocks of an OSKAR .vis file.
+
+        Only one block is held in memory at a time. The yielded block gets
+        overwritten by the next iteration, so its data has to be consumed first.
+
+        Args:
+            vis_file: Path of the .vis file.
+
+        Yields:
+            Header of the .vis file and the current block.
+        """
+        (header, handle) = oskar.VisHeader.read(str(vis_file))
+        block = oskar.VisBlock.create_from_header(header)
+        for k in range(header.num_blocks):
+            block.read(header, handle, k)
+            yield header, block
+
+    @staticmethod
+    def _get_time_stamps(
+        header: oskar.VisHeader,
+        start_time_idx: int,
+        num_times: int,
+    ) -> NDArray[np.float64]:
+        """Gets the MS time-stamps (MJD in seconds, centre of each dump).
 
-        # Initialize lists to store data
-        out_vis, uui, vvi, wwi, time_start, time_inc, time_ave = ([] for _ in range(7))
-
-        # Loop over visibility files and read data
-        for vis_file in visiblity_files:
-            (header, handle) = oskar.VisHeader.read(str(vis_file))
-            block = oskar.VisBlock.create_from_header(header)
-            for k in range(header.num_blocks):
-                block.read(header, handle, k)
-            out_vis.append(block.cross_correlations())
-            uui.append(block.baseline_uu_metres())
-            vvi.append(block.baseline_vv_metres())
-            wwi.append(block.baseline_ww_metres())
-            time_inc.append(header.time_inc_sec)
-            time_start.append(header.time_start_mjd_utc)
-            time_ave.append(header.get_time_average_sec())
-
-        # Combine visibility data
+        Args:
+            header: Header of the .vis file.
+            start_time_idx: Index of the first time-step.
+            num_times: Number of time-steps.
+
+        Returns:
+            Time-stamps of each time-step.
+        """
+        return 86400.0 * header.time_start_mjd_utc + header.time_inc_sec * (
+            start_time_idx + 0.5 + np.arange(num_times)
+        )
+
+    @staticmethod
+    def _create_ms(
+        combined_ms_filepath: DirPathType,
+        header: oskar.VisHeader,
+        block: oskar.VisBlock,
+    ) -> oskar.MeasurementSet:
         ms = oskar.MeasurementSet.create(
             str(combined_ms_filepath),
             block.num_stations,
@@ -215,68 +237,158 @@ class Visibility:
         ms.set_phase_centre(
             header.phase_centre_ra_deg * deg2rad, header.phase_centre_dec_deg * deg2rad
         )
+        return ms
+
+    @staticmethod
+    def _write_ms_block(
+        ms: oskar.MeasurementSet,
+        start_row: int,
+        vis: NDArray[np.complex128],
+        uu: NDArray[np.float64],
+        vv: NDArray[np.float64],
+        ww: NDArray[np.float64],
+        time_stamps: NDArray[np.float64],
+        exposure_sec: float,
+        interval_sec: float,
+    ) -> int:
+        """Writes a block of consecutive time-steps into `ms`.
+
+        The visibilities of all time-steps are written with a single call.
+
+        Args:
+            ms: Measurement set to write to.
+            start_row: First row of the block in `ms`.
+            vis: Visibilities of shape (times, channels, baselines, pols).
+            uu: u-coordinates of shape (times, baselines).
+            vv: v-coordinates of shape (times, baselines).
+            ww: w-coordinates of shape (times, baselines).
+            time_stamps: Time-stamp of each time-step.
+            exposure_sec: Exposure time of each time-step.
+            interval_sec: Interval of each time-step.
+
+        Returns:
+            First row after the written block.
+        """
+        num_times, num_channels, num_baselines, num_pols = vis.shape
+        for t in range(num_times):
+            ms.write_coords(
+                start_row + t * num_baselines,
+                num_baselines,
+                uu[t],
+                vv[t],
+                ww[t],
+                exposure_sec,
+                interval_sec,
+                time_stamps[t],
+            )
+        # MS rows are time-major, channels are the slowest axis of `write_vis`
+        num_rows = num_times * num_baselines
+        ms_vis = np.ascontiguousarray(np.swapaxes(vis, 0, 1)).reshape(
+            num_channels, num_rows, num_pols
+        )
+        ms.write_vis(start_row, 0, num_channels, num_rows, ms_vis)
+        return start_row + num_rows
+
+    @staticmethod
+    def combine_vis(
+        visiblity_files: List[FilePathType],
+        combined_ms_filepath: Optional[DirPathType] = None,
+        group_by: str = "day",
+        return_path: bool = False,
+    ) -> Optional[DirPathType]:
+        """Concatenates the time-steps of `visiblity_files` into a single MS.
+
+        The .vis files are streamed block by block, so the memory usage just
+        depends on the block-size and not on the observation length.
+
+        Args:
+            visiblity_files: .vis files to combine, in order of time.
+            combined_ms_filepath: Path of the combined MS. If None, it's placed
+                into a disk-cache.
+            group_by: If "day", each .vis file keeps its own time-stamps and
+                uvw-coordinates. Otherwise, the time-steps continue from the start
+                of the first .vis file and the uvw-coordinates are averaged.
+            return_path: Return `combined_ms_filepath`?
 
-        # Write combined visibility data
-        print(f"### Writing combined visibilities in {combined_ms_filepath} ...")
-
-        num_files = len(visiblity_files)
-        if group_by == "day":
-            for j in range(num_files):
-                num_times = out_vis[j].shape[0]
-                for t in range(num_times):
-                    time_stamp = time_inc[j] * time_start[j]
-                    exposure_sec = time_ave[0]
-                    start_row = t * block.num_baselines
-                    ms.write_coords(
-                        start_row,
-                        block.num_baselines,
-                        uui[j][t],
-                        vvi[j][t],
-                        wwi[j][t],
-                        exposure_sec,
-                        time_ave[j],
-                        time_stamp,
+        Returns:
+            `combined_ms_filepath` if `return_path`, otherwise None.
+        """
+        print(f"Combining {len(visiblity_files)} visibilities...")
+        if combined_ms_filepath is None:
+            tmp_dir = FileHandler().get_tmp_dir(
+                prefix="combine-vis-",
+                purpose="combine-vis disk-cache.",
+            )
+            combined_ms_filepath = os.path.join(tmp_dir, "combined.MS")
+
+        mean_uvw: Optional[NDArray[np.float64]] = None
+        if group_by != "day":
+            # first pass just accumulates the uvw-coordinates
+            uvw_sum: Optional[NDArray[np.float64]] = None
+            num_times_total = 0
+            for vis_file in visiblity_files:
+                for _, block in Visibility._iter_vis_blocks(vis_file):
+                    block_uvw = np.stack(
+                        (
+                            block.baseline_uu_metres(),
+                            block.baseline_vv_metres(),
+                            block.baseline_ww_metres(),
+                        )
                     )
-                    ms.write_vis(
-                        start_row,
-                        0,
-                        block.num_channels,
-                        block.num_baselines,
-                        out_vis[j][t],
+                    if uvw_sum is None:
+                        uvw_sum = np.zeros(block_uvw.shape[::2], dtype=np.float64)
+                    uvw_sum += block_uvw.sum(axis=1)
+                    num_times_total += block_uvw.shape[1]
+            if uvw_sum is not None:
+                mean_uvw = uvw_sum / num_times_total
+
+        # not evicted while writing, e.g. if it takes longer than the grace-period
+        with FileHandler.lease(path=combined_ms_filepath):
+            ms: Optional[oskar.MeasurementSet] = None
+            first_header: Optional[oskar.VisHeader] = None
+            start_row = 0
+            time_idx = 0
+            for vis_file in visiblity_files:
+                file_time_idx = 0
+                for header, block in Visibility._iter_vis_blocks(vis_file):
+                    if ms is None or first_header is None:
+                        print(
+                            "### Writing combined visibilities in "
+                            + f"{combined_ms_filepath}"
+                        )
+                        ms = Visibility._create_ms(combined_ms_filepath, header, block)
+                        first_header = header
+                    vis = block.cross_correlations()
+                    num_times = vis.shape[0]
+                    exposure_sec = first_header.get_time_average_sec()
+                    if mean_uvw is None:
+                        uu = block.baseline_uu_metres()
+                        vv = block.baseline_vv_metres()
+                        ww = block.baseline_ww_metres()
+                        time_stamps = Visibility._get_time_stamps(
+                            header, file_time_idx, num_times
+                        )
+                    else:
+                        uu, vv, ww = (
+                            np.broadcast_to(x, (num_times, x.size)) for x in mean_uvw
+                        )
+                        time_stamps = Visibility._get_time_stamps(
+                            first_header, time_idx, num_times
+                        )
+                    start_row = Visibility._write_ms_block(
+                        ms=ms,
+                        start_row=start_row,
+                        vis=vis,
+                        uu=uu,
+                        vv=vv,
+                        ww=ww,
+                        time_stamps=time_stamps,
+                        exposure_sec=exposure_sec,
+                        interval_sec=exposure_sec,
                     )
-        else:
-            num_times = out_vis[0].shape[0] * num_files
-            ushape = np.array(uui).shape
-            outshape = np.array(out_vis).shape
-            uuf = np.array(uui).reshape(ushape[0] * ushape[1], ushape[2])
-            vvf = np.array(vvi).reshape(ushape[0] * ushape[1], ushape[2])
-            wwf = np.array(wwi).reshape(ushape[0] * ushape[1], ushape[2])
-            out_vis_reshaped = np.array(out_vis).reshape(
-                outshape[0] * outshape[1], outshape[2], outshape[3], outshape[4]
-            )
-            for t in range(num_times):
-                time_stamp = time_start[0] + t * time_inc[0] / 86400.0
-                exposure_sec = time_ave[0]
-                interval_sec = time_ave[0]
-                start_row = t * block.num_baselines
-
-                ms.write_coords(
-                    start_row,
-                    block.num_baselines,
-                    np.mean(uuf, axis=0),
-                    np.mean(vvf, axis=0),
-                    np.mean(wwf, axis=0),
-                    exposure_sec,
-                    interval_sec,
-                    time_stamp,
-                )
-                ms.write_vis(
-                    start_row,
-                    0,
-                    block.num_channels,
-                    block.num_baselines,
-                    out_vis_reshaped[t],
-                )
+                    file_time_idx += num_times
+                    time_idx += num_times
+
         if return_path:
             return combined_ms_filepath
         else:
@@ -288,6 +400,21 @@ class Visibility:
         combined_ms_filepath: Optional[DirPathType] = None,
         return_path: bool = False,
     ) -> Optional[DirPathType]:
+        """Sums up the visibilities of `visibility_files` into a single MS.
+
+        All .vis files need to be simulated with the same observation (e.g. of
+        different sky chunks). They're streamed simultaneously block by block, so
+        the memory usage is bounded by block-size times number of files.
+
+        Args:
+            visibility_files: .vis files to sum up.
+            combined_ms_filepath: Path of the combined MS. If None, it's placed
+                into a disk-cache.
+            return_path: Return `combined_ms_filepath`?
+
+        Returns:
+            `combined_ms_filepath` if `return_path`, otherwise None.
+        """
         print(f"Combining {len(visibility_files)} visibilities...")
         if combined_ms_filepath is None:
             tmp_dir = FileHandler().get_tmp_dir(
@@ -296,74 +423,55 @@ class Visibility:
             )
             combined_ms_filepath = os.path.join(tmp_dir, "combined.MS")
 
-        # Initialize lists to store data
-        out_vis, uui, vvi, wwi, time_start, time_inc, time_ave = ([] for _ in range(7))
-
-        # Loop over visibility files and read data
-        for vis_file in visibility_files:
-            (header, handle) = oskar.VisHeader.read(vis_file)
-            block = oskar.VisBlock.create_from_header(header)
-            for k in range(header.num_blocks):
-                block.read(header, handle, k)
-            out_vis.append(block.cross_correlations())
-            uui.append(block.baseline_uu_metres())
-            vvi.append(block.baseline_vv_metres())
-            wwi.append(block.baseline_ww_metres())
-            time_inc.append(header.time_inc_sec)
-            time_start.append(header.time_start_mjd_utc)
-            time_ave.append(header.get_time_average_sec())
-
-        # Combine visibility data
-        combined_vis = np.sum(out_vis, axis=0)
-        combined_uu = np.mean(uui, axis=0)
-        combined_vv = np.mean(vvi, axis=0)
-        combined_ww = np.mean(wwi, axis=0)
-        combined_time_start = np.min(time_start)
-        combined_time_inc = np.min(time_inc)
-        combined_time_ave = np.mean(time_ave)
-
-        print(f"Num channels: {block.num_channels}")
-        # Create a new measurement set
-        ms = oskar.MeasurementSet.create(
-            str(combined_ms_filepath),
-            block.num_stations,
-            block.num_channels,
-            block.num_pols,
-            header.freq_start_hz,
-            header.freq_inc_hz,
-        )
-        deg2rad = np.pi / 180
-        ms.set_phase_centre(
-            header.phase_centre_ra_deg * deg2rad, header.phase_centre_dec_deg * deg2rad
-        )
+        num_blocks = {
+            oskar.VisHeader.read(str(vis_file))[0].num_blocks
+            for vis_file in visibility_files
+        }
+        if len(num_blocks) > 1:
+            raise ValueError(
+                "All visibility files must have the same number of blocks, "
+                + f"but have {num_blocks=}."
+            )
 
-        # Write combined visibility data
-        print("### Writing combined visibilities in ", combined_ms_filepath)
-
-        num_files = len(visibility_files)
-        for j in range(num_files):
-            num_times = out_vis[j].shape[0]
-            for t in range(num_times):
-                time_stamp = combined_time_inc * combined_time_start
-                exposure_sec = combined_time_ave
-                start_row = t * block.num_baselines
-                ms.write_coords(
-                    start_row,
-                    block.num_baselines,
-                    combined_uu[t],
-                    combined_vv[t],
-                    combined_ww[t],
-                    exposure_sec,
-                    combined_time_ave,
-                    time_stamp,
-                )
-                ms.write_vis(
-                    start_row,
-                    0,
-                    block.num_channels,
-                    block.num_baselines,
-                    combined_vis[t],
+        # not evicted while writing, e.g. if it takes longer than the grace-period
+        with FileHandler.lease(path=combined_ms_filepath):
+            ms: Optional[oskar.MeasurementSet] = None
+            start_row = 0
+            time_idx = 0
+            block_iters = [Visibility._iter_vis_blocks(x) for x in visibility_files]
+            for headers_and_blocks in zip(*block_iters):
+                header, block = headers_and_blocks[0]
+                if ms is None:
+                    print(
+                        f"### Writing combined visibilities in {combined_ms_filepath}"
+                    )
+                    ms = Visibility._create_ms(combined_ms_filepath, header, block)
+                combined_vis = block.cross_correlations()
+                uu = block.baseline_uu_metres()
+                vv = block.baseline_vv_metres()
+                ww = block.baseline_ww_metres()
+                for _, other_block in headers_and_blocks[1:]:
+                    combined_vis = combined_vis + other_block.cross_correlations()
+                    uu = uu + other_block.baseline_uu_metres()
+                    vv = vv + other_block.baseline_vv_metres()
+                    ww = ww + other_block.baseline_ww_metres()
+                num_files = len(headers_and_blocks)
+                num_times = combined_vis.shape[0]
+                exposure_sec = header.get_time_average_sec()
+                start_row = Visibility._write_ms_block(
+                    ms=ms,
+                    start_row=start_row,
+                    vis=combined_vis,
+                    uu=uu / num_files,
+                    vv=vv / num_files,
+                    ww=ww / num_files,
+                    time_stamps=Visibility._get_time_stamps(
+                        header, time_idx, num_times
+                    ),
+                    exposure_sec=exposure_sec,
+                    interval_sec=exposure_sec,
                 )
+                time_idx += num_times
 
         if return_path:
             return combined_ms_filepath
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, Union, cast
+from typing import Literal, Optional, Tuple, Union, cast
 
 import astropy.units as u
 import numpy as np
@@ -9,13 +9,18 @@ from astropy.wcs import WCS
 from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 from numpy.typing import NDArray
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
 from scipy.spatial import KDTree
+from typing_extensions import assert_never
 
 from karabo.error import KaraboSourceDetectionEvaluationError
 from karabo.simulation.sky_model import SkyModel
 from karabo.sourcedetection.result import ISourceDetectionResult
 from karabo.util.plotting_util import get_slices
 
+AssignmentMethodType = Literal["greedy", "optimal"]
+
 
 class SourceDetectionEvaluation:
     def __init__(
@@ -80,22 +85,125 @@ class SourceDetectionEvaluation:
         )
 
     @staticmethod
-    def __return_multiple_assigned_detected_points(
-        assigments: NDArray[np.float_],
-    ) -> NDArray[np.float_]:
-        """
-        Returns the indices of the predicted sources that are assigned
-        to more than one ground truth source.
+    def __get_greedy_assignment(
+        ground_truth: NDArray[np.float_],
+        detected: NDArray[np.float_],
+        max_dist: float,
+        top_k: int,
+    ) -> Tuple[NDArray[np.int_], NDArray[np.float_]]:
+        """Greedy assignment: repeatedly assigns the closest unassigned pair.
+
+        Each round accepts all mutually nearest candidate pairs at once, which
+        are exactly the pairs the sequential greedy assignment would accept.
+
+        :return: Assigned ground truth index (or -1) and distance (or inf)
+            per detected source.
         """
-        # Check if a ground truth point is assigned to more than one predicted point
-        unique_counts = np.unique(assigments[:, 0], return_counts=True)  # O(nlogn)
-        pred_multiple_assignment = unique_counts[0][unique_counts[1] > 1]
-        # Don't check unassigned points (When no points are below the max distance by
-        # kdtree, they are assigned to input.shape, which we replace to -1).
-        pred_multiple_assignment = pred_multiple_assignment[
-            pred_multiple_assignment != -1
+        n_detected = detected.shape[0]
+        tree = KDTree(ground_truth)
+        distance, idx_gt = tree.query(detected, k=top_k, distance_upper_bound=max_dist)
+        distance = np.reshape(distance, (n_detected, -1))
+        idx_gt = np.reshape(idx_gt, (n_detected, -1))
+        is_candidate = np.isfinite(distance)
+        cand_det = np.repeat(np.arange(n_detected), distance.shape[1])[
+            is_candidate.ravel()
         ]
-        return cast(NDArray[np.float_], pred_multiple_assignment)
+        cand_gt = idx_gt[is_candidate]
+        cand_dist = distance[is_candidate]
+        # sorted by distance, the first candidate of each source is its closest
+        order = np.lexsort((cand_gt, cand_det, cand_dist))
+        cand_det, cand_gt, cand_dist = (
+            cand_det[order],
+            cand_gt[order],
+            cand_dist[order],
+        )
+
+        assigned_gt = np.full(n_detected, -1, dtype=np.int64)
+        assigned_dist = np.full(n_detected, np.inf)
+        is_assigned_gt = np.zeros(ground_truth.shape[0], dtype=np.bool_)
+        while len(cand_det) > 0:
+            is_first_det = np.zeros(len(cand_det), dtype=np.bool_)
+            is_first_det[np.unique(cand_det, return_index=True)[1]] = True
+            is_first_gt = np.zeros(len(cand_gt), dtype=np.bool_)
+            is_first_gt[np.unique(cand_gt, return_index=True)[1]] = True
+            is_mutual = is_first_det & is_first_gt
+            assigned_gt[cand_det[is_mutual]] = cand_gt[is_mutual]
+            assigned_dist[cand_det[is_mutual]] = cand_dist[is_mutual]
+            is_assigned_gt[cand_gt[is_mutual]] = True
+            is_open = (assigned_gt[cand_det] == -1) & ~is_assigned_gt[cand_gt]
+            cand_det, cand_gt, cand_dist = (
+                cand_det[is_open],
+                cand_gt[is_open],
+                cand_dist[is_open],
+            )
+        return assigned_gt, assigned_dist
+
+    @staticmethod
+    def __get_optimal_assignment(
+        ground_truth: NDArray[np.float_],
+        detected: NDArray[np.float_],
+        max_dist: float,
+    ) -> Tuple[NDArray[np.int_], NDArray[np.float_]]:
+        """Assignment with minimal total distance, solved as a sparse problem.
+
+        Every source can stay unassigned at a cost of `max_dist` (or the largest
+        candidate distance if `max_dist` is infinite). This is modeled by a
+        dummy partner per source, which makes a full bipartite matching always
+        possible, see `scipy.sparse.csgraph.min_weight_full_bipartite_matching`.
+
+        :return: Assigned ground truth index (or -1) and distance (or inf)
+            per detected source.
+        """
+        n_gt, n_detected = ground_truth.shape[0], detected.shape[0]
+        assigned_gt = np.full(n_detected, -1, dtype=np.int64)
+        assigned_dist = np.full(n_detected, np.inf)
+        candidates = KDTree(ground_truth).sparse_distance_matrix(
+            KDTree(detected), max_dist, output_type="ndarray"
+        )
+        if len(candidates) == 0:
+            return assigned_gt, assigned_dist
+        cand_gt, cand_det = candidates["i"], candidates["j"]
+        cand_dist = candidates["v"]
+        unassigned_cost = (
+            max_dist if np.isfinite(max_dist) else float(np.max(cand_dist))
+        )
+
+        # rows: ground truth & dummies of detections, cols: detections & dummies
+        # of ground truth. A pair of dummies is free if their real sources are
+        # matched, so the dummy block mirrors the candidate structure.
+        rows = np.concatenate(
+            [cand_gt, np.arange(n_gt), n_gt + np.arange(n_detected), n_gt + cand_det]
+        )
+        cols = np.concatenate(
+            [
+                cand_det,
+                n_detected + np.arange(n_gt),
+                np.arange(n_detected),
+                n_detected + cand_gt,
+            ]
+        )
+        # Each full matching has the same number of edges, so shifting all costs
+        # by 1 keeps the optimum while avoiding zero-weights, which would be
+        # treated as missing edges.
+        costs = 1.0 + np.concatenate(
+            [
+                cand_dist,
+                np.full(n_gt + n_detected, unassigned_cost),
+                np.zeros(len(cand_dist)),
+            ]
+        )
+        size = n_gt + n_detected
+        biadjacency = coo_matrix((costs, (rows, cols)), shape=(size, size)).tocsr()
+        matched_rows, matched_cols = min_weight_full_bipartite_matching(biadjacency)
+
+        is_matched = (matched_rows < n_gt) & (matched_cols < n_detected)
+        idxs_gt = matched_rows[is_matched]
+        idxs_det = matched_cols[is_matched]
+        assigned_gt[idxs_det] = idxs_gt
+        assigned_dist[idxs_det] = np.linalg.norm(
+            ground_truth[idxs_gt] - detected[idxs_det], axis=1
+        )
+        return assigned_gt, assigned_dist
 
     @staticmethod
     def automatic_assignment_of_ground_truth_and_prediction(
@@ -103,6 +211,7 @@ class SourceDetectionEvaluation:
         detected: Union[NDArray[np.int_], NDArray[np.float_]],
         max_dist: float,
         top_k: int = 3,
+        method: AssignmentMethodType = "greedy",
     ) -> NDArray[np.float_]:
         """Automatic assignment of the predicted sources `predicted` to the
         ground truth `gtruth`. The strategy is the following (similar to
@@ -118,6 +227,9 @@ class SourceDetectionEvaluation:
         and the predicted source assigned to another ground truth source before.
         If there are duplicate sources (e.g. same source, different frequency), the
         duplicate sources are removed and the assignment is done on the remaining.
+        With `method="optimal"`, the assignment minimizing the total distance
+        (unassigned sources cost `max_dist`) is computed instead of the greedy one,
+        considering all pairs within `max_dist`.
 
         :param ground_truth: nx2 np.ndarray with the ground truth pixel
         coordinates of the catalog
@@ -126,7 +238,9 @@ class SourceDetectionEvaluation:
         :param max_dist: maximal allowed euclidean distance for assignment
         (in pixel domain)
         :param top_k: number of top predictions to be considered in scipy.spatial.
-        KDTree. A small value could lead to inperfect results.
+        KDTree. A small value could lead to inperfect results. Just used by the
+        "greedy" `method`.
+        :param method: "greedy" or "optimal" (sparse linear assignment)
         :return: nx3 np.ndarray where each row represents an assignment
         - first column represents the ground truth index
             (return is sorted by this column) a minus index means a ground-truth
@@ -147,52 +261,25 @@ class SourceDetectionEvaluation:
         ground_truth = ground_truth[np.sort(gidx)]
         detected = detected[np.sort(didx)]
 
-        # With scipy.spatial.KDTree get the closest detection point
-        # for each ground truth point
-        tree = KDTree(ground_truth)
-        distance, idx_assigment_pred = tree.query(
-            detected, k=top_k, distance_upper_bound=max_dist
-        )
-        # Replace unassigned points with -1
-        idx_assigment_pred[distance == np.inf] = -1
-        # Check if a ground truth point is assigned to more than one predicted point
-        pred_multiple_assignments = (
-            SourceDetectionEvaluation.__return_multiple_assigned_detected_points(
-                idx_assigment_pred
+        if method == "greedy":
+            (
+                idx_assigment_pred,
+                distance,
+            ) = SourceDetectionEvaluation.__get_greedy_assignment(
+                ground_truth, detected, max_dist, top_k
             )
-        )
-        while len(pred_multiple_assignments) > 0:
-            for pred_multiple_assignment in pred_multiple_assignments:
-                # Get idx
-                idx_pred_multiple_assigment = np.where(
-                    idx_assigment_pred[:, 0] == pred_multiple_assignment
-                )
-                idx_max_distance_multiple_assigment = np.argmax(
-                    distance[idx_pred_multiple_assigment, 0]
-                )
-                idx_max_distance_multiple_assigment = idx_pred_multiple_assigment[0][
-                    idx_max_distance_multiple_assigment
-                ]
-                # Switch the assignment to the next closest point by
-                # rolling the row with the highest distance one to the left
-                distance[idx_max_distance_multiple_assigment, :] = np.roll(
-                    distance[idx_max_distance_multiple_assigment, :], -1
-                )
-                # To avoid infinite loops, we set the last element to np.inf.
-                distance[idx_max_distance_multiple_assigment, -1] = np.inf
-                idx_assigment_pred[idx_max_distance_multiple_assigment, :] = np.roll(
-                    idx_assigment_pred[idx_max_distance_multiple_assigment, :], -1
-                )
-                # Update points with no assignment with -1
-                idx_assigment_pred[distance == np.inf] = -1
-                # Check if a ground truth point is assigned to more
-                # than one predicted point
-                pred_multiple_assignments = SourceDetectionEvaluation.__return_multiple_assigned_detected_points(  # noqa: E501
-                    idx_assigment_pred
-                )
+        elif method == "optimal":
+            (
+                idx_assigment_pred,
+                distance,
+            ) = SourceDetectionEvaluation.__get_optimal_assignment(
+                ground_truth, detected, max_dist
+            )
+        else:
+            assert_never(method)
 
         assigments = np.array(
-            [idx_assigment_pred[:, 0], np.arange(detected.shape[0]), distance[:, 0]]
+            [idx_assigment_pred, np.arange(detected.shape[0]), distance]
         ).T
 
         # If there are more predicitons than GTs, we need to add the missing GTs.
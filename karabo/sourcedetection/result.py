@@ -4,15 +4,28 @@ import os
 import shutil
 import tempfile
 from abc import ABC, abstractmethod
-from typing import Any, List, Literal, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 from warnings import warn
 
-import bdsf
 import numpy as np
 from astropy.io import fits
-from bdsf.image import Image as bdsf_image
 from dask import compute, delayed  # type: ignore
 from numpy.typing import NDArray
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+from typing_extensions import assert_never
 
 from karabo.imaging.image import Image, ImageMosaicker
 from karabo.imaging.util import guess_beam_parameters
@@ -22,6 +35,9 @@ from karabo.util.data_util import read_CSV_to_ndarray
 from karabo.util.file_handler import FileHandler
 from karabo.warning import KaraboWarning
 
+if TYPE_CHECKING:
+    from bdsf.image import Image as bdsf_image
+
 ImageType = Literal[
     "RMS_map",
     "mean_map",
@@ -41,6 +57,8 @@ ImageType = Literal[
 
 PYBDSF_TOTAL_FLUX_IDX = 12
 
+OverlapResolutionType = Literal["brightest", "central"]
+
 BDSFResultIdxsToUseForKarabo = [
     0,
     4,
@@ -174,6 +192,8 @@ class SourceDetectionResult(ISourceDetectionResult):
                 )
                 beam = guess_beam_parameters(img=image)
 
+        import bdsf
+
         beam_ = (beam["bmaj"], beam["bmin"], beam["bpa"])
         quiet = not verbose
         try:
@@ -299,6 +319,8 @@ class PyBDSFSourceDetectionResult(SourceDetectionResult):
 
         self.bdsf_detected_sources = bdsf_detected_sources
         self.bdsf_result = bdsf_detection
+        # exported result images per image-type
+        self._result_images: Dict[str, Image] = {}
         source_image = self.__get_result_image("ch0")
         super().__init__(detected_sources, source_image)
 
@@ -324,12 +346,17 @@ class PyBDSFSourceDetectionResult(SourceDetectionResult):
         return sources
 
     def __get_result_image(self, image_type: str, **kwargs: Any) -> Image:
+        # images exported with custom kwargs aren't cached
+        if len(kwargs) == 0 and image_type in self._result_images:
+            return self._result_images[image_type]
         tmp_dir = FileHandler().get_tmp_dir(
             prefix="pybdsf-sdr-",
             purpose="pybdsf source-detection-result disk-cache",
             unique=self,
         )
-        outfile = os.path.join(tmp_dir, f"{image_type}-result.fits")
+        # cached images are memory-mapped, so custom exports get their own file
+        fname = f"{image_type}-result{'-custom' if len(kwargs) > 0 else ''}.fits"
+        outfile = os.path.join(tmp_dir, fname)
         if os.path.exists(outfile):  # allow overwriting for new results
             os.remove(path=outfile)
         self.bdsf_result.export_image(
@@ -340,6 +367,8 @@ class PyBDSFSourceDetectionResult(SourceDetectionResult):
             **kwargs,
         )
         image = Image(path=outfile)
+        if len(kwargs) == 0:
+            self._result_images[image_type] = image
         return image
 
     def get_RMS_map_image(self) -> Image:
@@ -407,6 +436,10 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
         The minimum number of pixels that must separate sources to be considered
         distinct. Defaults to 5. This attribute can be modified before calling
         any function that relies on it to adjust the minimum distance criterion.
+    overlap_resolution : {"brightest", "central"}
+        Which source of a cluster of overlapping sources is kept. "brightest"
+        keeps the one with the highest total flux, "central" the one closest to
+        the centre of the image it was detected in. Defaults to "brightest".
     verbose : bool
         If True, prints verbose output. Defaults to False.
 
@@ -430,9 +463,34 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
         bdsf_detection: Optional[List[PyBDSFSourceDetectionResult]] = None,
     ) -> None:
         self.min_pixel_distance_between_sources = 5
+        self.overlap_resolution: OverlapResolutionType = "brightest"
         self.verbose = False
         self.bdsf_detection = bdsf_detection
 
+    @property
+    def bdsf_detection(self) -> Optional[List[PyBDSFSourceDetectionResult]]:
+        return self._bdsf_detection
+
+    @bdsf_detection.setter
+    def bdsf_detection(
+        self,
+        bdsf_detection: Optional[List[PyBDSFSourceDetectionResult]],
+    ) -> None:
+        self._bdsf_detection = bdsf_detection
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Clears the cached mosaics, positions and merged detections.
+
+        Is called automatically when `bdsf_detection` is reassigned. Call it
+        explicitly after modifying the list or its results in place.
+        """
+        self._result_images: Dict[ImageType, Image] = {}
+        self._corrected_positions: Optional[NDArray[np.float_]] = None
+        # keyed by (min_pixel_distance_between_sources, overlap_resolution)
+        self._overlap_drops: Dict[Tuple[float, str], List[int]] = {}
+        self._detected_sources: Dict[Tuple[float, str], NDArray[np.float_]] = {}
+
     @classmethod
     def detect_sources_in_images(
         cls,
@@ -516,14 +574,20 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
                 "No PyBDSF detection results found. Did you run "
                 + "`detect_sources_in_images`?"
             )
-        _detected_sources = np.concatenate(
-            [x.detected_sources for x in self.bdsf_detection],
-            axis=0,
+        cache_key = (
+            float(self.min_pixel_distance_between_sources),
+            str(self.overlap_resolution),
         )
-        to_drop = self.__get_idx_of_overlapping_sources()
-        if len(to_drop) > 0:
-            _detected_sources = self.__drop_cast_sources(_detected_sources, to_drop)
-        return _detected_sources
+        if cache_key not in self._detected_sources:
+            _detected_sources = np.concatenate(
+                [x.detected_sources for x in self.bdsf_detection],
+                axis=0,
+            )
+            to_drop = self.__get_idx_of_overlapping_sources()
+            if len(to_drop) > 0:
+                _detected_sources = self.__drop_cast_sources(_detected_sources, to_drop)
+            self._detected_sources[cache_key] = _detected_sources
+        return self._detected_sources[cache_key].copy()
 
     def get_RMS_map_image(self) -> Image:
         return self.__get_result_image("RMS_map")
@@ -582,6 +646,8 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
                 "No PyBDSF detection results found. Did you run "
                 + "`detect_sources_in_images`?"
             )
+        if image_type in self._result_images:
+            return self._result_images[image_type]
         images = [
             getattr(result, f"get_{image_type}_image")()
             for result in self.bdsf_detection
@@ -590,7 +656,9 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
         if self.verbose:
             print(f"Getting {image_type} image by mosaicking.")
 
-        return mi.mosaic(images)[0]
+        mosaic = mi.mosaic(images)[0]
+        self._result_images[image_type] = mosaic
+        return mosaic
 
     def get_pixel_position_of_sources(self) -> NDArray[np.float_]:
         """
@@ -612,12 +680,11 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
                 + "`detect_sources_in_images`?"
             )
         to_drop = self.__get_idx_of_overlapping_sources()
-        combined_positions = self.__get_corrected_positions(
-            [x.get_pixel_position_of_sources() for x in self.bdsf_detection]
-        )
+        combined_positions = self.__get_corrected_positions()
         if len(to_drop) > 0:
             combined_positions = self.__drop_cast_sources(combined_positions, to_drop)
         else:
+            combined_positions = combined_positions.copy()
             if self.verbose:
                 print("No sources were merged.")
         return combined_positions
@@ -637,7 +704,6 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
 
     def __get_corrected_positions(
         self,
-        xy_poss: List[NDArray[np.float_]],
     ) -> NDArray[np.float_]:
         """
         Calculate corrected positions of detected sources in a mosaic image.
@@ -647,11 +713,7 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
         differences in reference pixel positions ('CRPIX') from each image's header
         relative to the mosaic's header.
 
-        Parameters
-        ----------
-        xy_poss : List[NDArray[np.float_]]
-            A list of NumPy arrays. Each array contains the x and y pixel positions
-            of detected sources in individual images that comprise the mosaic.
+        The result is cached until `clear_cache` is called.
 
         Returns
         -------
@@ -665,6 +727,12 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
                 + "`detect_sources_in_images`?"
             )
 
+        if self._corrected_positions is not None:
+            return self._corrected_positions
+        xy_poss = [
+            result.get_pixel_position_of_sources() for result in self.bdsf_detection
+        ]
+
         # Get headers
         headers: List[fits.header.Header] = []
         for result in self.bdsf_detection:
@@ -692,7 +760,8 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
             )  # Subtract delta to align with the mosaic
 
         # Combine all positions into one array
-        return np.concatenate(corrected_positions, axis=0)
+        self._corrected_positions = np.concatenate(corrected_positions, axis=0)
+        return self._corrected_positions
 
     def __get_idx_of_overlapping_sources(
         self,
@@ -702,8 +771,9 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
 
         This method calculates the pixel positions of sources in a mosaic image
         and identifies sources that are closer than a specified minimum pixel
-        distance. It decides which sources to drop based on their total flux,
-        preferring sources with higher total flux.
+        distance using a KD-tree. Overlapping sources are grouped into clusters,
+        of which just the brightest (or most central, see `overlap_resolution`)
+        source is kept.
 
         Returns
         -------
@@ -716,6 +786,12 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
                 "No PyBDSF detection results found. Did you run "
                 + "`detect_sources_in_images`?"
             )
+        cache_key = (
+            float(self.min_pixel_distance_between_sources),
+            str(self.overlap_resolution),
+        )
+        if cache_key in self._overlap_drops:
+            return self._overlap_drops[cache_key]
         # Get XY pixel position for each result
         xy_poss = [
             result.get_pixel_position_of_sources() for result in self.bdsf_detection
@@ -727,32 +803,50 @@ class PyBDSFSourceDetectionResultList(ISourceDetectionResult):
             )
 
         # Combine all positions into one array
-        combined_positions = self.__get_corrected_positions(xy_poss=xy_poss)
-        # Get Total Flux per Source
-        total_fluxes = np.concatenate(
-            [
-                x.bdsf_detected_sources[:, PYBDSF_TOTAL_FLUX_IDX]
-                for x in self.bdsf_detection
-            ],
-            axis=0,
+        combined_positions = self.__get_corrected_positions()
+        if self.overlap_resolution == "brightest":
+            # Get Total Flux per Source
+            scores = np.concatenate(
+                [
+                    x.bdsf_detected_sources[:, PYBDSF_TOTAL_FLUX_IDX]
+                    for x in self.bdsf_detection
+                ],
+                axis=0,
+            )
+        elif self.overlap_resolution == "central":
+            # Negative distance to the centre of the image it was detected in
+            distances: List[NDArray[np.float_]] = []
+            for xy_pos, result in zip(xy_poss, self.bdsf_detection):
+                source_image = cast(Image, result.get_source_image())
+                n_y, n_x = source_image.data.shape[-2:]
+                centre = (np.array([n_x, n_y]) - 1) / 2
+                distances.append(np.linalg.norm(xy_pos - centre, axis=1))
+            scores = -np.concatenate(distances, axis=0)
+        else:
+            assert_never(self.overlap_resolution)
+
+        # Pairs of sources closer than the min distance (strictly smaller)
+        pairs = cKDTree(combined_positions).query_pairs(
+            r=np.nextafter(self.min_pixel_distance_between_sources, 0),
+            output_type="ndarray",
+        )
+        if len(pairs) == 0:
+            self._overlap_drops[cache_key] = []
+            return []
+        if self.verbose:
+            print(f"Found {len(pairs)} pairs of sources to merge.")
+        # Clusters of transitively overlapping sources, of which just the one
+        # with the highest score is kept
+        n_sources = len(combined_positions)
+        adjacency = coo_matrix(
+            (np.ones(len(pairs), dtype=np.bool_), (pairs[:, 0], pairs[:, 1])),
+            shape=(n_sources, n_sources),
         )
-        # Check if some sources overlap
-        to_drop: List[int] = []
-        for i in range(len(combined_positions)):
-            for j in range(
-                i + 1, len(combined_positions)
-            ):  # Compare with subsequent sources to avoid repetition
-                dist = np.linalg.norm(combined_positions[i] - combined_positions[j])
-                if dist < self.min_pixel_distance_between_sources:
-                    if self.verbose:
-                        print(
-                            f"Source {i} and {j} are being merged "
-                            f"because distance between them is {dist}."
-                        )
-                    if total_fluxes[i] > total_fluxes[j]:
-                        to_drop.append(j)
-                    else:
-                        to_drop.append(i)
-        # Remove duplicates
-        to_drop = list(set(to_drop))
+        _, labels = connected_components(adjacency, directed=False)
+        # Sort by label, then by descending score: first of each label is kept
+        order = np.lexsort((-scores, labels))
+        is_first = np.ones(n_sources, dtype=np.bool_)
+        is_first[1:] = labels[order][1:] != labels[order][:-1]
+        to_drop: List[int] = np.sort(order[~is_first]).tolist()
+        self._overlap_drops[cache_key] = to_drop
         return to_drop
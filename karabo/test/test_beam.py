@@ -2,6 +2,9 @@ import os
 import tempfile
 from datetime import datetime, timedelta
 
+import numpy as np
+import pytest
+
 from karabo.imaging.imager_rascil import RascilDirtyImager, RascilDirtyImagerConfig
 from karabo.simulation.beam import BeamPattern
 from karabo.simulation.interferometer import InterferometerSimulation
@@ -17,6 +20,53 @@ def test_fit_element(tobject: TFiles):
     beam.fit_elements(tel, freq_hz=1e8, avg_frac_error=0.5)
 
 
+def test_fit_element_cache(monkeypatch: pytest.MonkeyPatch):
+    n_fits = 0
+
+    def fit(self: BeamPattern, output_directory: str) -> None:
+        nonlocal n_fits
+        n_fits += 1
+        path = os.path.join(output_directory, "element_pattern_fit_x_0_100.bin")
+        with open(path, "w") as f:
+            f.write(f"{self.freq_hz}")
+
+    monkeypatch.setattr(BeamPattern, "_run_fit_element_data", fit)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cst_file_path = os.path.join(tmpdir, "beam.cst")
+        with open(cst_file_path, "w") as f:
+            f.write(f"{np.random.rand()}")
+        beam = BeamPattern(cst_file_path, freq_hz=1e8)
+        for name in ("tel1", "tel2"):
+            tel = Telescope(longitude=0.0, latitude=0.0)
+            tel.path = os.path.join(tmpdir, name)
+            os.makedirs(tel.path)
+            beam.fit_elements(tel)
+            assert os.listdir(tel.path) == ["element_pattern_fit_x_0_100.bin"]
+        assert n_fits == 1
+
+        beam.fit_elements(tel, freq_hz=2e8)
+        assert n_fits == 2
+        beam.fit_elements(tel, freq_hz=2e8, use_cache=False)
+        assert n_fits == 3
+
+
+def test_sim_beam_memoized():
+    beam = BeamPattern("beam.cst")
+    grid_th_phi, vcopol_x, vcopol_y, data_x, data_y = beam.sim_beam()
+    assert grid_th_phi[0].shape == (180, 360)
+    assert data_x.shape == data_y.shape == (180 * 360, 8)
+    assert np.all(np.isfinite(data_x)) and np.all(np.isfinite(data_y))
+    # peak of the Gaussian beam at the pointing-centre
+    assert np.argmax(vcopol_x) == 0
+    # returned arrays are copies of the memoized beam
+    vcopol_x[:] = 0.0
+    data_x[:] = 0.0
+    _, vcopol_x_cached, _, data_x_cached, _ = beam.sim_beam()
+    assert np.any(vcopol_x_cached != 0.0)
+    assert np.any(data_x_cached != 0.0)
+    assert BeamPattern._compute_beam.cache_info().hits >= 1
+
+
 def test_katbeam():
     beampixels = BeamPattern.get_meerkat_uhfbeam(
         f=800, pol="I", beamextentx=40, beamextenty=40
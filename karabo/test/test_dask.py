@@ -149,6 +149,35 @@ def test_single_node() -> None:
         assert DaskHandlerSlurm._get_base_string_node_list() == "nid"
 
 
+def test_zero_padded_node_list() -> None:
+    env_vars = {
+        "SLURM_JOB_NODELIST": "nid[001-004]",
+        "SLURM_JOB_NUM_NODES": "4",
+        "SLURMD_NODENAME": "nid001",
+        "SLURM_JOB_ID": "123456",
+    }
+    with patch.dict(os.environ, env_vars):
+        assert DaskHandlerSlurm._get_lowest_node_name() == "nid001"
+        assert DaskHandlerSlurm._extract_node_ids_from_node_list() == [1, 2, 3, 4]
+        assert DaskHandlerSlurm.is_first_node() is True
+        env_vars["SLURMD_NODENAME"] = "nid003"
+        with patch.dict(os.environ, env_vars):
+            assert DaskHandlerSlurm.get_node_id() == 3
+            assert DaskHandlerSlurm.is_first_node() is False
+            assert DaskHandlerSlurm._get_lowest_node_name() == "nid001"
+
+
+def test_dask_scheduler_file(env_vars: _EnvVarsType) -> None:
+    with patch.dict(os.environ, env_vars):
+        scheduler_file = DaskHandlerSlurm._get_dask_scheduler_file()
+        dask_info_dir, _, _ = DaskHandlerSlurm._get_dask_paths_for_slurm()
+        # all nodes of the job agree on the scheduler-file
+        assert os.path.dirname(scheduler_file) == dask_info_dir
+        env_vars["SLURMD_NODENAME"] = "nid04401"
+        with patch.dict(os.environ, env_vars):
+            assert DaskHandlerSlurm._get_dask_scheduler_file() == scheduler_file
+
+
 def test_dask_job() -> None:
     DaskHandler.setup()
     client = DaskHandler.get_dask_client()
@@ -0,0 +1,65 @@
+from typing import Optional
+
+import numpy as np
+import pytest
+from astropy.coordinates import SkyCoord
+
+from karabo.simulation.dft import (
+    dft_point_sources_blockwise,
+    point_source_direction_cosines,
+)
+
+
+def test_point_source_direction_cosines() -> None:
+    phase_centre = SkyCoord(240, -70, unit="deg", frame="icrs")
+    directions = SkyCoord(
+        ra=[240.0, 240.0, 241.0], dec=[-70.0, -69.0, -70.0], unit="deg", frame="icrs"
+    )
+    dc = point_source_direction_cosines(directions, phase_centre)
+    assert dc.shape == (3, 3)
+    assert np.allclose(dc[0], 0.0)
+    # north is +m, east is +l
+    assert dc[1, 0] == pytest.approx(0.0, abs=1e-12)
+    assert dc[1, 1] == pytest.approx(np.sin(np.radians(1.0)))
+    assert dc[2, 0] > 0.0
+    assert np.allclose(dc[:, 2], np.sqrt(1 - dc[:, 0] ** 2 - dc[:, 1] ** 2) - 1)
+
+
+@pytest.mark.parametrize(
+    "max_block_memory,n_threads", [("64MB", None), ("10KB", 1), ("10KB", 3)]
+)
+def test_dft_point_sources_blockwise(
+    max_block_memory: str, n_threads: Optional[int]
+) -> None:
+    rng = np.random.default_rng(42)
+    n_times, n_baselines, n_channels, n_sources, n_pols = 3, 21, 2, 700, 1
+    uvw_lambda = rng.normal(scale=500.0, size=(n_times, n_baselines, n_channels, 3))
+    lm = rng.uniform(-0.05, 0.05, size=(n_sources, 2))
+    direction_cosines = np.column_stack((lm, np.sqrt(1 - np.sum(lm**2, axis=1)) - 1))
+    fluxes = rng.uniform(size=(n_sources, n_channels, n_pols))
+
+    vis = dft_point_sources_blockwise(
+        direction_cosines=direction_cosines,
+        fluxes=fluxes,
+        uvw_lambda=uvw_lambda,
+        max_block_memory=max_block_memory,
+        n_threads=n_threads,
+    )
+
+    # reference: RASCIL's `cpu_looped` kernel
+    expected = np.zeros((n_times, n_baselines, n_channels, n_pols), dtype=complex)
+    for i in range(n_sources):
+        phasor = np.exp(
+            -2j * np.pi * np.sum(uvw_lambda * direction_cosines[i], axis=-1)
+        )
+        expected += fluxes[i, np.newaxis, np.newaxis, :, :] * phasor[..., np.newaxis]
+    assert vis.shape == expected.shape
+    assert np.allclose(vis, expected, rtol=0, atol=1e-9 * np.max(np.abs(expected)))
+
+    no_sources = dft_point_sources_blockwise(
+        direction_cosines=np.zeros((0, 3)),
+        fluxes=np.zeros((0, n_channels, n_pols)),
+        uvw_lambda=uvw_lambda,
+    )
+    assert no_sources.shape == expected.shape
+    assert np.all(no_sources == 0)
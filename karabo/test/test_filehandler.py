@@ -1,10 +1,14 @@
+import gc
 import json
 import os
 import tempfile
 
+import numpy as np
 import pytest
 
-from karabo.util.file_handler import FileHandler
+from karabo.simulation.sky_model import SkyModel
+from karabo.simulation.visibility import Visibility
+from karabo.util.file_handler import FileHandler, get_dir_checksum
 
 
 def test_file_handler():
@@ -84,3 +88,121 @@ def test_object_bound_file_handler():
         tmpdir_fh2 = FileHandler().get_tmp_dir(unique=my_obj)
         assert len(os.listdir(FileHandler.stm())) == 1
         assert tmpdir_fh1 == tmpdir_fh2
+
+
+def test_file_handler_quota(monkeypatch: pytest.MonkeyPatch):
+    """Test LRU-eviction of FileHandler dirs exceeding the quota."""
+
+    class MyClass:
+        ...
+
+    def write_file(dir_path: str) -> None:
+        with open(os.path.join(dir_path, "data.bin"), "wb") as f:
+            f.write(b"0" * 1000)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.setattr(FileHandler, "root_stm", tmpdir)
+        monkeypatch.setattr(FileHandler, "root_ltm", tmpdir)
+        monkeypatch.setattr(FileHandler, "quota_stm", 1500)
+        monkeypatch.setattr(FileHandler, "eviction_grace_period_sec", 0.0)
+
+        fh_instance = FileHandler()
+        instance_dir = fh_instance.get_tmp_dir(prefix="instance-")
+        write_file(instance_dir)
+        my_obj = MyClass()
+        obj_dir = FileHandler().get_tmp_dir(prefix="obj-", unique=my_obj)
+        write_file(obj_dir)
+        unbound_dir = FileHandler().get_tmp_dir(prefix="unbound-")
+        write_file(unbound_dir)
+
+        # just the dir without a live object can be evicted
+        assert FileHandler.evict() == [unbound_dir]
+        assert os.path.exists(instance_dir) and os.path.exists(obj_dir)
+
+        # another process (host) is still using `obj_dir`
+        lease = os.path.join(
+            FileHandler.stm(),
+            ".karabo-cache-meta",
+            f"{os.path.basename(obj_dir)}.lease-otherhost-1",
+        )
+        with open(lease, "a"):
+            pass
+        del fh_instance, my_obj
+        gc.collect()
+        assert FileHandler.evict() == [instance_dir]
+        assert FileHandler.evict() == []
+        os.remove(lease)
+        assert FileHandler.evict() == []  # meets the quota now
+        assert os.path.exists(obj_dir)
+
+
+def test_file_handler_quota_objects_in_use(monkeypatch: pytest.MonkeyPatch):
+    """Test that dirs used by live objects or within a lease survive the eviction."""
+
+    def write_file(dir_path: str) -> None:
+        with open(os.path.join(dir_path, "data.bin"), "wb") as f:
+            f.write(b"0" * 1000)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.setattr(FileHandler, "root_stm", tmpdir)
+        monkeypatch.setattr(FileHandler, "root_ltm", tmpdir)
+        monkeypatch.setattr(FileHandler, "quota_stm", 0)
+        monkeypatch.setattr(FileHandler, "quota_ltm", 0)
+        monkeypatch.setattr(FileHandler, "eviction_grace_period_sec", 0.0)
+
+        # dirs of throwaway `FileHandler` instances are protected by their users
+        vis_dir = FileHandler().get_tmp_dir(prefix="vis-")
+        write_file(vis_dir)
+        vis = Visibility(
+            vis_path=os.path.join(vis_dir, "visibility.vis"),
+            ms_file_path=os.path.join(vis_dir, "measurements.MS"),
+        )
+        leased_dir = FileHandler().get_tmp_dir(prefix="leased-")
+        write_file(leased_dir)
+        gc.collect()
+        with FileHandler.lease(path=os.path.join(leased_dir, "data.bin")):
+            assert FileHandler.evict() == []
+        assert os.path.exists(vis_dir) and os.path.exists(leased_dir)
+        assert FileHandler.evict() == [leased_dir]
+        del vis
+        gc.collect()
+        assert FileHandler.evict() == [vis_dir]
+
+        # a lazily memory-mapped store is protected as long as its data is in use
+        store_dir = FileHandler().get_tmp_dir(prefix="sky-store-", term="long")
+        store_path = os.path.join(store_dir, "store")
+        SkyModel(sources=np.random.rand(10, 14)).save_sky_model_as_columnar_store(
+            path=store_path
+        )
+        sky = SkyModel.get_sky_model_from_columnar_store(path=store_path)
+        sources = sky.sources
+        del sky
+        gc.collect()
+        assert FileHandler.evict(term="long") == []
+        assert sources is not None
+        assert sources.shape == (10, 14) and np.isfinite(sources.values).all()
+        del sources
+        gc.collect()
+        assert FileHandler.evict(term="long") == [store_dir]
+
+
+def test_get_dir_checksum():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dirs = [os.path.join(tmpdir, name) for name in ("a", "b")]
+        for dir_ in dirs:
+            os.makedirs(os.path.join(dir_, "station"))
+            with open(os.path.join(dir_, "layout.txt"), "w") as f:
+                f.write("0.0,0.0\n1.0,1.0\n")
+            with open(os.path.join(dir_, "station", "layout.txt"), "w") as f:
+                f.write("0.0,0.0\n")
+        # same content at a different location
+        assert get_dir_checksum(dirs[0]) == get_dir_checksum(dirs[1])
+
+        checksum = get_dir_checksum(dirs[1])
+        with open(os.path.join(dirs[1], "station", "layout.txt"), "a") as f:
+            f.write("2.0,2.0\n")
+        assert get_dir_checksum(dirs[1]) != checksum
+
+        checksum = get_dir_checksum(dirs[1])
+        os.rename(os.path.join(dirs[1], "station"), os.path.join(dirs[1], "station2"))
+        assert get_dir_checksum(dirs[1]) != checksum
@@ -3,8 +3,11 @@ import tempfile
 from datetime import datetime
 
 import numpy as np
+import pytest
 
+from karabo.imaging.image import Image
 from karabo.imaging.imager_base import DirtyImagerConfig
+from karabo.imaging.imager_numpy import NumpyDirtyImager, NumpyDirtyImagerConfig
 from karabo.imaging.imager_rascil import (
     RascilDirtyImager,
     RascilDirtyImagerConfig,
@@ -17,6 +20,7 @@ from karabo.simulation.observation import Observation
 from karabo.simulation.sky_model import SkyModel
 from karabo.simulation.telescope import Telescope
 from karabo.simulation.visibility import Visibility
+from karabo.simulator_backend import SimulatorBackend
 from karabo.test.conftest import TFiles
 
 
@@ -62,6 +66,80 @@ def test_dirty_image(tobject: TFiles):
     dirty.plot(title="Dirty Image")
 
 
+def test_numpy_dirty_image(tobject: TFiles):
+    vis = Visibility.read_from_file(tobject.visibilities_gleam_ms)
+    npixel = 512
+    cellsize = 3.878509448876288e-05
+
+    dirty = NumpyDirtyImager(
+        NumpyDirtyImagerConfig(imaging_npixel=npixel, imaging_cellsize=cellsize)
+    ).create_dirty_image(vis)
+    rascil_dirty = RascilDirtyImager(
+        RascilDirtyImagerConfig(imaging_npixel=npixel, imaging_cellsize=cellsize)
+    ).create_dirty_image(vis)
+
+    assert dirty.data.shape == rascil_dirty.data.shape
+    assert dirty.header["CRPIX1"] == rascil_dirty.header["CRPIX1"]
+    assert np.argmax(dirty.data) == np.argmax(rascil_dirty.data)
+    correlation = np.corrcoef(dirty.data.ravel(), rascil_dirty.data.ravel())[0, 1]
+    assert correlation > 0.99
+    # same flux-scale, the kernels just differ slightly
+    assert np.max(dirty.data) == pytest.approx(np.max(rascil_dirty.data), rel=0.05)
+
+    # a plain DirtyImagerConfig gets the defaults of the NumPy specific parameters
+    imager = NumpyDirtyImager(
+        DirtyImagerConfig(imaging_npixel=npixel, imaging_cellsize=cellsize)
+    )
+    assert isinstance(imager.config, NumpyDirtyImagerConfig)
+    assert imager.config.kernel_support == NumpyDirtyImagerConfig.kernel_support
+    assert np.array_equal(imager.create_dirty_image(vis).data, dirty.data)
+
+
+def test_numpy_dirty_image_from_vis_file():
+    # a 1 Jy point-source at the phase centre peaks at 1 Jy/beam in each channel
+    sky_data = np.zeros((1, 12))
+    sky_data[0, :3] = [240, -70, 1]
+    sky_data[0, 6] = 100e6  # reference frequency
+    sky = SkyModel(sources=sky_data)
+    telescope = Telescope.constructor("SKA1MID", backend=SimulatorBackend.OSKAR)
+    observation = Observation(
+        start_frequency_hz=100e6,
+        start_date_and_time=datetime(2024, 3, 15, 10, 46, 0),
+        phase_centre_ra_deg=240,
+        phase_centre_dec_deg=-70,
+        number_of_time_steps=12,  # more than one block per .vis file
+        frequency_increment_hz=20e6,
+        number_of_channels=2,
+    )
+    visibility = InterferometerSimulation(
+        channel_bandwidth_hz=1e6, time_average_sec=10
+    ).run_simulation(telescope, sky, observation)
+    assert os.path.exists(visibility.vis_path)
+
+    npixel = 512
+    imager = NumpyDirtyImager(
+        NumpyDirtyImagerConfig(
+            imaging_npixel=npixel,
+            imaging_cellsize=3 / 180 * np.pi / npixel,
+            combine_across_frequencies=False,
+        )
+    )
+    dirty = imager.create_dirty_image(visibility)
+    assert dirty.data.shape == (2, 1, npixel, npixel)
+    for channel in dirty.data[:, 0]:
+        assert np.unravel_index(np.argmax(channel), channel.shape) == (
+            npixel // 2,
+            npixel // 2,
+        )
+        assert np.max(channel) == pytest.approx(1.0, rel=0.01)
+
+    # the .vis file and the MS hold the same visibilities
+    ms_dirty = imager.create_dirty_image(
+        Visibility.read_from_file(visibility.ms_file_path)
+    )
+    assert np.allclose(dirty.data, ms_dirty.data, atol=1e-6)
+
+
 def test_dirty_image_resample(tobject: TFiles):
     vis = Visibility.read_from_file(tobject.visibilities_gleam_ms)
     SHAPE = 2048
@@ -124,6 +202,31 @@ def test_dirty_image_cutout(tobject: TFiles):
     )
 
 
+def test_lazy_image_io(tobject: TFiles):
+    vis = Visibility.read_from_file(tobject.visibilities_gleam_ms)
+    dirty_imager = auto_choose_dirty_imager_from_vis(
+        vis,
+        DirtyImagerConfig(
+            imaging_npixel=512,
+            imaging_cellsize=3.878509448876288e-05,
+        ),
+    )
+    dirty = dirty_imager.create_dirty_image(vis)
+
+    # in-memory images get written on first access of `path` only
+    cutout = dirty.cutout((256, 256), (100, 100))
+    assert cutout._path is None
+    restored_path = cutout.path
+    assert os.path.exists(restored_path)
+    assert np.array_equal(Image(path=restored_path).data, cutout.data)
+
+    # modifying the data invalidates the written file, which gets rewritten
+    cutout.resample((50, 50))
+    assert cutout._path is None
+    assert cutout.path == restored_path
+    assert Image(path=cutout.path).data.shape == (1, 1, 50, 50)
+
+
 def test_dirty_image_N_cutout(tobject: TFiles):
     vis = Visibility.read_from_file(tobject.visibilities_gleam_ms)
 
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_BACKENDS = (
+    "oskar",
+    "rascil",
+    "ska_sdp_func_python",
+    "bdsf",
+    "tools21cm",
+    "distributed",
+    "dask_mpi",
+    "mpi4py",
+    "matplotlib.pyplot",
+    "reproject",
+)
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "karabo",
+        "karabo.util.file_handler",
+        "karabo.util.dask",
+        "karabo.simulation.sky_model",
+        "karabo.simulation.telescope",
+        "karabo.simulation.interferometer",
+        "karabo.imaging.image",
+        "karabo.imaging.util",
+        "karabo.sourcedetection.result",
+    ],
+)
+def test_import_does_not_load_backends(module: str) -> None:
+    # a fresh interpreter is needed, the test-session already imported everything
+    script = (
+        f"import sys, {module}\n"
+        + f"print([m for m in {_HEAVY_BACKENDS!r} if m in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert output.strip().splitlines()[-1] == "[]"
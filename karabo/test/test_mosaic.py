@@ -24,3 +24,25 @@ def test_ImageMosaicker(tobject: TFiles):
     dirty_mosaic = mosaicker.mosaic(dirties)[0]
     assert dirty.data.shape[2:] == dirty_mosaic.data.shape[2:]
     assert np.linalg.norm(dirty.data[0, 0, :, :] - dirty_mosaic.data[0, 0, :, :]) < 1e-6
+
+
+def test_ImageMosaicker_tiled(tobject: TFiles):
+    vis = Visibility.read_from_file(tobject.visibilities_gleam_ms)
+
+    dirty_imager = auto_choose_dirty_imager_from_vis(
+        vis,
+        DirtyImagerConfig(
+            imaging_npixel=1024,
+            imaging_cellsize=3.878509448876288e-05,
+        ),
+    )
+    dirty = dirty_imager.create_dirty_image(vis)
+
+    dirties = dirty.split_image(N=4, overlap=50)
+    mosaic, footprint = ImageMosaicker().mosaic(dirties)
+    tiled_mosaic, tiled_footprint = ImageMosaicker(
+        tile_shape=(300, 200), n_workers=4
+    ).mosaic(dirties)
+    assert isinstance(tiled_footprint, np.memmap)
+    assert np.allclose(tiled_footprint, footprint)
+    assert np.allclose(tiled_mosaic.data, mosaic.data, equal_nan=True)
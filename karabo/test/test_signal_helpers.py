@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.typing import NDArray
+
+from karabo.simulation.signal.helpers import map_radec_datapoints_to_grid
+
+
+def _map_radec_datapoints_per_pixel(
+    data: pd.DataFrame, grid_size: tuple[int, int]
+) -> NDArray[np.float_]:
+    """Reference: median of the positive intensities, filtered pixel by pixel.
+
+    Like the former implementation, but a pixel ends where the next one begins.
+    """
+    x_min, x_max = data["ra"].agg(["min", "max"])
+    y_min, y_max = data["dec"].agg(["min", "max"])
+    x_delta = (x_max - x_min) / grid_size[0]
+    y_delta = (y_max - y_min) / grid_size[1]
+
+    grid = np.zeros(grid_size)
+    for x in range(grid_size[0]):
+        x_beg = x_min + x * x_delta
+        x_end = x_min + (x + 1) * x_delta if x < grid_size[0] - 1 else x_beg + x_delta
+        ra_filter = (data["ra"] >= x_beg) & (data["ra"] < x_end)
+        for y in range(grid_size[1]):
+            y_beg = y_min + y * y_delta
+            y_end = (
+                y_min + (y + 1) * y_delta if y < grid_size[1] - 1 else y_beg + y_delta
+            )
+            dec_filter = (data["dec"] >= y_beg) & (data["dec"] < y_end)
+            filt = data.loc[ra_filter & dec_filter, "intensity"]
+            grid[x, y] = np.median(filt[filt > 0]) if (filt > 0).any() else np.nan
+    return np.nan_to_num(grid)
+
+
+@pytest.mark.parametrize("grid_size", [(7, 5), (12, 12)])
+def test_map_radec_datapoints_to_grid(grid_size: tuple[int, int]) -> None:
+    rng = np.random.default_rng(42)
+    n_points = 400
+    ra = rng.uniform(10, 20, n_points)
+    dec = rng.uniform(-40, -30, n_points)
+    # datapoints just in the lower half, so the upper pixels stay empty
+    dec = np.where(dec > -32, -40 + (dec + 40) / 5, dec)
+    # datapoints exactly on the bin-edges, including the grid's bounds
+    ra[: grid_size[0]] = 10 + np.arange(grid_size[0]) * (10 / grid_size[0])
+    dec[: grid_size[1]] = -40 + np.arange(grid_size[1]) * (10 / grid_size[1])
+    ra[-2:], dec[-2:] = 20, -30
+    intensity = rng.normal(1, 1, n_points)  # some are non-positive
+    data = pd.DataFrame({"ra": ra, "dec": dec, "intensity": intensity})
+
+    grid = map_radec_datapoints_to_grid(data, grid_size, "ra", "dec", "intensity")
+    expected = _map_radec_datapoints_per_pixel(data, grid_size)
+    assert grid.shape == grid_size
+    assert np.any(expected == 0) and np.any(expected > 0)
+    assert np.array_equal(grid, expected)
+
+    for reduction, reduce in (("mean", np.mean), ("sum", np.sum)):
+        reduced = map_radec_datapoints_to_grid(
+            data, grid_size, "ra", "dec", "intensity", reduction=reduction
+        )
+        x, y = np.argwhere(expected > 0)[0]
+        x_delta, y_delta = 10 / grid_size[0], 10 / grid_size[1]
+        in_pixel = (
+            (ra >= 10 + x * x_delta)
+            & (ra < 10 + (x + 1) * x_delta)
+            & (dec >= -40 + y * y_delta)
+            & (dec < -40 + (y + 1) * y_delta)
+            & (intensity > 0)
+        )
+        assert reduced[x, y] == pytest.approx(reduce(intensity[in_pixel]))
+        assert np.array_equal(reduced == 0, grid == 0)
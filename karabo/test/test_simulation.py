@@ -17,10 +17,12 @@ from karabo.imaging.imager_base import DirtyImagerConfig
 from karabo.imaging.imager_rascil import RascilDirtyImager, RascilDirtyImagerConfig
 from karabo.imaging.util import auto_choose_dirty_imager_from_vis
 from karabo.simulation.interferometer import InterferometerSimulation
+from karabo.simulation.line_emission_helpers import convert_frequency_to_z
 from karabo.simulation.observation import Observation, ObservationParallized
 from karabo.simulation.sky_model import SkyModel
 from karabo.simulation.telescope import Telescope
 from karabo.simulator_backend import SimulatorBackend
+from karabo.util.file_handler import FileHandler
 
 
 # DownloadObject instances used to download different golden files:
@@ -102,6 +104,145 @@ def test_backend_simulations(
     assert len(dirty.data.shape) == 4
 
 
+def test_rascil_dft_kernels() -> None:
+    sky = SkyModel.get_random_poisson_disk_sky((220, -60), (260, -80), 1, 1, 1)
+    # sources are placed onto channels by redshift, spread them over both channels
+    channel_centers_hz = np.array([110e6, 130e6])
+    sky[:, 13] = convert_frequency_to_z(
+        channel_centers_hz[np.arange(sky.num_sources) % 2]
+    )
+    telescope = Telescope.constructor("MID", backend=SimulatorBackend.RASCIL)
+    observation = Observation(
+        start_frequency_hz=100e6,
+        start_date_and_time=datetime(2024, 3, 15, 10, 46, 0),
+        phase_centre_ra_deg=240,
+        phase_centre_dec_deg=-70,
+        number_of_time_steps=4,
+        frequency_increment_hz=20e6,
+        number_of_channels=2,
+    )
+    visibilities = [
+        InterferometerSimulation(
+            channel_bandwidth_hz=1e6,
+            time_average_sec=10,
+            use_dask=False,
+            dft_compute_kernel=dft_compute_kernel,
+        ).run_simulation(telescope, sky, observation, backend=SimulatorBackend.RASCIL)
+        for dft_compute_kernel in ("cpu_looped", "cpu_blockwise")
+    ]
+    looped, blockwise = (vis["vis"].data for vis in visibilities)
+    assert np.all(np.any(looped != 0, axis=(0, 1, 3)))  # each channel has signal
+    assert np.allclose(looped, blockwise, atol=1e-9 * np.max(np.abs(looped)))
+
+
+def test_sky_chunked_simulation() -> None:
+    sky = SkyModel.get_random_poisson_disk_sky((220, -60), (260, -80), 1, 1, 1)
+    telescope = Telescope.constructor("SKA1MID", backend=SimulatorBackend.OSKAR)
+    observation = Observation(
+        start_frequency_hz=100e6,
+        start_date_and_time=datetime(2024, 3, 15, 10, 46, 0),
+        phase_centre_ra_deg=240,
+        phase_centre_dec_deg=-70,
+        number_of_time_steps=12,  # more than one block per .vis file
+        frequency_increment_hz=20e6,
+        number_of_channels=2,
+    )
+    dirty_imager = RascilDirtyImager(
+        RascilDirtyImagerConfig(
+            imaging_npixel=512,
+            imaging_cellsize=3 / 180 * np.pi / 512,
+        )
+    )
+    with pytest.raises(RuntimeError):
+        InterferometerSimulation(
+            split_idxs_per_group=[1], max_sky_chunk_memory="1MB", use_dask=False
+        )
+
+    split_idx = sky.num_sources // 2
+    dirty_images = []
+    for split_idxs_per_group in (None, [split_idx]):
+        simulation = InterferometerSimulation(
+            channel_bandwidth_hz=1e6,
+            time_average_sec=10,
+            split_idxs_per_group=split_idxs_per_group,
+            use_dask=False,
+        )
+        visibility = simulation.run_simulation(telescope, sky, observation)
+        if split_idxs_per_group is not None:
+            # just the combined MS is left, the chunk .vis files are removed
+            assert os.path.exists(visibility.ms_file_path)
+            assert not os.path.exists(visibility.vis_path)
+            assert not any(
+                name.startswith("simulation-sky-chunks-")
+                for name in os.listdir(FileHandler.stm())
+            )
+        dirty_images.append(dirty_imager.create_dirty_image(visibility).data)
+
+    # visibilities are linear in the sky, so chunks must add up to the full sky
+    full, chunked = dirty_images
+    assert np.allclose(full, chunked, atol=1e-5 * np.max(np.abs(full)))
+
+
+def test_cached_simulation(monkeypatch: pytest.MonkeyPatch) -> None:
+    sky = SkyModel.get_random_poisson_disk_sky((220, -60), (260, -80), 1, 1, 1)
+    telescope = Telescope.constructor("SKA1MID", backend=SimulatorBackend.OSKAR)
+    observation = Observation(
+        start_frequency_hz=100e6,
+        start_date_and_time=datetime(2024, 3, 15, 10, 46, 0),
+        phase_centre_ra_deg=240,
+        phase_centre_dec_deg=-70,
+        number_of_time_steps=4,
+        frequency_increment_hz=20e6,
+        number_of_channels=1,
+    )
+    simulations = [
+        InterferometerSimulation(
+            channel_bandwidth_hz=1e6,
+            time_average_sec=10,
+            noise_enable=True,
+            noise_seed=42,
+            use_dask=False,
+            use_cache=True,
+        )
+        for _ in range(2)
+    ]
+    # output-paths are not part of the key, the content of the inputs is
+    keys = [
+        simulation._get_simulation_cache_key(telescope, sky, observation)
+        for simulation in simulations
+    ]
+    assert keys[0] == keys[1]
+    # a lazy sky is hashed block by block, but to the same key
+    assert sky.sources is not None
+    dask_sky = SkyModel(sources=sky.sources.chunk({sky.sources.dims[0]: 3}))
+    assert (
+        simulations[0]._get_simulation_cache_key(telescope, dask_sky, observation)
+        == keys[0]
+    )
+    other_sky = SkyModel.get_random_poisson_disk_sky((220, -60), (260, -80), 2, 3, 1)
+    assert (
+        simulations[0]._get_simulation_cache_key(telescope, other_sky, observation)
+        != keys[0]
+    )
+
+    visibility = simulations[0].run_simulation(telescope, sky, observation)
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("Simulation ran despite a cache-hit.")
+
+    monkeypatch.setattr(
+        InterferometerSimulation,
+        "_InterferometerSimulation__setup_run_simulation_oskar",
+        fail,
+    )
+    cached_visibility = simulations[1].run_simulation(telescope, sky, observation)
+    assert cached_visibility.vis_path != visibility.vis_path
+    with open(visibility.vis_path, "rb") as f, open(
+        cached_visibility.vis_path, "rb"
+    ) as f_cached:
+        assert f.read() == f_cached.read()
+
+
 def test_simulation_meerkat(
     continuous_fits_filename: str, continuous_fits_downloader: SingleFileDownloadObject
 ) -> None:
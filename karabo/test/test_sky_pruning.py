@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from karabo.simulation.sky_model import SkyModel
+from karabo.simulation.sky_pruning import (
+    gaussian_beam_power,
+    local_sidereal_time_deg,
+    max_altitude_deg,
+    prune_sky,
+)
+
+
+def test_local_sidereal_time_deg() -> None:
+    times = np.array(["2000-01-01T12:00:00", "1987-04-10T00:00:00"], "datetime64[s]")
+    lst = local_sidereal_time_deg(times, longitude_deg=0.0)
+    # Meeus, Astronomical Algorithms, example 12.a: 13h10m46.3668s
+    expected = [280.46061837, (13 + 10 / 60 + 46.3668 / 3600) * 15]
+    assert lst == pytest.approx(expected, abs=1e-5)
+    assert local_sidereal_time_deg(times, longitude_deg=20.0) == pytest.approx(
+        np.mod(lst + 20.0, 360.0)
+    )
+
+
+def test_max_altitude_deg() -> None:
+    latitude_deg = 50.0
+    ra_deg = np.array([100.0, 100.0, 75.0])
+    dec_deg = np.array([50.0, 50.0, -80.0])
+    # the 1st source transits at the zenith within the interval
+    altitude = max_altitude_deg(
+        ra_deg[:1], dec_deg[:1], latitude_deg, np.array([70.0]), lst_span_deg=60.0
+    )
+    assert altitude == pytest.approx([90.0])
+    # ends 20 deg before the transit, a 2nd interval doesn't get any closer
+    altitude = max_altitude_deg(
+        ra_deg, dec_deg, latitude_deg, np.array([70.0, 230.0]), lst_span_deg=10.0
+    )
+    expected_sin = np.sin(np.radians(50.0)) ** 2 + np.cos(
+        np.radians(50.0)
+    ) ** 2 * np.cos(np.radians(20.0))
+    assert altitude[0] == pytest.approx(np.degrees(np.arcsin(expected_sin)))
+    assert altitude[1] == altitude[0]
+    # transits, but never rises
+    assert altitude[2] == pytest.approx(-40.0)
+
+
+def test_gaussian_beam_power() -> None:
+    power = gaussian_beam_power(
+        np.array([20.0, 21.0, 20.0]),
+        np.array([-30.0, -30.0, -31.0]),
+        phase_centre_deg=(20.0, -30.0),
+        fwhm_deg=2.0,
+    )
+    assert power[0] == pytest.approx(1.0)
+    assert power[2] == pytest.approx(0.5)
+    assert power[1] > 0.5  # 1 deg in RA is less than 1 deg at dec -30
+
+
+def test_prune_sky(sky_data: NDArray[np.float64]) -> None:
+    # MeerKAT
+    longitude_deg, latitude_deg = 21.443, -30.713
+    sky_data = np.vstack([sky_data, sky_data[:1], sky_data[:1]])
+    sky_data[:, 2] = 1.0
+    sky_data[-2, :2] = [20.0, 70.0]  # never rises
+    sky_data[-1, :2] = [40.0, -30.0]  # far outside the beam
+    sky = SkyModel(sky_data)
+    kwargs: Dict[str, Any] = dict(
+        sky=sky,
+        longitude_deg=longitude_deg,
+        latitude_deg=latitude_deg,
+        start_times=[datetime(2000, 3, 20, 12, 6, 39)],
+        length=timedelta(hours=3),
+        phase_centre_deg=(20.0, -30.0),
+    )
+
+    pruned_sky, report = prune_sky(**kwargs)
+    assert report.n_below_horizon == report.n_removed == 1
+    assert report.removed_flux_fraction == pytest.approx(1 / sky.num_sources)
+    assert pruned_sky.num_sources == sky.num_sources - 1
+    assert pruned_sky.precision == sky.precision
+    assert str(report).startswith(f"Pruned 1 of {sky.num_sources} sources")
+
+    pruned_sky, report = prune_sky(
+        **kwargs, min_apparent_flux_jy=0.1, beam_fwhm_deg=2.0
+    )
+    assert (report.n_below_horizon, report.n_faint) == (1, 1)
+    assert report.removed_flux_fraction == pytest.approx(2 / sky.num_sources)
+    assert pruned_sky.num_sources == sky.num_sources - 2
+    assert np.all(pruned_sky[:, 0].to_numpy() < 30.0)
+    assert sky.num_sources == sky_data.shape[0]
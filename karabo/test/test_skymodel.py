@@ -6,11 +6,14 @@ from dataclasses import fields
 from typing import Any, Dict, TypedDict, Union, get_args
 
 import astropy.units as u
+import dask.array as da
 import numpy as np
 import pytest
 import xarray as xr
+from astropy.coordinates import SkyCoord
 from astropy.io.fits import ColDefs, Column
 from astropy.units import UnitBase, UnitConversionError
+from astropy.wcs import WCS
 from numpy.typing import NDArray
 from ska_sdp_datamodels.science_data_model.polarisation_model import PolarisationFrame
 
@@ -29,10 +32,12 @@ from karabo.simulation.sky_model import (
     Polarisation,
     SkyModel,
     SkyPrefixMapping,
+    SkyQuery,
     SkySourcesColName,
     SkySourcesUnits,
 )
 from karabo.simulator_backend import SimulatorBackend
+from karabo.util.file_handler import FileHandler
 
 
 @pytest.fixture(scope="function")
@@ -77,6 +82,40 @@ def test_filter_sky_model(gleam: SkyModel):
     assert len(filtered_sky_euclidean_approx.sources) == len(filtered_sky.sources)
 
 
+def test_filter_sky_model_spatial_index():
+    rng = np.random.default_rng(seed=42)
+    n_sources = 10000
+    sky_data = np.zeros((n_sources, SkyModel.SOURCES_COLS))
+    sky_data[:, 0] = rng.uniform(0, 360, n_sources)
+    sky_data[:, 1] = np.degrees(np.arcsin(rng.uniform(-1, 1, n_sources)))
+    sky_data[:, 2] = rng.uniform(0.1, 1, n_sources)
+    sky = SkyModel(sky_data)
+    ra0, dec0 = 20.0, -30.0
+    scan_sky, scan_idxs = sky.filter_by_radius_euclidean_flat_approximation(
+        2, 10, ra0, dec0, indices=True
+    )
+
+    index = sky.build_spatial_index()
+    assert sky.spatial_index is index
+    index_sky, index_idxs = sky.filter_by_radius_euclidean_flat_approximation(
+        2, 10, ra0, dec0, indices=True
+    )
+    assert np.array_equal(scan_idxs, index_idxs)
+    assert np.array_equal(scan_sky.to_np_array(), index_sky.to_np_array())
+    assert index_sky.spatial_index is None  # index doesn't apply to filtered sky
+
+    cone_sky, cone_idxs = sky.filter_by_radius(0, 10, ra0, dec0, indices=True)
+    assert cone_sky.num_sources == cone_idxs.shape[0] > 0
+    center = SkyCoord(ra=ra0 * u.deg, dec=dec0 * u.deg)
+    separations = center.separation(
+        SkyCoord(ra=sky_data[:, 0] * u.deg, dec=sky_data[:, 1] * u.deg)
+    ).deg
+    assert np.array_equal(cone_idxs, np.where(separations <= 10)[0])
+
+    sky[0, 2] = 2.0  # modifying `sources` invalidates the index
+    assert sky.spatial_index is None
+
+
 def test_init(sky_data_with_ids: NDArray[np.object_]):
     sky1 = SkyModel()
     sky1.add_point_sources(sky_data_with_ids)
@@ -129,11 +168,204 @@ def test_read_sky_model(gleam: SkyModel):
         assert gleam.sources.shape == sky2.sources.shape
 
 
+def test_sky_query(sky_data_with_ids: NDArray[np.object_]):
+    sky = SkyModel(sky_data_with_ids)
+    chained_sky = sky.filter_by_radius_euclidean_flat_approximation(
+        0, 0.6, 20, -30
+    ).filter_by_flux(1, 3)
+    query = (
+        sky.query()
+        .filter_by_radius_euclidean_flat_approximation(0, 0.6, 20, -30)
+        .filter_by_flux(1, 3)
+    )
+    queried_sky = query.to_sky_model()
+    assert np.array_equal(
+        queried_sky.to_np_array(with_obj_ids=True),
+        chained_sky.to_np_array(with_obj_ids=True),
+    )
+    assert np.array_equal(sky.query().indices(), np.arange(sky.num_sources))
+
+    dask_sky = SkyModel(sky.sources.chunk({"dim_0": 2}))
+    dask_sky_idxs = (
+        dask_sky.query()
+        .filter_by_radius_euclidean_flat_approximation(0, 0.6, 20, -30)
+        .filter_by_flux(1, 3)
+        .indices()
+    )
+    assert np.array_equal(dask_sky_idxs, query.indices())
+
+    sky.build_spatial_index()
+    assert np.array_equal(query.indices(), dask_sky_idxs)
+
+
+def test_column_index_and_partition():
+    rng = np.random.default_rng(0)
+    n_sources = 5_000
+    data = np.zeros((n_sources, 14))
+    data[:, 0] = rng.uniform(0, 10, n_sources)
+    data[:, 1] = rng.uniform(-10, 0, n_sources)
+    data[:, 2] = rng.uniform(0, 1, n_sources)
+    data[:, 13] = np.round(rng.uniform(0.5, 1.5, n_sources), 2)
+    sky = SkyModel(sources=data)
+
+    def query(sky: SkyModel) -> SkyQuery:
+        return sky.query().filter_by_column(13, 0.8, 1.1).filter_by_flux(0.2, 0.9)
+
+    expected = query(sky).indices()
+    sky.build_column_index(13)
+    assert sky.get_column_index(13) is not None
+    assert np.array_equal(query(sky).indices(), expected)
+    sky.build_spatial_index()
+    assert np.array_equal(
+        query(sky).filter_by_radius(0, 3, 5, -5).indices(),
+        query(SkyModel(sources=data)).filter_by_radius(0, 3, 5, -5).indices(),
+    )
+
+    edges = [1.5, 1.2, 0.9, 0.6]  # decreasing, like redshifts of channels
+    partitions = sky.partition_by_column(13, edges)
+    assert len(partitions) == len(edges) - 1
+    for lower, upper, partition in zip(edges[1:], edges[:-1], partitions):
+        filtered = sky.filter_by_column(13, lower, upper)
+        assert partition.num_sources == filtered.num_sources
+        assert np.array_equal(
+            np.sort(partition[:, 2].to_numpy()), np.sort(filtered[:, 2].to_numpy())
+        )
+
+    # a lazy sky stays lazy, each partition just reads the blocks of its sources
+    n_block_loads = 0
+
+    def count_block_loads(block: NDArray[np.float_]) -> NDArray[np.float_]:
+        nonlocal n_block_loads
+        n_block_loads += 1
+        return block
+
+    data = data[np.argsort(data[:, 13], kind="stable")]
+    sky = SkyModel(sources=data)
+    partitions = sky.partition_by_column(13, edges)
+    dask_data = da.from_array(data, chunks=(1_000, -1))  # type: ignore[attr-defined]
+    dask_sky = SkyModel(
+        sources=xr.DataArray(dask_data.map_blocks(count_block_loads, dtype=data.dtype))
+    )
+    dask_sky.build_column_index(13)  # just loads the column
+    n_block_loads = 0
+    dask_partitions = dask_sky.partition_by_column(13, edges)
+    assert n_block_loads == 0
+    for lower, upper, dask_partition, partition in zip(
+        edges[1:], edges[:-1], dask_partitions, partitions
+    ):
+        n_block_loads = 0
+        assert np.array_equal(dask_partition.to_np_array(), partition.to_np_array())
+        in_bin = (data[:, 13] >= lower) & (data[:, 13] <= upper)
+        assert n_block_loads == len(np.unique(np.flatnonzero(in_bin) // 1_000))
+
+    sky[0, 13] = 0
+    assert sky.get_column_index(13) is None
+
+
+def test_columnar_store(sky_data_with_ids: NDArray[np.object_]):
+    sky = SkyModel(sky_data_with_ids)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store_path = os.path.join(tmpdir, "sky-store")
+        sky.save_sky_model_as_columnar_store(path=store_path, chunk_size=2)
+        with pytest.raises(FileExistsError):
+            sky.save_sky_model_as_columnar_store(path=store_path)
+
+        sky2 = SkyModel.get_sky_model_from_columnar_store(path=store_path)
+        assert sky2.sources.chunks is not None  # lazy
+        assert np.array_equal(sky2.to_np_array(), sky.to_np_array())
+        assert np.array_equal(
+            sky2.source_ids["dim_0"].to_numpy().astype(str),
+            sky_data_with_ids[:, -1].astype(str),
+        )
+
+        sky3 = SkyModel.get_sky_model_from_columnar_store(
+            path=store_path,
+            columns=["ra", "dec", "stokes_i"],
+            load_as="numpy_array",
+        )
+        assert sky3.sources.chunks is None
+        assert sky3.source_ids is None
+        assert np.array_equal(sky3[:, :3], sky[:, :3])
+        assert np.all(sky3[:, 3:] == 0)
+
+        # `wcs` & `precision` are restored as well
+        assert sky2.wcs is None and sky2.precision is np.float64
+        wcs = WCS(naxis=2)
+        wcs.wcs.ctype = ["RA---SIN", "DEC--SIN"]
+        wcs.wcs.crval = [250.0, -80.0]
+        sky4 = SkyModel(sky.sources, wcs=wcs, precision=np.float32)
+        store_path = os.path.join(tmpdir, "sky-store-wcs")
+        sky4.save_sky_model_as_columnar_store(path=store_path)
+        sky5 = SkyModel.get_sky_model_from_columnar_store(path=store_path)
+        assert sky5.precision is np.float32
+        assert sky5.wcs is not None
+        assert list(sky5.wcs.wcs.ctype) == ["RA---SIN", "DEC--SIN"]
+        assert np.allclose(sky5.wcs.wcs.crval, wcs.wcs.crval)
+
+
+def test_catalog_cache(
+    sky_data_with_ids: NDArray[np.object_], monkeypatch: pytest.MonkeyPatch
+):
+    n_loads = 0
+
+    def load() -> SkyModel:
+        nonlocal n_loads
+        n_loads += 1
+        sky = SkyModel()
+        sky.add_point_sources(sky_data_with_ids)
+        return sky
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.setattr(FileHandler, "root_ltm", tmpdir)
+        survey_file = os.path.join(tmpdir, "survey.fits")
+        with open(survey_file, "wb") as f:
+            f.write(b"catalog-v1")
+
+        def get_sky(**loader_args: Any) -> SkyModel:
+            return SkyModel._get_cached_catalog_sky(
+                survey_file=survey_file,
+                loader="test",
+                loader_args=loader_args,
+                load=load,
+            )
+
+        sky = get_sky(min_freq=None)
+        assert n_loads == 1
+        assert np.array_equal(sky[:, :14], load()[:, :14])
+        n_loads -= 1
+        cached_sky = get_sky(min_freq=None)
+        assert n_loads == 1
+        assert np.array_equal(cached_sky[:, :14], sky[:, :14])
+        assert np.array_equal(cached_sky.source_ids, sky.source_ids)
+        _ = get_sky(min_freq=1e8)  # other loader-args
+        assert n_loads == 2
+        with open(survey_file, "wb") as f:
+            f.write(b"catalog-v2")  # other checksum
+        _ = get_sky(min_freq=None)
+        assert n_loads == 3
+        _ = SkyModel._get_cached_catalog_sky(
+            survey_file=survey_file,
+            loader="test",
+            loader_args={"min_freq": None},
+            load=load,
+            use_cache=False,
+        )
+        assert n_loads == 4
+
+
 def test_get_cartesian(sky_data_with_ids: NDArray[np.object_]):
     sky1 = SkyModel()
     sky1.add_point_sources(sky_data_with_ids)
     cart_sky = sky1.get_cartesian_sky()
-    print(cart_sky)
+    assert cart_sky.shape == (sky1.num_sources, 3)
+    assert np.allclose(np.linalg.norm(cart_sky, axis=1), 1)
+    expected = SkyCoord(
+        ra=sky1[:, 0].to_numpy(), dec=sky1[:, 1].to_numpy(), unit="deg"
+    ).cartesian.xyz.value.T
+    assert np.allclose(cart_sky, expected)
+
+    sky2 = SkyModel(sources=sky1.sources.chunk({"dim_0": 2}))
+    assert np.allclose(sky2.get_cartesian_sky(), cart_sky)
 
 
 def test_cscs_resource_availability():
@@ -188,6 +188,33 @@ def test_automatic_assignment_of_ground_truth_and_prediction():
     ), "Automatic assignment of ground truth and detected is not correct"
 
 
+def test_optimal_assignment_of_ground_truth_and_prediction():
+    gtruth = np.random.randn(5000, 2) * 100
+    detected = np.flipud(gtruth)
+    assigment = SourceDetectionEvaluation.automatic_assignment_of_ground_truth_and_prediction(  # noqa
+        gtruth, detected, 0.5, method="optimal"
+    )
+    assert np.all(assigment[:, 0] == np.flipud(assigment[:, 1]))
+
+    # Greedy assigns the closest pair (1, 0) first and leaves the rest unassigned,
+    # while the optimal assignment finds a partner for every source.
+    gtruth = np.array([[0.0, 0.0], [1.9, 0.0]])
+    detected = np.array([[1.0, 0.0], [2.95, 0.0]])
+    greedy = SourceDetectionEvaluation.automatic_assignment_of_ground_truth_and_prediction(  # noqa
+        gtruth, detected, 1.1, method="greedy"
+    )
+    optimal = SourceDetectionEvaluation.automatic_assignment_of_ground_truth_and_prediction(  # noqa
+        gtruth, detected, 1.1, method="optimal"
+    )
+    assert SourceDetectionEvaluation.calculate_evaluation_measures(greedy)[0] == 1
+    assert SourceDetectionEvaluation.calculate_evaluation_measures(optimal) == (
+        2,
+        0,
+        0,
+    )
+    assert np.array_equal(optimal[:, :2], [[0, 0], [1, 1]])
+
+
 def test_full_source_detection(
     test_restored_filtered_example_gleam_downloader: SingleFileDownloadObject,
 ):
@@ -226,6 +253,19 @@ def test_full_source_detection(
     mse = np.linalg.norm(gtruth - detected, axis=1)
     assert np.all(mse < 1), "Source detection is not correct"
 
+    # Mosaics are cached on the result list until it gets invalidated
+    source_image = detection_results.get_source_image()
+    assert detection_results.get_source_image() is source_image
+    detection_results.clear_cache()
+    assert detection_results.get_source_image() is not source_image
+
+    # Keeping the most central detection of overlapping sources instead
+    detection_results.overlap_resolution = "central"
+    detected = detection_results.get_pixel_position_of_sources()
+    detected = detected[np.argsort(detected[:, 0])]
+    mse = np.linalg.norm(gtruth - detected, axis=1)
+    assert np.all(mse < 1), "Source detection is not correct"
+
 
 @pytest.mark.skipif(not RUN_GPU_TESTS, reason="GPU tests are disabled")
 def test_create_detection_from_ms_cuda():
@@ -7,22 +7,32 @@ import json
 import os
 import shutil
 import sys
-import time
 from collections.abc import Iterable
-from typing import Any, Callable, List, Literal, Optional, Tuple, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from warnings import warn
 
 import psutil
 from dask import compute, delayed  # type: ignore[attr-defined]
-from dask.distributed import Client, LocalCluster, Nanny, Worker
-from dask_mpi import initialize
-from mpi4py import MPI
 from typing_extensions import assert_never
 
-from karabo.util.data_util import extract_chars_from_string, extract_digit_from_string
+from karabo.util.data_util import extract_chars_from_string
 from karabo.util.file_handler import FileHandler
 from karabo.warning import KaraboWarning
 
+if TYPE_CHECKING:
+    from dask.distributed import Client
+
 
 class DaskHandlerBasic:
     """Base-class for dask-handler functionality.
@@ -78,7 +88,12 @@ class DaskHandlerBasic:
         """
         if cls.dask_client is not None:
             return cls.dask_client
+        from mpi4py import MPI
+
         if MPI.COMM_WORLD.Get_size() > 1:  # TODO: testing of whole if-block
+            from dask.distributed import Client
+            from dask_mpi import initialize
+
             n_threads_per_worker = cls.n_threads_per_worker
             if n_threads_per_worker is None:
                 initialize(comm=MPI.COMM_WORLD)
@@ -204,6 +219,8 @@ class DaskHandlerBasic:
         Returns:
             Created dask-client.
         """
+        from dask.distributed import Client
+
         n_workers = cls._calc_num_of_workers()
         client = Client(
             n_workers=n_workers,
@@ -227,12 +244,16 @@ class DaskHandlerSlurm(DaskHandlerBasic):
     timeout: int
         Timeout in seconds for the dask-scheduler to wait for all the
         workers to connect.
+    scheduler_port: Optional[int]
+        Port of the dask-scheduler on the first node. If None, the scheduler
+        binds to a free port, which the other nodes read from its scheduler-file.
     """
 
     use_workers_or_nannies: Literal["workers", "nannies"] = "nannies"
     n_workers_scheduler_node: int = 1
     # with processes because they spawn subprocesses.
     timeout: int = 60
+    scheduler_port: Optional[int] = None
 
     _nodes_prepared: bool = False
 
@@ -250,7 +271,7 @@ class DaskHandlerSlurm(DaskHandlerBasic):
             cls.setup()
         if cls.get_number_of_nodes() > 1:
             dask_client = cast(  # dask_client is None if not first-node
-                Client,  # however, needed workaround to keep api-compatibility
+                "Client",  # however, needed workaround to keep api-compatibility
                 cls._setup_dask_for_slurm(),
             )
             if dask_client is not None:
@@ -335,15 +356,16 @@ class DaskHandlerSlurm(DaskHandlerBasic):
 
     @classmethod
     def _setup_nannies_workers_for_slurm(cls) -> None:
-        """Setup nannies & workers."""
-        # Wait until dask info file is created
-        _, dask_info_address, dask_run_status = cls._get_dask_paths_for_slurm()
-        while not os.path.exists(dask_info_address):
-            time.sleep(1)
+        """Setup nannies & workers.
 
-        # Load dask info file
-        with open(dask_info_address, "r") as f:
-            dask_info = json.load(f)
+        All workers (or nannies) of this node are started concurrently in a single
+        event-loop. They read the address the scheduler actually bound from dask's
+        scheduler-file (see `_get_dask_scheduler_file`), which dask waits for on its
+        own. The process stays alive until all of them are closed, which happens
+        when the scheduler shuts down.
+        """
+        scheduler_file = cls._get_dask_scheduler_file()
+        n_workers = cls._calc_num_of_workers()
 
         # Calculate memory usage of each worker
         if cls.memory_limit is None:
@@ -351,49 +373,67 @@ class DaskHandlerSlurm(DaskHandlerBasic):
         else:
             memory_limit = f"{cls.memory_limit}GB"
 
-        async def start_worker(scheduler_address: str) -> Worker:
-            worker = await Worker(
-                scheduler_address,
-                nthreads=cls.n_threads_per_worker,
+        asyncio.run(
+            cls._run_nannies_workers(
+                scheduler_file=scheduler_file,
+                n_workers=n_workers,
                 memory_limit=memory_limit,
             )
-            await worker.finished()
-            return worker  # type: ignore[no-any-return]
+        )
 
-        async def start_nanny(scheduler_address: str) -> Nanny:
-            nanny = await Nanny(
-                scheduler_address,
-                nthreads=cls.n_threads_per_worker,
-                memory_limit=memory_limit,
-            )
-            await nanny.finished()
-            return nanny  # type: ignore[no-any-return]
-
-        scheduler_address = str(dask_info["scheduler_address"])
-        n_workers = int(str(dask_info["n_workers_per_node"]))
-
-        # Start workers or nannies
-        workers_or_nannies: List[Union[Worker, Nanny]] = []
-        for _ in range(n_workers):
-            if cls.use_workers_or_nannies == "workers":
-                worker = asyncio.run(start_worker(scheduler_address))
-                workers_or_nannies.append(worker)
-            elif cls.use_workers_or_nannies == "nannies":
-                nanny = asyncio.run(start_nanny(scheduler_address))
-                workers_or_nannies.append(nanny)
-            else:
-                assert_never(cls.use_workers_or_nannies)
+        # Stop the script successfully
+        sys.exit(0)
 
-        # Keep the process alive
-        while os.path.exists(dask_run_status):
-            time.sleep(1)
+    @classmethod
+    async def _run_nannies_workers(
+        cls,
+        scheduler_file: str,
+        n_workers: int,
+        memory_limit: str,
+    ) -> None:
+        """Starts `n_workers` workers or nannies and waits until they're closed.
 
-        # Shutdown process
-        for worker_or_nanny in workers_or_nannies:
-            result = asyncio.run(worker_or_nanny.close())
-            if result == "OK":
-                pass
-            else:
+        Args:
+            scheduler_file: Scheduler-file of the dask-scheduler.
+            n_workers: Number of workers or nannies to start.
+            memory_limit: Memory limit of each worker.
+        """
+        from dask.distributed import Nanny, Worker
+
+        server_type: Union[Type[Worker], Type[Nanny]]
+        if cls.use_workers_or_nannies == "workers":
+            server_type = Worker
+        elif cls.use_workers_or_nannies == "nannies":
+            server_type = Nanny
+        else:
+            assert_never(cls.use_workers_or_nannies)
+
+        # Awaiting a server starts it, so `gather` starts them all concurrently
+        workers_or_nannies: List[Union[Worker, Nanny]] = await asyncio.gather(
+            *(
+                server_type(
+                    scheduler_file=scheduler_file,
+                    nthreads=cls.n_threads_per_worker,
+                    memory_limit=memory_limit,
+                )
+                for _ in range(n_workers)
+            )
+        )
+
+        # Keep the process alive until the scheduler closes the workers
+        try:
+            await asyncio.gather(
+                *(worker_or_nanny.finished() for worker_or_nanny in workers_or_nannies)
+            )
+        finally:
+            # Shutdown the ones which are still running (no-op for closed ones)
+            results = await asyncio.gather(
+                *(worker_or_nanny.close() for worker_or_nanny in workers_or_nannies),
+                return_exceptions=True,
+            )
+            for worker_or_nanny, result in zip(workers_or_nannies, results):
+                if result is None or result == "OK":
+                    continue
                 if isinstance(worker_or_nanny, Worker):
                     instance = "worker"
                 else:
@@ -403,9 +443,6 @@ class DaskHandlerSlurm(DaskHandlerBasic):
                     file=sys.stderr,
                 )
 
-        # Stop the script successfully
-        sys.exit(0)
-
     @classmethod
     def _setup_dask_for_slurm(cls) -> Optional[Client]:
         """Setup dask for slurm.
@@ -414,16 +451,21 @@ class DaskHandlerSlurm(DaskHandlerBasic):
             A dask-client if it's the first node, otherwise None.
         """
         if cls.is_first_node():
+            from dask.distributed import Client, LocalCluster
+
             _, dask_info_address, dask_run_status = cls._get_dask_paths_for_slurm()
             # Create file to show that the run is still ongoing
             with open(dask_run_status, "w") as f:
                 f.write("ongoing")
 
-            # Create client and scheduler
+            # Create client and scheduler. The other nodes connect to the
+            # address the scheduler writes into its scheduler-file.
             cluster = LocalCluster(
                 ip=cls.get_node_name(),
+                scheduler_port=cls.scheduler_port or 0,
                 n_workers=cls.n_workers_scheduler_node,
                 threads_per_worker=cls.n_threads_per_worker,
+                scheduler_kwargs={"scheduler_file": cls._get_dask_scheduler_file()},
             )
             dask_client = Client(cluster, proccesses=cls.use_proccesses)
 
@@ -436,9 +478,11 @@ class DaskHandlerSlurm(DaskHandlerBasic):
                 "n_workers_per_node": n_workers_per_node,
             }
 
-            # Write scheduler file
-            with open(dask_info_address, "w") as f:
+            # Write scheduler file (informative only, atomic to avoid partial reads)
+            dask_info_tmp_address = f"{dask_info_address}.tmp"
+            with open(dask_info_tmp_address, "w") as f:
                 json.dump(dask_info, f)
+            os.replace(dask_info_tmp_address, dask_info_address)
 
             # Wait until all workers are connected
             n_workers_requested = (
@@ -481,28 +525,54 @@ class DaskHandlerSlurm(DaskHandlerBasic):
         return dask_info_dir, dask_info_address, dask_run_status
 
     @classmethod
-    def _extract_node_ids_from_node_list(cls) -> List[int]:
-        """Extracts all node-ids of the current slurm-job as a list.
+    def _get_dask_scheduler_file(cls) -> str:
+        """Gets the path of the scheduler-file dask writes on the first node.
 
         Returns:
-            Node-ids.
+            Scheduler-file path.
+        """
+        dask_info_dir, _, _ = cls._get_dask_paths_for_slurm()
+        return os.path.join(dask_info_dir, "scheduler.json")
+
+    @classmethod
+    def _extract_node_id_strings_from_node_list(cls) -> List[str]:
+        """Extracts all node-ids of the current slurm-job as a list of `str`.
+
+        In contrast to `_extract_node_ids_from_node_list`, the ids keep their
+        zero-padding (e.g. "001" of "nid[001-004]").
+
+        Returns:
+            Node-ids as they appear in the node-names.
         """
         slurm_job_nodelist = cls._get_job_nodelist()
         if cls.get_number_of_nodes() == 1:
             # Node name will be something like "psanagpu115"
-            return [extract_digit_from_string(slurm_job_nodelist)]
+            base_string = cls._get_base_string_node_list()
+            return [slurm_job_nodelist[len(base_string) :]]
         node_list = slurm_job_nodelist.split("[")[1].split("]")[0]
         id_ranges = node_list.split(",")
-        node_ids: List[int] = []
+        node_ids: List[str] = []
         for id_range in id_ranges:
             if "-" in id_range:
                 min_id, max_id = id_range.split("-")
-                node_ids += [i for i in range(int(min_id), int(max_id) + 1)]
+                node_ids += [
+                    str(i).zfill(len(min_id))
+                    for i in range(int(min_id), int(max_id) + 1)
+                ]
             else:
-                node_ids.append(int(id_range))
+                node_ids.append(id_range)
 
         return node_ids
 
+    @classmethod
+    def _extract_node_ids_from_node_list(cls) -> List[int]:
+        """Extracts all node-ids of the current slurm-job as a list.
+
+        Returns:
+            Node-ids.
+        """
+        return [int(i) for i in cls._extract_node_id_strings_from_node_list()]
+
     @classmethod
     def _get_min_max_of_node_id(cls) -> Tuple[int, int]:
         """Returns the min max from SLURM_JOB_NODELIST.
@@ -542,7 +612,8 @@ class DaskHandlerSlurm(DaskHandlerBasic):
         Returns:
             Lowest node-name.
         """
-        return cls._get_base_string_node_list() + str(cls._get_lowest_node_id())
+        node_ids = cls._extract_node_id_strings_from_node_list()
+        return cls._get_base_string_node_list() + min(node_ids, key=int)
 
     @classmethod
     def get_number_of_nodes(cls) -> int:
@@ -563,8 +634,8 @@ class DaskHandlerSlurm(DaskHandlerBasic):
         """
         # Attention, often the node id starts with a 0.
         slurmd_nodename = cls.get_node_name()
-        len_id = len(cls._get_base_string_node_list())
-        return int(slurmd_nodename[-len_id:])
+        len_base_string = len(cls._get_base_string_node_list())
+        return int(slurmd_nodename[len_base_string:])
 
     @classmethod
     def get_node_name(cls) -> str:
@@ -746,3 +817,8 @@ class DaskHandler(DaskHandlerBasic):
             Created dask-client.
         """
         return cls._handler._get_local_dask_client()
+
+
+if DaskHandlerSlurm.is_on_slurm_cluster():
+    # Deferred from `import karabo` to the first usage of dask in Karabo.
+    DaskHandlerSlurm._prepare_slurm_nodes_for_dask()
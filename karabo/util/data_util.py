@@ -1,16 +1,19 @@
+from __future__ import annotations
+
 import os
 import re
 from types import ModuleType
-from typing import Any, Dict, List, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, cast
 
 import numpy as np
-import xarray as xr
 from numpy.typing import NDArray
-from scipy.special import wofz
 
 import karabo
 from karabo.util._types import NPFloatInpBroadType, NPFloatOutBroadType, NPIntFloat
 
+if TYPE_CHECKING:
+    import xarray as xr
+
 
 def get_module_absolute_path() -> str:
     path_elements = os.path.abspath(karabo.__file__).split(os.path.sep)
@@ -126,6 +129,8 @@ def Voigt(
     sigma: NPFloatInpBroadType,
     gamma: NPFloatInpBroadType,
 ) -> NPFloatOutBroadType:
+    from scipy.special import wofz
+
     # sigma = alpha / np.sqrt(2 * np.log(2))
     voigt = y0 + a * np.real(
         wofz((x - x0 + 1j * gamma) / sigma / np.sqrt(2))
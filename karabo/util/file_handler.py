@@ -1,22 +1,33 @@
 from __future__ import annotations
 
+import fcntl
 import glob
+import hashlib
 import os
 import random
 import shutil
+import socket
 import string
+import time
+import weakref
+from contextlib import contextmanager
 from copy import copy
+from functools import lru_cache
 from types import TracebackType
-from typing import Literal, Optional, Union, overload
+from typing import Dict, Iterator, List, Literal, Optional, Tuple, Union, overload
 
 from typing_extensions import assert_never
 
 from karabo.util._types import DirPathType, FilePathType
+from karabo.util.data_util import parse_size
 from karabo.util.plotting_util import Font
 
 _LongShortTermType = Literal["long", "short"]
 _SeedType = Optional[Union[str, int, float, bytes]]
 
+# hidden dir in a cache-dir holding access-markers, leases and the eviction-lock
+_CACHE_META_DIR_NAME = ".karabo-cache-meta"
+
 
 def _get_env_value(
     varname: str,
@@ -106,6 +117,49 @@ def _get_disk_cache_root(
     return tmpdir
 
 
+def _get_quota_from_env(varname: str) -> Optional[int]:
+    """Gets a cache-quota in bytes from an env-var like "50GB".
+
+    Args:
+        varname: Varname to get value from.
+
+    Returns:
+        Quota in bytes or None if not set.
+    """
+    if (env_value := _get_env_value(varname)) is None:
+        return None
+    return parse_size(env_value)
+
+
+def _get_dir_size(dir_path: str) -> int:
+    """Gets the size of all files in `dir_path` in bytes (symlinks not followed)."""
+    size = 0
+    for root, _, files in os.walk(dir_path):
+        for file in files:
+            try:
+                size += os.lstat(os.path.join(root, file)).st_size
+            except FileNotFoundError:  # removed in the meantime
+                pass
+    return size
+
+
+def _is_lease_alive(lease: str) -> bool:
+    """Checks if a lease "<host>-<pid>" belongs to a running process.
+
+    Leases of other hosts can't be checked and are therefore considered alive.
+    """
+    host, pid = lease.rsplit("-", 1)
+    if host != socket.gethostname():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # exists, but owned by someone else
+        return True
+    return True
+
+
 def _get_rnd_str(k: int, seed: _SeedType = None) -> str:
     """Creates a random ascii+digits string with length=`k`.
 
@@ -193,10 +247,26 @@ class FileHandler:
              └── <file>
 
     FileHanlder can be used the same way as `tempfile.TemporaryDirectory` using `with`.
+
+    Each cache-dir can be bounded by a quota in bytes through `quota_stm` and
+    `quota_ltm` (or the env-vars 'KARABO_STM_QUOTA' and 'KARABO_LTM_QUOTA' like
+    "50GB"). If set, the least recently used sub-dirs get evicted whenever a tmp-dir
+    is requested and the cache-dir exceeds its quota. Protected from eviction are
+    sub-dirs which are:
+    - bound to a live `unique` object or to a live `FileHandler` instance (STM),
+      pinned to a live object through `pin`, or within a `lease` block, also if
+      they belong to another running process (leases),
+    - accessed within the last `eviction_grace_period_sec` seconds.
+    The eviction is serialized by a file-lock, so processes can share the roots.
     """
 
     root_stm: str = _get_disk_cache_root(term="short")
     root_ltm: str = _get_disk_cache_root(term="long")
+    quota_stm: Optional[int] = _get_quota_from_env("KARABO_STM_QUOTA")
+    quota_ltm: Optional[int] = _get_quota_from_env("KARABO_LTM_QUOTA")
+    eviction_grace_period_sec: float = 600.0
+    # in-process reference-count of dirs bound to live objects
+    _pinned_dirs: Dict[str, int] = {}
 
     @classmethod
     def ltm(cls) -> str:
@@ -214,6 +284,8 @@ class FileHandler:
         """Creates `FileHandler` instance."""
         # tmps is an instance bound dirs and/or files registry for STM
         self.tmps: list[str] = list()
+        # unpins the dirs of `tmps` when cleaned or garbage-collected
+        self._unpin_finalizers: Dict[str, weakref.finalize] = dict()
 
     @classmethod
     def _get_term_dir(cls, term: _LongShortTermType) -> str:
@@ -295,6 +367,7 @@ class FileHandler:
                     + f"but is of type {type(unique)} instead."
                 ) from e
 
+        pin_to: Optional[object] = None
         if tmp_dir is not None:
             dir_path = tmp_dir
             exist_ok = True
@@ -306,6 +379,9 @@ class FileHandler:
             dir_path = os.path.join(dir_path, dir_name)
             if unique is not None:
                 setattr(unique, obj_tmp_dir_short_name, dir_path)
+                pin_to = unique
+            else:
+                pin_to = self
             self.tmps.append(dir_path)
             if seed is None:
                 exist_ok = False
@@ -334,8 +410,243 @@ class FileHandler:
             if purpose and len(purpose) > 0:
                 purpose = f" for {purpose}"
                 print(f"Creating {Font.BLUE}{Font.BOLD}{dir_path}{Font.END}{purpose}")
+        if pin_to is not None:
+            finalizer = FileHandler._pin(dir_path=dir_path, term=term, obj=pin_to)
+            if pin_to is self and finalizer is not None:
+                self._unpin_finalizers[dir_path] = finalizer
+        if mkdir and FileHandler._get_quota(term=term) is not None:
+            FileHandler._touch(dir_path=dir_path, term=term)
+            # recreate in case another process evicted it in the meantime
+            os.makedirs(dir_path, exist_ok=True)
+            FileHandler.evict(term=term)
         return dir_path
 
+    @classmethod
+    def _get_quota(cls, term: _LongShortTermType) -> Optional[int]:
+        if term == "short":
+            return cls.quota_stm
+        elif term == "long":
+            return cls.quota_ltm
+        else:
+            assert_never(term)
+
+    @classmethod
+    def _get_meta_dir(cls, term: _LongShortTermType, mkdir: bool = True) -> str:
+        meta_dir = os.path.join(cls._get_term_dir(term=term), _CACHE_META_DIR_NAME)
+        if mkdir:
+            os.makedirs(meta_dir, exist_ok=True)
+        return meta_dir
+
+    @staticmethod
+    def _get_lease_name(dir_path: str) -> str:
+        """Lease-file name of `dir_path` for this process."""
+        dir_name = os.path.basename(dir_path)
+        return f"{dir_name}.lease-{socket.gethostname()}-{os.getpid()}"
+
+    @classmethod
+    def _touch(cls, dir_path: str, term: _LongShortTermType) -> None:
+        """Marks `dir_path` as accessed now for the LRU-eviction."""
+        dir_name = os.path.basename(dir_path)
+        meta_dir = cls._get_meta_dir(term=term)
+        marker = os.path.join(meta_dir, f"{dir_name}.access")
+        with open(os.path.join(meta_dir, "evict.lock"), "a") as lock:
+            # not while an eviction is deciding what to evict
+            fcntl.flock(lock, fcntl.LOCK_SH)
+            with open(marker, "a"):
+                os.utime(marker)
+
+    @classmethod
+    def _pin(
+        cls, dir_path: str, term: _LongShortTermType, obj: object
+    ) -> Optional[weakref.finalize]:
+        """Protects `dir_path` from eviction as long as `obj` is alive."""
+        try:
+            finalizer = weakref.finalize(obj, FileHandler._unpin, dir_path, term)
+        except TypeError:  # not weak-referenceable, so it can't be tracked
+            return None
+        cls._acquire(dir_path=dir_path, term=term)
+        return finalizer
+
+    @classmethod
+    def _acquire(cls, dir_path: str, term: _LongShortTermType) -> None:
+        """Increments the pin-count of `dir_path`, see `_unpin` to release it."""
+        n_pins = FileHandler._pinned_dirs.get(dir_path, 0)
+        FileHandler._pinned_dirs[dir_path] = n_pins + 1
+        if n_pins == 0 and FileHandler._get_quota(term=term) is not None:
+            # lease for other processes sharing the cache
+            lease = os.path.join(
+                FileHandler._get_meta_dir(term=term),
+                FileHandler._get_lease_name(dir_path=dir_path),
+            )
+            with open(lease, "a"):
+                pass
+
+    @classmethod
+    def _get_cache_sub_dir(
+        cls, path: Union[str, FilePathType, DirPathType]
+    ) -> Optional[Tuple[str, _LongShortTermType]]:
+        """Gets the cache sub-dir and its term in which `path` is located.
+
+        Returns:
+            (sub-dir, term) or None if `path` isn't located in a cache sub-dir.
+        """
+        abs_path = os.path.abspath(str(path))
+        terms: Tuple[_LongShortTermType, ...] = ("short", "long")
+        for term in terms:
+            term_dir = cls._get_term_dir(term=term)
+            rel_path = os.path.relpath(abs_path, os.path.abspath(term_dir))
+            if rel_path == os.curdir or rel_path.startswith(os.pardir):
+                continue
+            dir_name = rel_path.split(os.path.sep)[0]
+            if dir_name == _CACHE_META_DIR_NAME:
+                continue
+            return os.path.join(term_dir, dir_name), term
+        return None
+
+    @classmethod
+    def pin(cls, path: Union[str, FilePathType, DirPathType], obj: object) -> None:
+        """Protects the cache sub-dir of `path` from eviction while `obj` is alive.
+
+        Objects which keep referring to files of a cache sub-dir (e.g. the .vis or
+        .MS of a `Visibility`) should pin them, because the `FileHandler` which
+        created the sub-dir is usually gone by then. Does nothing if `path` isn't
+        located in the STM or LTM, or if `obj` isn't weak-referenceable.
+
+        Args:
+            path: A cache sub-dir or a path inside of it.
+            obj: Object which uses `path`.
+        """
+        if (sub_dir := cls._get_cache_sub_dir(path=path)) is None:
+            return
+        dir_path, term = sub_dir
+        if cls._pin(dir_path=dir_path, term=term, obj=obj) is not None:
+            if cls._get_quota(term=term) is not None and os.path.exists(dir_path):
+                cls._touch(dir_path=dir_path, term=term)
+
+    @classmethod
+    @contextmanager
+    def lease(cls, path: Union[str, FilePathType, DirPathType]) -> Iterator[None]:
+        """Protects the cache sub-dir of `path` from eviction within a `with` block.
+
+        Meant for sub-dirs which are only used during a call, e.g. while an
+        external tool writes into it or while a cache-entry is copied out of it.
+        Does nothing if `path` isn't located in the STM or LTM.
+
+        Args:
+            path: A cache sub-dir or a path inside of it.
+        """
+        if (sub_dir := cls._get_cache_sub_dir(path=path)) is None:
+            yield
+            return
+        dir_path, term = sub_dir
+        cls._acquire(dir_path=dir_path, term=term)
+        try:
+            if cls._get_quota(term=term) is not None and os.path.exists(dir_path):
+                cls._touch(dir_path=dir_path, term=term)
+            yield
+        finally:
+            cls._unpin(dir_path=dir_path, term=term)
+            if cls._get_quota(term=term) is not None and os.path.exists(dir_path):
+                # the grace-period starts after the last use
+                cls._touch(dir_path=dir_path, term=term)
+
+    @staticmethod
+    def _unpin(dir_path: str, term: _LongShortTermType) -> None:
+        n_pins = FileHandler._pinned_dirs.pop(dir_path, 0) - 1
+        if n_pins > 0:
+            FileHandler._pinned_dirs[dir_path] = n_pins
+            return
+        lease = os.path.join(
+            FileHandler._get_meta_dir(term=term, mkdir=False),
+            FileHandler._get_lease_name(dir_path=dir_path),
+        )
+        try:
+            os.remove(lease)
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def evict(cls, term: _LongShortTermType = "short") -> List[str]:
+        """Evicts least recently used sub-dirs until the quota of `term` is met.
+
+        Does nothing if no quota is set for `term`. Protected sub-dirs (see class
+        docstring) are never evicted, so the quota might still be exceeded
+        afterwards.
+
+        Args:
+            term: "long" or "short" term memory
+
+        Returns:
+            Paths of the evicted sub-dirs.
+        """
+        quota = cls._get_quota(term=term)
+        term_dir = cls._get_term_dir(term=term)
+        if quota is None or not os.path.exists(term_dir):
+            return []
+        meta_dir = cls._get_meta_dir(term=term)
+        evicted: List[str] = []
+        with open(os.path.join(meta_dir, "evict.lock"), "a") as lock:
+            # serializes evictions of processes sharing the cache
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            sub_dirs = {
+                entry.name: entry.path
+                for entry in os.scandir(term_dir)
+                if entry.is_dir(follow_symlinks=False)
+                and entry.name != _CACHE_META_DIR_NAME
+            }
+            sizes = {name: _get_dir_size(path) for name, path in sub_dirs.items()}
+            total_size = sum(sizes.values())
+            if total_size <= quota:
+                return evicted
+
+            # access-markers and leases per sub-dir
+            last_access = {
+                name: os.stat(path).st_mtime for name, path in sub_dirs.items()
+            }
+            meta_files: Dict[str, List[str]] = {}
+            leases: Dict[str, List[str]] = {}
+            for meta_file in os.listdir(meta_dir):
+                if meta_file.endswith(".access"):
+                    name = meta_file[: -len(".access")]
+                    if name in last_access:
+                        marker = os.path.join(meta_dir, meta_file)
+                        last_access[name] = os.stat(marker).st_mtime
+                elif (idx := meta_file.find(".lease-")) >= 0:
+                    name = meta_file[:idx]
+                    leases.setdefault(name, []).append(meta_file[idx + 7 :])
+                else:
+                    continue
+                meta_files.setdefault(name, []).append(meta_file)
+
+            def is_protected(name: str) -> bool:
+                if sub_dirs[name] in cls._pinned_dirs:
+                    return True
+                if time.time() - last_access[name] < cls.eviction_grace_period_sec:
+                    return True
+                return any(_is_lease_alive(lease) for lease in leases.get(name, []))
+
+            candidates = sorted(
+                (name for name in sub_dirs if not is_protected(name)),
+                key=lambda name: last_access[name],
+            )
+            for name in candidates:
+                if total_size <= quota:
+                    break
+                # rename first, so that no one finds a partially removed dir
+                trash = os.path.join(meta_dir, f"evicting-{_get_rnd_str(k=10)}")
+                os.rename(sub_dirs[name], trash)
+                shutil.rmtree(trash)
+                for meta_file in meta_files.get(name, []):
+                    try:
+                        os.remove(os.path.join(meta_dir, meta_file))
+                    except FileNotFoundError:
+                        pass
+                total_size -= sizes[name]
+                evicted.append(sub_dirs[name])
+        if len(evicted) > 0:
+            print(f"Evicted {len(evicted)} dirs from {term_dir} to meet its quota.")
+        return evicted
+
     def clean_instance(self) -> None:
         """Cleans instance-bound tmp-dirs of `self.tmps` from disk."""
         tmps = copy(self.tmps)
@@ -343,6 +654,8 @@ class FileHandler:
             if os.path.exists(tmp):
                 shutil.rmtree(tmp)
             self.tmps.remove(tmp)
+            if (finalizer := self._unpin_finalizers.pop(tmp, None)) is not None:
+                finalizer()
 
     @classmethod
     def clean(
@@ -436,3 +749,56 @@ def assert_valid_ending(
         raise AssertionError(
             f"Invalid file-ending, file {fname} must have {ending} extension!"
         )
+
+
+@lru_cache(maxsize=128)
+def _get_file_checksum_cached(
+    file_path: str,
+    size: int,
+    mtime_ns: int,
+) -> str:
+    hash_ = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            hash_.update(block)
+    return hash_.hexdigest()
+
+
+def get_file_checksum(path: FilePathType) -> str:
+    """Computes the sha256-checksum of the content of a file.
+
+    The checksum is memoized per process as long as size and modification time
+    of the file don't change, so repeated calls are cheap.
+
+    Args:
+        path: File-path.
+
+    Returns:
+        Hex-digest of the checksum.
+    """
+    file_path = os.path.abspath(str(path))
+    stat = os.stat(file_path)
+    return _get_file_checksum_cached(file_path, stat.st_size, stat.st_mtime_ns)
+
+
+def get_dir_checksum(path: DirPathType) -> str:
+    """Computes the sha256-checksum of the content of a directory-tree.
+
+    The checksum covers the relative path and the content of each file, but not the
+    location of the directory itself.
+
+    Args:
+        path: Directory-path.
+
+    Returns:
+        Hex-digest of the checksum.
+    """
+    dir_path = os.path.abspath(str(path))
+    hash_ = hashlib.sha256()
+    for root, dirs, files in os.walk(dir_path):
+        dirs.sort()
+        for file in sorted(files):
+            file_path = os.path.join(root, file)
+            rel_path = os.path.relpath(file_path, dir_path)
+            hash_.update(f"{rel_path}\0{get_file_checksum(file_path)}\0".encode())
+    return hash_.hexdigest()
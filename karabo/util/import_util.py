@@ -0,0 +1,41 @@
+"""Util-functions to defer the import of heavy dependencies.
+
+Importing backends like OSKAR, RASCIL or dask.distributed takes seconds. Karabo
+therefore imports them only once the code-path which needs them runs.
+"""
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Any
+
+
+class _LazyModule(ModuleType):
+    """Stand-in for a module which gets imported on its first attribute-access.
+
+    It's deliberately not registered in `sys.modules`, because tools iterating over
+    all loaded modules (e.g. `inspect.getmodule`) would trigger the import.
+    """
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self.__name__)
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Imports a module lazily.
+
+    The actual import happens on the first attribute-access of the returned module.
+    Whether the module is installed is checked right away.
+
+    Args:
+        name: Absolute module-name, e.g. "oskar".
+
+    Returns:
+        Lazy module.
+
+    Raises:
+        ModuleNotFoundError: If `name` can't be found.
+    """
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    return _LazyModule(name)
@@ -1,4 +1,3 @@
-import math
 from math import ceil, cos, floor, pi, sin, sqrt
 from typing import List, Literal, Tuple, Union, cast
 
@@ -96,14 +95,27 @@ def get_poisson_disk_sky(
 
 
 #
-def long_lat_to_cartesian(lat: NPFloatLike, lon: NPFloatLike) -> NDArray[np.float_]:
+def long_lat_to_cartesian(
+    lat: Union[NPFloatLike, NDArray[np.float_]],
+    lon: Union[NPFloatLike, NDArray[np.float_]],
+) -> NDArray[np.float_]:
+    """Converts latitudes & longitudes [deg] into cartesian unit-vectors.
+
+    Works element-wise on arrays of any shape.
+
+    Args:
+        lat: Latitude(s) [deg].
+        lon: Longitude(s) [deg].
+
+    Returns:
+        Unit-vectors with the x, y, z coordinates along the last axis. Shape is (3,)
+        for scalar inputs and (..., 3) for array inputs.
+    """
     lat_, lon_ = np.deg2rad(lat), np.deg2rad(lon)
-    x = R * cos(lat_) * cos(lon_)
-    y = R * cos(lat_) * sin(lon_)
-    z = R * sin(lat_)
-    out = cast(
-        NDArray[np.float_], np.array([x, y, z]) / np.linalg.norm(np.array([x, y, z]))
-    )
+    cos_lat = np.cos(lat_)
+    xyz = np.stack((cos_lat * np.cos(lon_), cos_lat * np.sin(lon_), np.sin(lat_)), -1)
+    norm = np.linalg.norm(xyz, axis=-1, keepdims=True)
+    out = cast(NDArray[np.float_], xyz / np.where(norm == 0, 1, norm))
     return out
 
 
@@ -119,12 +131,16 @@ R = 6360000  # earth radius
 
 
 def cartesian_to_ll(
-    x: FloatLike,
-    y: FloatLike,
+    x: Union[FloatLike, NDArray[np.float_]],
+    y: Union[FloatLike, NDArray[np.float_]],
     z: int = 0,
-) -> Tuple[float, float]:
+) -> Tuple[Union[float, NDArray[np.float_]], Union[float, NDArray[np.float_]]]:
+    """Converts cartesian earth-coordinates [m] into latitudes & longitudes [deg].
+
+    Works element-wise on arrays of any shape.
+    """
     # does not use `z`
-    r = math.sqrt(x**2 + y**2)
-    long = 180 * math.atan2(y, x) / math.pi
-    lat = 180 * math.acos(r / R) / math.pi
+    r = np.hypot(x, y)
+    long = np.degrees(np.arctan2(y, x))
+    lat = np.degrees(np.arccos(r / R))
     return lat, long
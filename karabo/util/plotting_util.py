@@ -1,6 +1,9 @@
-from typing import List
+from __future__ import annotations
 
-from astropy.wcs import WCS
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from astropy.wcs import WCS
 
 
 def get_slices(wcs: WCS) -> List[str]: